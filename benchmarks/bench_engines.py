@@ -0,0 +1,127 @@
+"""
+Benchmark: threaded vs async fetch engines against a local stub HTTP server.
+
+The stub serves a small listing page after a fixed artificial latency, so
+the numbers reflect how many requests each engine keeps in flight rather
+than parse cost. Politeness delays are off unless --delay is given; sources
+are spread over several stub servers, each on its own port and therefore
+its own domain.
+
+Usage:
+    python benchmarks/bench_engines.py --sources 500 --domains 100 --latency 0.05
+"""
+
+import argparse
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from loguru import logger
+
+from src.core.scraper import CompetitorScraper
+
+LISTING_PAGE = (
+    "<html><body>"
+    + "".join(
+        f'<article><h2>Post {i}</h2><time datetime="2024-01-0{i % 9 + 1}">Jan</time>'
+        f'<p>Body text for post {i} about large language models.</p><a href="/post/{i}">more</a></article>'
+        for i in range(10)
+    )
+    + "</body></html>"
+).encode()
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 4096
+
+
+def make_handler(latency: float):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            time.sleep(latency)
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(LISTING_PAGE)))
+            self.end_headers()
+            self.wfile.write(LISTING_PAGE)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def build_config(base_urls: list, n_sources: int, engine: str, workers: int, concurrency: int, delay: float) -> dict:
+    return {
+        "scraping": {
+            "engine": engine,
+            "min_delay": delay,
+            "max_delay": delay,
+            "max_workers": workers,
+            "max_concurrency": concurrency,
+            "user_agents": ["bench-agent"],
+        },
+        "storage": {"http_cache": False, "snapshots": False},
+        "sources": {
+            "tier1": [
+                {
+                    "name": f"source-{i}",
+                    "url": f"{base_urls[i % len(base_urls)]}/blog/{i}",
+                    "selectors": {"article": "article", "title": "h2", "date": "time", "content": "p"},
+                }
+                for i in range(n_sources)
+            ]
+        },
+    }
+
+
+def run_engine(base_urls: list, args, engine: str) -> float:
+    config = build_config(base_urls, args.sources, engine, args.workers, args.concurrency, args.delay)
+    scraper = CompetitorScraper(config)
+    start = time.perf_counter()
+    results = scraper.scrape_all()
+    elapsed = time.perf_counter() - start
+    scraper.cleanup()
+
+    ok = sum(1 for r in results if r["status"] == "success")
+    rate = len(results) / elapsed
+    print(f"{engine:>9}: {len(results)} sources ({ok} ok) in {elapsed:6.2f}s -> {rate:8.1f} sources/s")
+    return rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare threaded and async fetch engines")
+    parser.add_argument("--sources", type=int, default=500)
+    parser.add_argument("--domains", type=int, default=100, help="Number of stub servers (distinct domains)")
+    parser.add_argument("--latency", type=float, default=0.05, help="Stub server response delay (s)")
+    parser.add_argument("--delay", type=float, default=0.0, help="Per-domain politeness delay (s)")
+    parser.add_argument("--workers", type=int, default=5, help="Threaded engine max_workers")
+    parser.add_argument("--concurrency", type=int, default=500, help="Async engine max_concurrency")
+    args = parser.parse_args()
+
+    logger.remove()
+
+    servers = [StubServer(("127.0.0.1", 0), make_handler(args.latency)) for _ in range(args.domains)]
+    for server in servers:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_urls = [f"http://127.0.0.1:{server.server_address[1]}" for server in servers]
+
+    try:
+        threaded = run_engine(base_urls, args, "threaded")
+        asynchronous = run_engine(base_urls, args, "async")
+        print(f"speedup: {asynchronous / threaded:.1f}x")
+    finally:
+        for server in servers:
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark: feed parsing throughput of the process pool by worker count.
+
+Builds a synthetic catalogue of feeds (RSS 2.0 and Atom, entries with
+HTML bodies) and parses it in-process with feedparser (what the fetch
+threads do without scraping.parse_pool) and then through ParsePool with
+1, 2, 4, ... workers up to the number of cores. Pool start-up is excluded:
+each pool is warmed with one feed per worker before timing.
+
+Usage:
+    python benchmarks/bench_feed_pool.py --feeds 1000 --entries 20
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from loguru import logger
+
+from src.core.parse_pool import ParsePool, parse_feed
+
+
+def build_feed(i: int, n_entries: int) -> bytes:
+    body = "&lt;p&gt;Paragraph on models &amp;amp; evals.&lt;/p&gt;" * 5
+    if i % 2:
+        entries = "".join(
+            f"<entry><title>Feed {i} post {j}</title><link href='/posts/{i}/{j}'/>"
+            f"<updated>2024-05-{j % 28 + 1:02d}T10:00:00Z</updated><summary type='html'>{body}</summary></entry>"
+            for j in range(n_entries)
+        )
+        return f"<feed xmlns='http://www.w3.org/2005/Atom'><title>Feed {i}</title>{entries}</feed>".encode()
+    items = "".join(
+        f"<item><title>Feed {i} post {j}</title><link>/posts/{i}/{j}</link>"
+        f"<pubDate>Mon, {j % 28 + 1:02d} May 2024 10:00:00 GMT</pubDate><description>{body}</description></item>"
+        for j in range(n_entries)
+    )
+    return f"<rss version='2.0'><channel><title>Feed {i}</title>{items}</channel></rss>".encode()
+
+
+def worker_counts(max_workers: int) -> list:
+    counts = [1]
+    while counts[-1] * 2 <= max_workers:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != max_workers:
+        counts.append(max_workers)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure feed parse throughput by parse pool size")
+    parser.add_argument("--feeds", type=int, default=1000)
+    parser.add_argument("--entries", type=int, default=20, help="Entries per feed")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    logger.remove()
+
+    feeds = [(build_feed(i, args.entries), f"https://site{i}.example/feed.xml") for i in range(args.feeds)]
+    print(f"{args.feeds} feeds x {args.entries} entries, {os.cpu_count()} cores")
+
+    start = time.perf_counter()
+    for content, url in feeds:
+        parse_feed(content, url)
+    baseline = args.feeds / (time.perf_counter() - start)
+    print(f"{'in-process':>12}: {baseline:8.1f} feeds/s")
+
+    for workers in worker_counts(args.max_workers):
+        pool = ParsePool(workers=workers)
+        try:
+            for future in [pool.submit_feed(content, url) for content, url in feeds[:workers]]:
+                future.result()
+
+            start = time.perf_counter()
+            for future in [pool.submit_feed(content, url) for content, url in feeds]:
+                future.result()
+            rate = args.feeds / (time.perf_counter() - start)
+        finally:
+            pool.shutdown()
+        print(f"{workers:>4} workers: {rate:8.1f} feeds/s  ({rate / baseline:.2f}x in-process)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark: feed-entry HTML to text, regex strip vs streaming converter.
+
+Builds a content:encoded-style body with inline scripts, styles and
+entities, then times the old `re.sub(r"<[^>]+>", "", ...)` strip against
+html_to_text, uncapped and capped at max_content_length. The regex is a
+single C pass but leaves entities and script text in place; on text with
+unmatched `<` (comparisons, code) it goes quadratic, which the second
+body shows.
+
+Usage:
+    python benchmarks/bench_html_text.py --paragraphs 5000 --repeat 20
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.text import html_to_text
+
+TAG_RE = re.compile(r"<[^>]+>")
+
+
+def build_body(paragraphs: int) -> str:
+    parts = []
+    for i in range(paragraphs):
+        parts.append(f"<p>Paragraph {i} on R&amp;D &mdash; <a href='/x/{i}'>models</a> &amp; <em>evals</em>.</p>")
+        if i % 50 == 0:
+            parts.append(f"<script>window.track({i}, '<p>ignored</p>');</script><style>.p{i} {{ color: red }}</style>")
+    return "".join(parts)
+
+
+def timed(func, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare feed-entry HTML-to-text conversions")
+    parser.add_argument("--paragraphs", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--max-length", type=int, default=50000)
+    parser.add_argument("--unbalanced-kb", type=int, default=100)
+    args = parser.parse_args()
+
+    body = build_body(args.paragraphs)
+    regex_text = TAG_RE.sub("", body).strip()
+    text = html_to_text(body)
+    print(f"regex leaves {regex_text.count('&amp;')} undecoded entities and {regex_text.count('track(')} script bodies")
+    assert "&amp;" not in text and "track(" not in text
+
+    unbalanced = "if x<y then a<b; " * (args.unbalanced_kb * 1024 // 17)
+    for label, markup, repeat in [("markup", body, args.repeat), ("unmatched '<'", unbalanced, 1)]:
+        print(f"{label} ({len(markup) / 1024:.1f} KB):")
+        runs = {
+            "regex strip": lambda: TAG_RE.sub("", markup).strip(),
+            "html_to_text": lambda: html_to_text(markup),
+            f"capped {args.max_length}": lambda: html_to_text(markup, args.max_length),
+        }
+        for name, func in runs.items():
+            print(f"{name:>18}: {timed(func, repeat) * 1000:8.2f} ms/entry")
+
+
+if __name__ == "__main__":
+    main()
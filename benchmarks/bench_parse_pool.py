@@ -0,0 +1,84 @@
+"""
+Benchmark: parse throughput of the process pool by worker count.
+
+Parses the same set of synthetic listing pages in-process (the old
+behaviour: every parse shares one GIL) and then through ParsePool with
+1, 2, 4, ... workers up to the number of cores. Pool start-up is excluded:
+each pool is warmed with one page per worker before timing.
+
+Usage:
+    python benchmarks/bench_parse_pool.py --pages 200 --articles 100 --engine lxml
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from loguru import logger
+
+from src.core.parse_pool import ParsePool, parse_page
+
+SELECTORS = {"article": "article", "title": "h2", "date": "time", "content": "p"}
+
+
+def build_page(i: int, n_articles: int) -> bytes:
+    articles = "".join(
+        f'<article><h2>Page {i} post {j}</h2><time datetime="2024-01-0{j % 9 + 1}">Jan</time>'
+        f"<p>First paragraph of post {j}.</p><p>Second paragraph.</p><a href=\"/post/{i}/{j}\">more</a></article>"
+        for j in range(n_articles)
+    )
+    return f"<html><body><nav>menu</nav><main>{articles}</main></body></html>".encode()
+
+
+def worker_counts(max_workers: int) -> list:
+    counts = [1]
+    while counts[-1] * 2 <= max_workers:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != max_workers:
+        counts.append(max_workers)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure parse throughput by parse pool size")
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--articles", type=int, default=100, help="Articles per page")
+    parser.add_argument("--engine", choices=["soup", "lxml"], default="lxml")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    logger.remove()
+
+    source = {"name": "bench", "selectors": SELECTORS}
+    pages = [build_page(i, args.articles) for i in range(args.pages)]
+    url = "https://example.com/blog"
+    print(f"{args.pages} pages x {args.articles} articles, engine={args.engine}, {os.cpu_count()} cores")
+
+    start = time.perf_counter()
+    for page in pages:
+        parse_page(source, page, url, args.engine)
+    baseline = args.pages / (time.perf_counter() - start)
+    print(f"{'in-process':>12}: {baseline:8.1f} pages/s")
+
+    for workers in worker_counts(args.max_workers):
+        pool = ParsePool(workers=workers, default_engine=args.engine)
+        try:
+            for future in [pool.submit(source, page, url) for page in pages[:workers]]:
+                future.result()
+
+            start = time.perf_counter()
+            for future in [pool.submit(source, page, url) for page in pages]:
+                future.result()
+            rate = args.pages / (time.perf_counter() - start)
+        finally:
+            pool.shutdown()
+        print(f"{workers:>4} workers: {rate:8.1f} pages/s  ({rate / baseline:.2f}x in-process)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark: BeautifulSoup vs lxml extraction engines.
+
+Times HTMLParser.parse end to end (tree build plus extraction) for each
+engine. The pages are the saved parity fixtures plus a synthetic listing
+with --articles entries. Each engine's output is checked against the
+other before timing.
+
+Usage:
+    python benchmarks/bench_parsers.py --articles 300 --repeat 20
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from loguru import logger
+
+from src.core.scraper import PARSER_ENGINES, HTMLParser
+
+PAGES_DIR = Path(__file__).parent.parent / "tests" / "fixtures" / "pages"
+SELECTORS = {
+    "article": "article, .news-item, .blog-post",
+    "title": "h1, h2",
+    "date": "time, .date, .entry-date",
+    "content": ".content, .entry-content, article p",
+}
+URL = "https://example.com/blog/"
+
+
+def build_listing(n_articles: int) -> bytes:
+    articles = "".join(
+        f'<article class="post"><header><h2 class="post-title">Post {i}</h2>'
+        f'<time datetime="2024-01-0{i % 9 + 1}">Jan</time></header>'
+        f'<div class="content"><p>First paragraph of post {i}.</p><p>Second paragraph.</p>'
+        f'<p>Third paragraph.</p></div><a href="/post/{i}">more</a></article>'
+        for i in range(n_articles)
+    )
+    return f"<html><body><nav>menu</nav><main>{articles}</main><footer>footer</footer></body></html>".encode()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare BeautifulSoup and lxml extraction throughput")
+    parser.add_argument("--articles", type=int, default=300, help="Articles in the synthetic listing")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    logger.remove()
+
+    pages = {path.stem: path.read_bytes() for path in sorted(PAGES_DIR.glob("*.html"))}
+    pages[f"listing_{args.articles}"] = build_listing(args.articles)
+    parsers = {engine: HTMLParser(SELECTORS, engine=engine) for engine in PARSER_ENGINES}
+
+    print(f"{'page':>20} {'KB':>7} " + " ".join(f"{engine + ' pages/s':>14}" for engine in PARSER_ENGINES))
+    for name, body in pages.items():
+        outputs = [parsers[engine].parse(body, URL) for engine in PARSER_ENGINES]
+        assert all(output == outputs[0] for output in outputs), f"engines disagree on {name}"
+
+        rates = []
+        for engine in PARSER_ENGINES:
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                parsers[engine].parse(body, URL)
+            rates.append(args.repeat / (time.perf_counter() - start))
+
+        speedup = rates[1] / rates[0]
+        print(f"{name:>20} {len(body) / 1024:7.1f} " + " ".join(f"{rate:14.1f}" for rate in rates) + f"  ({speedup:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmark: full vs region-scoped parsing of a heavy listing page.
+
+The page is mostly navigation, a large footer and an inline JSON state
+blob around a modest article listing, the shape of most competitor blogs.
+Each (engine, mode) pair runs in its own subprocess so peak RSS growth
+(ru_maxrss after the parses minus ru_maxrss after imports) is not
+polluted by the other runs.
+
+Usage:
+    python benchmarks/bench_scoped.py --articles 50 --state-mb 2 --repeat 10
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from loguru import logger
+
+SELECTORS = {"article": "article.post", "title": "h2", "date": "time", "content": "p"}
+
+
+def build_page(n_articles: int, state_mb: float) -> bytes:
+    nav = "".join(
+        f'<li><a href="/section/{i}">Section {i}</a><ul>'
+        + "".join(f'<li><a href="/section/{i}/{j}">Item {j}</a></li>' for j in range(20))
+        + "</ul></li>"
+        for i in range(60)
+    )
+    listing = "".join(
+        f'<article class="post"><h2>Post {i}</h2><time datetime="2024-01-0{i % 9 + 1}">Jan</time>'
+        f'<p>Body text for post {i}.</p><a href="/post/{i}">more</a></article>'
+        for i in range(n_articles)
+    )
+    footer = "".join(f'<div class="footer-link"><span>{i}</span><a href="/f/{i}">Link</a></div>' for i in range(800))
+    state = json.dumps({"items": [{"id": i, "body": "x" * 200} for i in range(int(state_mb * 1024 * 1024 / 220))]})
+    return (
+        f"<html><head><script>window.__STATE__ = {state}</script></head><body>"
+        f"<nav><ul>{nav}</ul></nav><main>{listing}</main><footer>{footer}</footer></body></html>"
+    ).encode()
+
+
+def run_child(engine: str, scoped: bool, path: str, repeat: int):
+    """Parse the page `repeat` times in this process and print the measurements as JSON."""
+    from src.core.scraper import HTMLParser
+
+    body = Path(path).read_bytes()
+    parser = HTMLParser(SELECTORS, engine=engine, scoped=scoped)
+
+    baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    for _ in range(repeat):
+        articles = parser.parse(body, "https://example.com/blog")
+    elapsed = (time.perf_counter() - start) / repeat
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    print(json.dumps({"seconds": elapsed, "peak_mb": (peak_kb - baseline_kb) / 1024, "articles": len(articles)}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare full and region-scoped parsing of a heavy page")
+    parser.add_argument("--articles", type=int, default=50)
+    parser.add_argument("--state-mb", type=float, default=2, help="Size of the inline JSON state blob (MB)")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--child", nargs=3, metavar=("ENGINE", "MODE", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    logger.remove()
+
+    if args.child:
+        engine, mode, path = args.child
+        run_child(engine, mode == "scoped", path, args.repeat)
+        return
+
+    page = build_page(args.articles, args.state_mb)
+    with tempfile.NamedTemporaryFile(suffix=".html", delete=False) as f:
+        f.write(page)
+    page_path = Path(f.name)
+    print(f"page size: {len(page) / 1024 / 1024:.1f} MB, {args.articles} articles")
+
+    try:
+        for engine in ("soup", "lxml"):
+            for mode in ("full", "scoped"):
+                output = subprocess.run(
+                    [sys.executable, __file__, "--child", engine, mode, str(page_path), "--repeat", str(args.repeat)],
+                    capture_output=True, text=True, check=True,
+                ).stdout
+                result = json.loads(output)
+                print(
+                    f"{engine:>5} {mode:>6}: {result['seconds'] * 1000:8.1f} ms/page, "
+                    f"peak RSS +{result['peak_mb']:6.1f} MB, {result['articles']} articles"
+                )
+    finally:
+        page_path.unlink(missing_ok=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmark: per-article extraction cost with and without precompiled selector plans.
+
+Parses a synthetic listing with a few hundred articles once, then times only
+the per-article extraction loop. "strings" reproduces the former HTMLParser
+behaviour of handing CSS strings to BeautifulSoup's select/select_one for
+every article; "plan" uses HTMLParser with its shared SelectorPlan.
+
+Usage:
+    python benchmarks/bench_selectors.py --articles 300 --repeat 20
+"""
+
+import argparse
+import hashlib
+import sys
+import time
+from pathlib import Path
+from urllib.parse import urljoin
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bs4 import BeautifulSoup
+from loguru import logger
+
+from src.core.scraper import HTMLParser
+
+SELECTORS = {
+    "article": "article.post, div.news-item",
+    "title": "h2.post-title, h1",
+    "date": "time, .post-date",
+    "content": ".post-content p, .summary",
+}
+URL = "https://example.com/blog"
+
+
+def build_page(n_articles: int) -> str:
+    articles = "".join(
+        f'<article class="post"><header><h2 class="post-title">Post {i}</h2>'
+        f'<time datetime="2024-01-0{i % 9 + 1}">Jan</time></header>'
+        f'<div class="post-content"><p>First paragraph of post {i}.</p><p>Second paragraph.</p>'
+        f'<p>Third paragraph.</p><p>Fourth paragraph.</p></div><a href="/post/{i}">more</a></article>'
+        for i in range(n_articles)
+    )
+    return f"<html><body><main>{articles}</main></body></html>"
+
+
+def extract_with_strings(element, selectors: dict, source_url: str) -> dict:
+    """The per-article extraction HTMLParser performed before selector plans."""
+    title_elem = element.select_one(selectors.get("title", "h1, h2"))
+    title = title_elem.get_text(strip=True) if title_elem else None
+    if not title:
+        return None
+
+    date_elem = element.select_one(selectors.get("date", "time"))
+    date = date_elem.get("datetime") or date_elem.get_text(strip=True) if date_elem else None
+
+    content_elems = element.select(selectors.get("content", "p"))
+    content = " ".join([p.get_text(strip=True) for p in content_elems[:3]])
+
+    link_elem = element.find("a", href=True)
+    link = link_elem["href"] if link_elem else source_url
+    if link.startswith("/"):
+        link = urljoin(source_url, link)
+
+    content_hash = hashlib.sha256(f"{title}{content}".encode()).hexdigest()
+    return {
+        "title": title,
+        "date": date,
+        "content": content,
+        "link": link,
+        "source_url": source_url,
+        "content_hash": content_hash,
+    }
+
+
+def time_extraction(extract, elements: list, repeat: int) -> tuple:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        results = [extract(element) for element in elements]
+    elapsed = time.perf_counter() - start
+    return elapsed / (repeat * len(elements)), results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare per-article extraction with and without selector plans")
+    parser.add_argument("--articles", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    logger.remove()
+
+    soup = BeautifulSoup(build_page(args.articles), "lxml")
+    elements = soup.select(SELECTORS["article"])
+    html_parser = HTMLParser(SELECTORS)
+
+    before, expected = time_extraction(lambda el: extract_with_strings(el, SELECTORS, URL), elements, args.repeat)
+    after, actual = time_extraction(lambda el: html_parser._extract_article_data(el, URL), elements, args.repeat)
+    assert actual == expected, "plan extraction differs from string selectors"
+
+    print(f"{len(elements)} articles, {args.repeat} repeats")
+    print(f"  strings: {before * 1e6:8.1f} us/article")
+    print(f"     plan: {after * 1e6:8.1f} us/article  ({before / after:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
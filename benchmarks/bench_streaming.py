@@ -0,0 +1,125 @@
+"""
+Benchmark: buffered vs streaming fetch+parse of a large SPA-style page.
+
+The stub serves a listing followed by a multi-megabyte inline state
+blob, the shape of a server-rendered single-page app. Each mode runs in
+its own subprocess so peak RSS growth (ru_maxrss after the run minus
+ru_maxrss after imports) is not polluted by the other mode.
+
+Usage:
+    python benchmarks/bench_streaming.py --size-mb 20 --max-bytes 5242880
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from loguru import logger
+
+SELECTORS = {"article": "article", "title": "h2", "date": "time", "content": "p"}
+
+
+def build_page(size_mb: float) -> bytes:
+    listing = "".join(
+        f'<article><h2>Post {i}</h2><time datetime="2024-01-0{i % 9 + 1}">Jan</time>'
+        f'<p>Body text for post {i}.</p><a href="/post/{i}">more</a></article>'
+        for i in range(20)
+    )
+    state = json.dumps({"items": ["x" * 1000] * int(size_mb * 1024)})
+    return f"<html><body>{listing}<script>window.__STATE__ = {state}</script></body></html>".encode()
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # Streaming clients hang up once they reach the byte cap
+        pass
+
+
+def make_handler(page: bytes):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(page)))
+            self.end_headers()
+            self.wfile.write(page)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def run_child(mode: str, url: str, max_bytes: int, repeat: int):
+    """Fetch and parse `repeat` times in this process and print the measurements as JSON."""
+    from src.core.scraper import ContentFetcher, HTMLParser, RateLimiter, SessionManager
+
+    fetcher = ContentFetcher(
+        SessionManager(["bench-agent"]),
+        RateLimiter(min_delay=0, max_delay=0),
+        stream=mode == "streaming",
+        max_response_bytes=max_bytes,
+    )
+    parser = HTMLParser(SELECTORS)
+
+    baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    for _ in range(repeat):
+        articles = parser.parse(fetcher.fetch(url), url)
+    elapsed = (time.perf_counter() - start) / repeat
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    print(json.dumps({"seconds": elapsed, "peak_mb": (peak_kb - baseline_kb) / 1024, "articles": len(articles)}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare buffered and streaming fetches of a large page")
+    parser.add_argument("--size-mb", type=float, default=20, help="Size of the inline state blob (MB)")
+    parser.add_argument("--max-bytes", type=int, default=5 * 1024 * 1024, help="Streaming byte cap")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "URL"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    logger.remove()
+
+    if args.child:
+        run_child(args.child[0], args.child[1], args.max_bytes, args.repeat)
+        return
+
+    page = build_page(args.size_mb)
+    server = StubServer(("127.0.0.1", 0), make_handler(page))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/app"
+    print(f"page size: {len(page) / 1024 / 1024:.1f} MB, streaming cap: {args.max_bytes / 1024 / 1024:.1f} MB")
+
+    try:
+        for mode in ("buffered", "streaming"):
+            output = subprocess.run(
+                [sys.executable, __file__, "--child", mode, url, "--max-bytes", str(args.max_bytes),
+                 "--repeat", str(args.repeat)],
+                capture_output=True, text=True, check=True,
+            ).stdout
+            result = json.loads(output)
+            print(
+                f"{mode:>9}: {result['seconds'] * 1000:8.1f} ms/page, "
+                f"peak RSS +{result['peak_mb']:7.1f} MB, {result['articles']} articles"
+            )
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmark: selector extraction vs the embedded-JSON fast path.
+
+Builds a Next.js-style listing where every post is both rendered as markup
+and shipped in the __NEXT_DATA__ payload, then times HTMLParser.parse with
+selectors (soup and lxml engines) and with a structured mapping. Titles
+and links are checked to agree before timing.
+
+Usage:
+    python benchmarks/bench_structured.py --articles 300 --repeat 20
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from loguru import logger
+
+from src.core.scraper import HTMLParser
+
+SELECTORS = {"article": "article.post", "title": "h2", "date": "time", "content": "p"}
+STRUCTURED = {
+    "type": "next_data",
+    "items": "props.pageProps.posts",
+    "fields": {"title": "title", "date": "date", "content": "excerpt", "link": "path"},
+}
+URL = "https://example.com/blog"
+
+
+def build_page(n_articles: int) -> bytes:
+    posts = [
+        {"title": f"Post {i}", "date": f"2024-01-0{i % 9 + 1}", "excerpt": f"Excerpt of post {i}.", "path": f"/post/{i}"}
+        for i in range(n_articles)
+    ]
+    markup = "".join(
+        f'<article class="post"><div class="card"><h2>{p["title"]}</h2><time datetime="{p["date"]}">Jan</time>'
+        f'<p>{p["excerpt"]}</p><a href="{p["path"]}">more</a></div></article>'
+        for p in posts
+    )
+    nav = "".join(f'<li><a href="/section/{i}">Section {i}</a></li>' for i in range(300))
+    payload = json.dumps({"props": {"pageProps": {"posts": posts}}, "page": "/blog"})
+    return (
+        f"<html><head><title>Blog</title></head><body><nav><ul>{nav}</ul></nav><main>{markup}</main>"
+        f'<script id="__NEXT_DATA__" type="application/json">{payload}</script></body></html>'
+    ).encode()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare selector and embedded-JSON extraction")
+    parser.add_argument("--articles", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    logger.remove()
+
+    body = build_page(args.articles)
+    parsers = {
+        "soup selectors": HTMLParser(SELECTORS, engine="soup"),
+        "lxml selectors": HTMLParser(SELECTORS, engine="lxml"),
+        "structured": HTMLParser(SELECTORS, structured=STRUCTURED),
+    }
+
+    outputs = {name: p.parse(body, URL) for name, p in parsers.items()}
+    summaries = {name: [(a["title"], a["link"]) for a in output] for name, output in outputs.items()}
+    assert len({tuple(s) for s in summaries.values()}) == 1, "extraction paths disagree"
+
+    print(f"page size: {len(body) / 1024:.1f} KB, {args.articles} articles")
+    for name, p in parsers.items():
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            p.parse(body, URL)
+        elapsed = (time.perf_counter() - start) / args.repeat
+        print(f"{name:>15}: {elapsed * 1000:8.2f} ms/page")
+
+
+if __name__ == "__main__":
+    main()
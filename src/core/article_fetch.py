@@ -0,0 +1,168 @@
+"""
+Full-article fetch stage.
+
+Listing cards only carry the first few paragraphs of a post, which is often
+too little for validation and summarising. With scraping.full_articles on,
+each article's own page is fetched (at most max_per_source at a time per
+source, through the same rate limiter as listing pages) and its body
+replaces the listing excerpt. Bodies are cached on disk by canonical URL
+and body selector, so a post is downloaded once over its lifetime rather
+than once per run, and changing the selector extracts it again. Pages that
+yield no body are not cached, so they are tried again on the next run.
+Article pages are not snapshotted or given HTTP validators: they are only
+ever read through this cache.
+"""
+
+import hashlib
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Union
+
+from bs4 import BeautifulSoup
+from loguru import logger
+from lxml import etree
+
+from src.core.history import article_link
+from src.core.scraper import HTMLParser
+from src.core.selectors import compile_plan
+from src.utils.json_store import load_json, save_json
+
+# Paragraphs taken from an article page unless the source or config names others
+DEFAULT_BODY_SELECTOR = "article p, main p"
+
+
+def extract_body(content: Union[str, bytes, etree._Element], selector: str = DEFAULT_BODY_SELECTOR) -> str:
+    """Join the text of every element matching selector in an article page."""
+    plan = compile_plan({"content": selector})
+    if isinstance(content, etree._Element):
+        root = content
+    elif plan.xpath is not None:
+        root = HTMLParser._build_tree(content)
+    else:
+        root = None
+
+    if plan.xpath is None:
+        # Selector outside cssselect's dialect: match with soupsieve instead
+        soup = BeautifulSoup(etree.tostring(root) if root is not None else content, "lxml")
+        texts = [element.get_text(strip=True) for element in plan.select("content", soup)]
+    elif root is None:
+        texts = []
+    else:
+        texts = [HTMLParser._tree_text(element) for element in plan.select_tree("content", root)]
+    return "\n\n".join(text for text in texts if text)
+
+
+class ArticleBodyCache:
+    """Article bodies on disk under cache_dir/articles, keyed by canonical URL and body selector."""
+
+    def __init__(self, cache_dir: str = "data/processed"):
+        self.cache_dir = Path(cache_dir) / "articles"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, url: str, selector: str) -> Path:
+        key = hashlib.sha256(f"{selector}\n{url}".encode()).hexdigest()
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, url: str, selector: str) -> Optional[str]:
+        """Return the body cached for a canonical URL and selector, or None."""
+        path = self._path(url, selector)
+        entry = load_json(path, f"article body for {url}")
+        if not isinstance(entry, dict) or not entry.get("content"):
+            path.unlink(missing_ok=True)
+            return None
+        return entry["content"]
+
+    def put(self, url: str, selector: str, content: str):
+        """Store the body a selector extracted from a canonical URL's page."""
+        save_json(
+            self._path(url, selector),
+            {"url": url, "selector": selector, "fetched_at": time.time(), "content": content},
+        )
+
+
+class FullArticleFetcher:
+    """Replaces listing excerpts with article bodies; engines fetch what `plan` returns, max_per_source at a time."""
+
+    def __init__(
+        self,
+        cache: ArticleBodyCache,
+        max_per_source: int = 4,
+        selector: str = DEFAULT_BODY_SELECTOR,
+    ):
+        self.cache = cache
+        # Both engines need at least one fetch slot per source
+        self.max_per_source = max(1, max_per_source)
+        self.selector = selector
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Start a fresh set of per-run counters."""
+        self.stats = {"fetched": 0, "cached": 0, "empty": 0, "failed": 0}
+
+    @staticmethod
+    def enabled(source: Dict[str, Any]) -> bool:
+        """Whether a source takes part in the stage (on unless it sets full_article: false)."""
+        return source.get("full_article", True) is not False
+
+    def selector_for(self, source: Dict[str, Any]) -> str:
+        """Body selector for a source's article pages."""
+        config = source.get("full_article")
+        return config.get("content", self.selector) if isinstance(config, dict) else self.selector
+
+    def plan(self, articles: List[Dict[str, Any]], selector: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Fill articles whose body is cached and return the rest grouped by canonical URL to fetch."""
+        pending: Dict[str, List[Dict[str, Any]]] = {}
+        for article in articles:
+            url = article_link(article)
+            if not url:
+                continue
+            body = self.cache.get(url, selector)
+            if body is not None:
+                self._apply(article, body)
+                self._count("cached")
+            else:
+                pending.setdefault(url, []).append(article)
+        return pending
+
+    def store(
+        self,
+        url: str,
+        articles: List[Dict[str, Any]],
+        content: Union[str, bytes, etree._Element, None],
+        selector: str,
+    ):
+        """Extract a fetched page's body, cache it and apply it to the articles linking to it.
+
+        A page without a body (nothing fetched, or the selector matched nothing) keeps the
+        listing excerpts and is not cached.
+        """
+        body = extract_body(content, selector) if content is not None else ""
+        if not body:
+            logger.debug(f"No article body in {url} for selector {selector!r}")
+            self._count("empty")
+            return
+        self.cache.put(url, selector, body)
+        for article in articles:
+            self._apply(article, body)
+        self._count("fetched")
+
+    def failed(self, url: str, error: Exception):
+        """Keep the listing excerpt for an article whose page could not be fetched."""
+        logger.warning(f"Keeping listing excerpt for {url}: {error}")
+        self._count("failed")
+
+    def summary(self) -> Dict[str, int]:
+        """Return per-run counters."""
+        return dict(self.stats)
+
+    @staticmethod
+    def _apply(article: Dict[str, Any], body: str):
+        # A page whose body selector matched less than the card showed keeps the excerpt
+        if len(body) > len(article.get("content") or ""):
+            article["content"] = body
+
+    def _count(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
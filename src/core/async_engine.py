@@ -0,0 +1,377 @@
+"""
+Asyncio fetch engine for large source catalogues.
+
+Keeps thousands of requests in flight on a single event loop while
+honouring the same per-domain politeness delays as the threaded engine.
+"""
+
+import asyncio
+import random
+import time
+from typing import Dict, List, Any, Optional, Tuple, Union
+from urllib.parse import urlparse
+
+import aiohttp
+from loguru import logger
+from lxml import etree
+
+from src.core.article_fetch import FullArticleFetcher
+from src.core.cache import NotModified, ValidatorCache
+from src.core.feeds import FeedWatermarks
+from src.core.history import ArticleHistory
+from src.core.parse_pool import ParsePool
+from src.core.profiling import ExtractionProfiler
+from src.core.rate_control import THROTTLE_STATUS_CODES, AdaptiveRateController
+from src.core.retry_policy import DeadlineExceeded, RetryPolicy
+from src.core.scheduler import RunBudget
+from src.core.scrape_flow import Fetch, FetchEach, ParseFeed, ScrapeFlow, Step, run_async as run_flow
+from src.core.scraper import DEFAULT_HEADERS, HTMLParser, RateLimiter
+from src.core.sitemap import SitemapWatermarks
+from src.core.snapshots import SnapshotStore
+from src.core.streaming import (
+    DEFAULT_MAX_RESPONSE_BYTES,
+    STREAM_CHUNK_SIZE,
+    IncrementalHTMLParser,
+    charset_from_content_type,
+)
+from src.processors.content_processor import RSSFeedProcessor
+
+
+class AsyncRateLimiter(RateLimiter):
+    """Per-domain rate limiting for coroutines sharing one event loop."""
+
+    async def wait(self, domain: str):
+        """Wait before making a request to respect rate limits."""
+        while True:
+            wait_time = self._try_acquire(domain)
+            if wait_time <= 0:
+                return
+
+            logger.debug(f"Rate limiting: waiting {wait_time:.2f}s for {domain}")
+            await asyncio.sleep(wait_time)
+
+
+class SourceClock:
+    """A source's deadline, started when its first request gets its domain slot.
+
+    Sources sharing a host queue for that host's semaphore and delay; as with
+    the threaded engine, which starts the clock when a worker picks a source
+    up, that wait does not count against source_deadline. The run budget
+    applies from the start.
+    """
+
+    def __init__(self, source: Dict[str, Any], seconds: Optional[float], run_budget: RunBudget):
+        self.source = source
+        self.seconds = seconds
+        self.run_budget = run_budget
+        self.deadline = run_budget.cap_deadline(source, None)
+        self.started = False
+
+    def start(self) -> Optional[float]:
+        """Start the clock unless it is already running, returning the deadline."""
+        if not self.started:
+            self.started = True
+            deadline = time.time() + self.seconds if self.seconds else None
+            self.deadline = self.run_budget.cap_deadline(self.source, deadline)
+        return self.deadline
+
+
+class AsyncScrapeEngine:
+    """Scrapes sources with aiohttp, returning the same result dicts as CompetitorScraper."""
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        http_cache: Optional[ValidatorCache] = None,
+        rate_controller: Optional[AdaptiveRateController] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        snapshots: Optional[SnapshotStore] = None,
+        run_budget: Optional[RunBudget] = None,
+        parse_pool: Optional[ParsePool] = None,
+        history: Optional[ArticleHistory] = None,
+        watermarks: Optional[SitemapWatermarks] = None,
+        feed_watermarks: Optional[FeedWatermarks] = None,
+        full_articles: Optional[FullArticleFetcher] = None,
+        profiler: Optional[ExtractionProfiler] = None,
+    ):
+        self.config = config
+        self.http_cache = http_cache
+        self.snapshots = snapshots
+        self.run_budget = run_budget or RunBudget()
+        self.parse_pool = parse_pool
+        self.history = history
+        self.watermarks = watermarks
+        self.feed_watermarks = feed_watermarks
+        self.full_articles = full_articles
+        self.profiler = profiler
+        scraping_config = config.get("scraping", {})
+
+        self.user_agents = scraping_config.get("user_agents", []) or ["Mozilla/5.0"]
+        self.rate_limiter = AsyncRateLimiter(
+            min_delay=scraping_config.get("min_delay", 2),
+            max_delay=scraping_config.get("max_delay", 5),
+            controller=rate_controller,
+            max_retry_after=scraping_config.get("adaptive_rate", {}).get("max_retry_after", 300),
+        )
+        self.timeout = scraping_config.get("request_timeout", 30)
+        self.retry_policy = retry_policy or RetryPolicy.from_config(scraping_config)
+        self.source_deadline = scraping_config.get("source_deadline")
+        self.max_concurrency = scraping_config.get("max_concurrency", 1000)
+        self.per_domain_concurrency = scraping_config.get("per_domain_concurrency", 2)
+        self.dns_cache_ttl = scraping_config.get("dns_cache_ttl", 300)
+        self.stream = scraping_config.get("stream_responses", False)
+        self.max_response_bytes = scraping_config.get("max_response_bytes", DEFAULT_MAX_RESPONSE_BYTES)
+        self.parser_engine = scraping_config.get("parser_engine", "soup")
+        self.scoped_parsing = scraping_config.get("scoped_parsing", False)
+        self.max_content_length = config.get("processing", {}).get("max_content_length", 50000)
+        self.feed_first = scraping_config.get("feed_first", True)
+        self.feed_processor = RSSFeedProcessor.from_config(config)
+
+        self._domain_headers: Dict[str, Dict[str, str]] = {}
+        self._domain_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._run_slots: Optional[asyncio.Semaphore] = None
+
+    def run(self, sources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Scrape all sources on a fresh event loop."""
+        return asyncio.run(self.scrape_all(sources))
+
+    async def scrape_all(self, sources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Scrape all sources concurrently, starting them in the given (priority) order."""
+        logger.info(
+            f"Starting async scraping of {len(sources)} sources "
+            f"(max_concurrency={self.max_concurrency}, per_domain={self.per_domain_concurrency})"
+        )
+
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency, ttl_dns_cache=self.dns_cache_ttl)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+
+        # Semaphore waiters are served FIFO, so sources start in list order once slots are scarce
+        self._run_slots = asyncio.Semaphore(self.max_concurrency)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            tasks = [self._scrape_source_safe(session, source) for source in sources]
+            results = await asyncio.gather(*tasks)
+
+        logger.info(f"Completed scraping. Total results: {len(results)}")
+        return list(results)
+
+    async def _scrape_source_safe(self, session: aiohttp.ClientSession, source: Dict[str, Any]) -> Dict[str, Any]:
+        """Scrape a source, converting unexpected exceptions into an error result."""
+        try:
+            async with self._run_slots:
+                return await self.scrape_source(session, source)
+        except Exception as e:
+            logger.error(f"Exception for {source.get('name')}: {e}")
+            return {"source": source.get("name"), "status": "error", "articles": [], "error": str(e)}
+
+    async def scrape_source(self, session: aiohttp.ClientSession, source: Dict[str, Any]) -> Dict[str, Any]:
+        """Scrape a single source and return structured data."""
+        name = source.get("name")
+        url = source.get("url")
+
+        if self.run_budget.should_defer(source):
+            return self.run_budget.deferred_result(source)
+
+        logger.info(f"Starting scrape for {name}: {url}")
+        clock = SourceClock(source, self.source_deadline, self.run_budget)
+        fetch_stats: Dict[str, Any] = {}
+
+        flow = ScrapeFlow(self, source)
+        try:
+            result = await run_flow(flow.scrape(), lambda step: self._perform(session, step, clock, fetch_stats))
+        except Exception as e:
+            result = flow.error_result(e)
+        return flow.finish(result, fetch_stats)
+
+    async def _perform(
+        self, session: aiohttp.ClientSession, step: Step, clock: SourceClock, fetch_stats: Dict[str, Any]
+    ) -> Any:
+        """Carry out one step of a source's ScrapeFlow on the event loop."""
+        if isinstance(step, Fetch):
+            if step.mode == Fetch.ONCE:
+                return await self._fetch_once(session, step.url, raw=step.raw, clock=clock)
+            stats = fetch_stats if step.mode == Fetch.FIRST else None
+            return await self.fetch(session, step.url, stats=stats, raw=step.raw, clock=clock)
+
+        if isinstance(step, FetchEach):
+            slots = asyncio.Semaphore(step.limit)
+
+            async def fetch_one(key: str):
+                async with slots:
+                    try:
+                        content = await self.fetch(session, step.links[key], record=False, clock=clock)
+                    except Exception as e:
+                        step.handle(key, None, e)
+                        return
+                step.handle(key, content, None)
+
+            await asyncio.gather(*(fetch_one(key) for key in step.links))
+            return None
+
+        if isinstance(step, ParseFeed):
+            if self.parse_pool:
+                return await asyncio.wrap_future(self.parse_pool.submit_feed(step.content, step.url, step.since))
+            return await asyncio.get_running_loop().run_in_executor(
+                None, self.feed_processor.parse_feed, step.content, step.url, step.since
+            )
+
+        return await self._parse_articles(step.source, step.content, step.url)
+
+    async def _parse_articles(
+        self, source: Dict[str, Any], content: Union[str, bytes, etree._Element], url: str
+    ) -> List[Dict[str, Any]]:
+        """Extract articles in the parse pool, or in the loop's default executor without one.
+
+        Either way the loop keeps serving other fetches while a page is parsed.
+        """
+        if self.parse_pool and not isinstance(content, etree._Element):
+            parsed = await asyncio.wrap_future(self.parse_pool.submit(source, content, url))
+        else:
+            parser = HTMLParser.for_source(source, self.parser_engine, self.scoped_parsing, self.max_content_length)
+            parse = parser.parse_profiled if self.profiler else parser.parse
+            parsed = await asyncio.get_running_loop().run_in_executor(None, parse, content, url)
+
+        if not self.profiler:
+            return parsed
+        articles, page = parsed
+        self.profiler.record(source.get("name"), page)
+        return articles
+
+    async def fetch(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        deadline: Optional[float] = None,
+        stats: Optional[Dict[str, Any]] = None,
+        raw: bool = False,
+        record: bool = True,
+        clock: Optional[SourceClock] = None,
+    ) -> Optional[Union[str, bytes, etree._Element]]:
+        """Fetch content from a URL with retry logic.
+
+        Returns the page text (undecoded bytes with raw=True or when a parse
+        pool is set), or a parsed lxml document in streaming mode.
+        If `stats` is given, it receives the attempt count and time spent in backoff.
+        With record=False the response is neither snapshotted nor given cache validators.
+        A `clock` replaces `deadline`, and is started once the request has its domain slot.
+        """
+        retrying = self.retry_policy.async_retrying((lambda: clock.deadline) if clock else deadline)
+        try:
+            async for attempt in retrying:
+                with attempt:
+                    return await self._fetch_once(session, url, deadline, raw, record, clock)
+        finally:
+            if stats is not None:
+                stats["attempts"] = retrying.statistics.get("attempt_number", 1)
+                stats["backoff_seconds"] = round(retrying.statistics.get("idle_for", 0.0), 3)
+
+    async def _fetch_once(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        deadline: Optional[float] = None,
+        raw: bool = False,
+        record: bool = True,
+        clock: Optional[SourceClock] = None,
+    ) -> Optional[Union[str, bytes, etree._Element]]:
+        """Perform a single rate-limited GET within the domain's concurrency cap."""
+        domain = urlparse(url).netloc
+        headers = self._get_headers(domain)
+        http_cache = self.http_cache if record else None
+        snapshots = self.snapshots if record else None
+        if http_cache:
+            headers = {**headers, **self.http_cache.conditional_headers(url)}
+
+        async with self._get_semaphore(domain):
+            if clock:
+                deadline = clock.deadline
+            if deadline is not None and deadline - time.time() - self.rate_limiter.time_until_ready(domain) <= 0:
+                raise DeadlineExceeded(f"no time left to fetch {url}")
+
+            await self.rate_limiter.wait(domain)
+            if clock:
+                deadline = clock.start()
+            timeout = aiohttp.ClientTimeout(total=self.timeout)
+            if deadline is not None:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    raise DeadlineExceeded(f"no time left to fetch {url}")
+                timeout = aiohttp.ClientTimeout(total=min(self.timeout, remaining))
+            logger.info(f"Fetching: {url}")
+
+            try:
+                start = time.time()
+                async with session.get(url, headers=headers, timeout=timeout, allow_redirects=True) as response:
+                    self.rate_limiter.record_response(
+                        domain,
+                        response.status,
+                        time.time() - start,
+                        retry_after=response.headers.get("Retry-After") if response.status in THROTTLE_STATUS_CODES else None,
+                    )
+                    if response.status == 304 and http_cache:
+                        logger.info(f"Not modified since last run: {url}")
+                        raise NotModified(url)
+                    if response.status == 429:
+                        logger.warning(f"Rate limited by {domain}, increasing delay")
+                    response.raise_for_status()
+                    if self.stream and not raw:
+                        content, size = await self._read_stream(url, response, snapshots)
+                    else:
+                        body = await response.read()
+                        content = body if self.parse_pool or raw else await response.text()
+                        size = len(body)
+                        if snapshots:
+                            snapshots.save(url, body, response.headers.get("Content-Type"))
+                    if http_cache:
+                        http_cache.record_response(url, response.headers, size)
+
+            except aiohttp.ClientResponseError as e:
+                logger.error(f"HTTP error for {url}: {e.status} {e.message}")
+                raise
+
+            except asyncio.TimeoutError:
+                logger.error(f"Timeout while fetching {url}")
+                raise
+
+            except aiohttp.ClientError as e:
+                logger.error(f"Request failed for {url}: {e}")
+                raise
+
+        logger.success(f"Successfully fetched: {url} (Status: {response.status})")
+        return content
+
+    async def _read_stream(
+        self, url: str, response: aiohttp.ClientResponse, snapshots: Optional[SnapshotStore] = None
+    ) -> Tuple[Optional[etree._Element], int]:
+        """Feed the body into an incremental lxml parser, stopping at the byte cap."""
+        content_type = response.headers.get("Content-Type")
+        snapshot = snapshots.writer(url, content_type) if snapshots else None
+        parser = IncrementalHTMLParser(
+            url,
+            charset=charset_from_content_type(content_type),
+            max_bytes=self.max_response_bytes,
+            on_chunk=snapshot.write if snapshot else None,
+        )
+        try:
+            async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                if not parser.feed(chunk):
+                    break
+        except Exception:
+            if snapshot:
+                snapshot.discard()
+            raise
+
+        if snapshot:
+            snapshot.commit()
+        return parser.close(), parser.size
+
+    def _get_semaphore(self, domain: str) -> asyncio.Semaphore:
+        """Get or create the concurrency cap for a domain."""
+        if domain not in self._domain_semaphores:
+            self._domain_semaphores[domain] = asyncio.Semaphore(self.per_domain_concurrency)
+        return self._domain_semaphores[domain]
+
+    def _get_headers(self, domain: str) -> Dict[str, str]:
+        """Get the sticky per-domain headers, mirroring SessionManager."""
+        if domain not in self._domain_headers:
+            self._domain_headers[domain] = {"User-Agent": random.choice(self.user_agents), **DEFAULT_HEADERS}
+        return self._domain_headers[domain]
@@ -0,0 +1,119 @@
+"""
+On-disk HTTP validator cache for conditional GETs.
+
+Remembers each URL's ETag / Last-Modified together with the articles parsed
+from that response, so a 304 can skip both the download and HTML parsing.
+Entries carry a fingerprint of the selectors and parser that produced their
+articles; one made under another fingerprint is a miss.
+"""
+
+import hashlib
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+from loguru import logger
+
+from src.utils.json_store import load_json, save_json
+
+
+class NotModified(Exception):
+    """Raised by a fetcher when the server answers 304 Not Modified."""
+
+    def __init__(self, url: str):
+        super().__init__(f"Not modified: {url}")
+        self.url = url
+
+
+class ValidatorCache:
+    """Persists HTTP validators and parsed articles per URL under cache_dir."""
+
+    def __init__(self, cache_dir: str = "data/processed", ttl_days: float = 7):
+        self.cache_dir = Path(cache_dir) / "http"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_days * 86400
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Start a fresh set of per-run counters."""
+        self.stats = {"requests": 0, "hits": 0, "misses": 0, "bytes_downloaded": 0, "bytes_saved": 0}
+
+    def _path(self, url: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha256(url.encode()).hexdigest()}.json"
+
+    def get(self, url: str, fingerprint: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Return the cached entry for a URL, or None if missing, expired or stored under another fingerprint."""
+        path = self._path(url)
+        entry = load_json(path, f"cache entry for {url}")
+        if entry is None:
+            path.unlink(missing_ok=True)
+            return None
+
+        if time.time() - entry.get("stored_at", 0) > self.ttl_seconds:
+            logger.debug(f"Cache entry expired for {url}")
+            path.unlink(missing_ok=True)
+            return None
+
+        if fingerprint is not None and entry.get("fingerprint") != fingerprint:
+            logger.debug(f"Cache entry for {url} was parsed with other selectors")
+            path.unlink(missing_ok=True)
+            return None
+
+        return entry
+
+    def check_fingerprint(self, url: str, fingerprint: str):
+        """Drop a URL's entry if another fingerprint stored it, so its next GET is unconditional."""
+        self.get(url, fingerprint)
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers for a URL."""
+        entry = self.get(url)
+        if not entry:
+            return {}
+
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def record_response(self, url: str, headers: Dict[str, str], size: int):
+        """Record a full (200) response and hold its validators until articles are stored."""
+        with self._lock:
+            self.stats["requests"] += 1
+            self.stats["misses"] += 1
+            self.stats["bytes_downloaded"] += size
+
+            etag = headers.get("ETag")
+            last_modified = headers.get("Last-Modified")
+            if etag or last_modified:
+                self._pending[url] = {"etag": etag, "last_modified": last_modified, "size": size}
+
+    def record_not_modified(self, url: str) -> List[Dict[str, Any]]:
+        """Record a 304 response and return the articles parsed last time."""
+        entry = self.get(url) or {}
+        with self._lock:
+            self.stats["requests"] += 1
+            self.stats["hits"] += 1
+            self.stats["bytes_saved"] += entry.get("size", 0)
+        return entry.get("articles", [])
+
+    def store_articles(self, url: str, articles: List[Dict[str, Any]], fingerprint: Optional[str] = None):
+        """Persist validators from the last full response together with its parsed articles."""
+        with self._lock:
+            pending = self._pending.pop(url, None)
+        if not pending:
+            return
+
+        entry = {"url": url, "stored_at": time.time(), "articles": articles, "fingerprint": fingerprint, **pending}
+        save_json(self._path(url), entry)
+
+    def summary(self) -> Dict[str, Any]:
+        """Return per-run counters including the hit rate."""
+        requests_made = self.stats["requests"]
+        hit_rate = self.stats["hits"] / requests_made if requests_made else 0.0
+        return {**self.stats, "hit_rate": round(hit_rate, 3)}
@@ -0,0 +1,35 @@
+"""
+High-water marks for RSS/Atom feeds.
+
+Feeds are fetched conditionally through the HTTP validator cache, so an
+unchanged feed costs a 304. When it has changed, only entries published
+after the newest one seen on a previous run are extracted: feeds list
+newest first, so parsing stops at the first entry at or before the mark.
+"""
+
+from datetime import datetime, timezone
+from typing import Dict, List, Any, Optional
+
+from src.core.sitemap import SitemapWatermarks
+
+
+class FeedWatermarks(SitemapWatermarks):
+    """Newest entry date seen per feed URL, persisted across runs."""
+
+    FILENAME = "feed_watermarks.json"
+
+    def since(self, url: str) -> Optional[datetime]:
+        """The feed's watermark as a naive UTC datetime (feed entry dates are UTC), or None on first read."""
+        mark = self._marks.get(url)
+        if not mark:
+            return None
+        try:
+            return datetime.fromisoformat(mark).astimezone(timezone.utc).replace(tzinfo=None)
+        except ValueError:
+            return None
+
+    def record(self, url: str, articles: List[Dict[str, Any]]):
+        """Advance a feed's watermark to its newest dated article (undated feeds keep none)."""
+        dates = [article["date"] for article in articles if article.get("date")]
+        if dates:
+            self.advance(url, max(dates))
@@ -0,0 +1,102 @@
+"""
+Per-source history of articles already collected.
+
+Keeps the content hashes and canonical links of each source's most recent
+articles under storage.cache_dir, so later runs can tell new posts from
+ones seen before (for example to stop following listing pages).
+"""
+
+import threading
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Set
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+from src.utils.json_store import load_json, save_json
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = {"ref", "fbclid", "gclid", "mc_cid", "mc_eid"}
+TRACKING_PREFIXES = ("utm_",)
+
+
+def canonical_url(url: str) -> str:
+    """Normalise a URL so the same article linked in different ways compares equal."""
+    parts = urlparse(url.strip())
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    ]
+    netloc = parts.netloc.lower()
+    if (parts.scheme, netloc.rsplit(":", 1)[-1]) in (("http", "80"), ("https", "443")):
+        netloc = netloc.rsplit(":", 1)[0]
+    path = parts.path.rstrip("/") or "/"
+    return urlunparse((parts.scheme.lower(), netloc, path, "", urlencode(sorted(query)), ""))
+
+
+def article_link(article: Dict[str, Any]) -> Optional[str]:
+    """Canonical link of an article, or None when it only points back at the listing page."""
+    link = article.get("link")
+    if not link or link == article.get("source_url"):
+        return None
+    return canonical_url(link)
+
+
+class ArticleHistory:
+    """Bounded, persisted sets of known content hashes and links per source."""
+
+    def __init__(self, cache_dir: str = "data/processed", max_per_source: int = 1000):
+        self.path = Path(cache_dir) / "article_history.json"
+        self.max_per_source = max_per_source
+        self._sources: Dict[str, Dict[str, List[str]]] = {}
+        self._index: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    def has_source(self, source: str) -> bool:
+        """Whether any article of this source has been recorded."""
+        return source in self._sources
+
+    def is_known(self, source: str, article: Dict[str, Any]) -> bool:
+        """Whether an article's content hash or canonical link was seen for this source."""
+        known = self._index.get(source)
+        if not known:
+            return False
+        link = article_link(article)
+        return article.get("content_hash") in known or (link is not None and link in known)
+
+    def add(self, source: str, articles: List[Dict[str, Any]]):
+        """Record articles for a source, keeping only the most recent max_per_source."""
+        with self._lock:
+            entry = self._sources.setdefault(source, {"hashes": [], "links": []})
+            for article in articles:
+                if article.get("content_hash"):
+                    self._append(entry["hashes"], article["content_hash"])
+                link = article_link(article)
+                if link:
+                    self._append(entry["links"], link)
+            self._index[source] = set(entry["hashes"]) | set(entry["links"])
+
+    def update(self, results: List[Dict[str, Any]]):
+        """Record the articles of every successful scrape result."""
+        for result in results:
+            if result.get("status") == "success" and result.get("articles"):
+                self.add(result["source"], result["articles"])
+
+    def load(self):
+        """Load history from previous runs."""
+        sources = load_json(self.path, "article history")
+        if sources is None:
+            return
+        self._sources = sources
+        self._index = {source: set(entry["hashes"]) | set(entry["links"]) for source, entry in self._sources.items()}
+
+    def save(self):
+        """Persist history for the next run."""
+        with self._lock:
+            save_json(self.path, self._sources)
+
+    def _append(self, values: List[str], value: str):
+        if value in values:
+            values.remove(value)
+        values.append(value)
+        del values[:-self.max_per_source]
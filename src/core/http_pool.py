@@ -0,0 +1,176 @@
+"""
+Connection pooling helpers for requests sessions.
+
+Provides an HTTPAdapter whose pools resolve hostnames through a shared
+in-process DNS cache, and counters for how often pooled connections were
+reused instead of opening (and TLS-handshaking) new ones.
+"""
+
+import functools
+import ipaddress
+import socket
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError
+
+
+class DNSCache:
+    """Thread-safe TTL cache of hostname resolutions shared by the sessions of a scraper."""
+
+    def __init__(self, ttl: float = 300, max_entries: int = 4096):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: Dict[Tuple[str, int], Tuple[List[str], float]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def resolve(self, host: str, port: int) -> List[str]:
+        """Return every address of host in resolver order, resolving it when missing or expired.
+
+        Raises socket.gaierror when the lookup fails; failures are not cached.
+        """
+        if self.ttl <= 0 or _is_ip_address(host):
+            return [host]
+
+        key = (host, port)
+        now = time.time()
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached and cached[1] > now:
+                self.hits += 1
+                return cached[0]
+
+        # Resolve outside the lock so one slow lookup doesn't stall other domains
+        addresses = list(dict.fromkeys(info[4][0] for info in socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)))
+        with self._lock:
+            self.misses += 1
+            self._entries.pop(key, None)
+            self._entries[key] = (addresses, now + self.ttl)
+            self._prune(now)
+        logger.debug(f"Resolved {host} -> {', '.join(addresses)}")
+        return addresses
+
+    def forget(self, host: str, port: int):
+        """Drop a host's cached addresses (none of them accepted a connection)."""
+        with self._lock:
+            self._entries.pop((host, port), None)
+
+    def clear(self):
+        """Forget all cached resolutions."""
+        with self._lock:
+            self._entries.clear()
+
+    def _prune(self, now: float):
+        """Drop expired entries, then the oldest ones beyond max_entries; called with the lock held."""
+        if len(self._entries) <= self.max_entries:
+            return
+        for key in [key for key, (_, expires) in self._entries.items() if expires <= now]:
+            del self._entries[key]
+        # Entries are kept in insertion order, so the first ones are the oldest resolutions
+        while len(self._entries) > self.max_entries:
+            del self._entries[next(iter(self._entries))]
+
+
+def _is_ip_address(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host.strip("[]"))
+        return True
+    except ValueError:
+        return False
+
+
+DNS_CACHE = DNSCache()
+
+
+class _CachedDNSConnectionMixin:
+    """Connects to the cached addresses in turn while keeping the hostname for Host, SNI and certificates."""
+
+    dns_cache = DNS_CACHE
+
+    def _new_conn(self):
+        hostname = self._dns_host
+        host = hostname.rstrip(".")
+        try:
+            addresses = self.dns_cache.resolve(host, self.port)
+        except socket.gaierror:
+            # Let urllib3 resolve the name itself so the failure surfaces as its NameResolutionError
+            return super()._new_conn()
+
+        error = None
+        for address in addresses:
+            self._dns_host = address
+            try:
+                return super()._new_conn()
+            except ConnectTimeoutError as e:
+                # Also covers NewConnectionError; fall back to the next address like urllib3 does
+                error = e
+            finally:
+                self._dns_host = hostname
+        self.dns_cache.forget(host, self.port)
+        raise error
+
+
+class CachedDNSHTTPConnection(_CachedDNSConnectionMixin, HTTPConnection):
+    pass
+
+
+class CachedDNSHTTPSConnection(_CachedDNSConnectionMixin, HTTPSConnection):
+    pass
+
+
+class CachedDNSHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = CachedDNSHTTPConnection
+
+
+class CachedDNSHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = CachedDNSHTTPSConnection
+
+
+@functools.lru_cache(maxsize=64)
+def _pool_class(pool_cls, dns_cache: DNSCache):
+    """A subclass of pool_cls whose connections resolve through dns_cache."""
+    if dns_cache is DNS_CACHE:
+        return pool_cls
+    connection_cls = type(pool_cls.ConnectionCls.__name__, (pool_cls.ConnectionCls,), {"dns_cache": dns_cache})
+    return type(pool_cls.__name__, (pool_cls,), {"ConnectionCls": connection_cls})
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter using DNS-cached connection pools and exposing reuse counters."""
+
+    def __init__(self, *args, dns_cache: Optional[DNSCache] = None, **kwargs):
+        # Set before HTTPAdapter.__init__, which builds the pool manager
+        self.dns_cache = dns_cache if dns_cache is not None else DNS_CACHE
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _pool_class(CachedDNSHTTPConnectionPool, self.dns_cache),
+            "https": _pool_class(CachedDNSHTTPSConnectionPool, self.dns_cache),
+        }
+
+    def connection_stats(self) -> Dict[str, int]:
+        """Count requests and new connections across this adapter's live pools."""
+        stats = {"requests": 0, "connections": 0, "tls_requests": 0, "tls_handshakes": 0}
+        pools = self.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            stats["requests"] += pool.num_requests
+            stats["connections"] += pool.num_connections
+            if pool.scheme == "https":
+                stats["tls_requests"] += pool.num_requests
+                stats["tls_handshakes"] += pool.num_connections
+        return stats
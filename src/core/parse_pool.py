@@ -0,0 +1,128 @@
+"""
+Process pool for the parsing stage.
+
+Extraction is CPU-bound Python, so in the fetch thread pool it competes for
+the GIL with the threads doing network I/O. With scraping.parse_pool on,
+fetch workers hand raw page bytes to a pool of parser processes (one per
+core by default) and get plain article dicts back. Each worker process
+compiles its own selector plans on first use and keeps them for the run.
+Feeds go through the same pool: feedparser is pure Python, so a large
+feed catalogue parsed in the fetch threads would serialise on the GIL.
+"""
+
+import multiprocessing
+import os
+import sys
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple, Union
+
+from loguru import logger
+from lxml import etree
+
+from src.core.profiling import PageProfile
+from src.core.scraper import HTMLParser
+from src.processors.content_processor import RSSFeedProcessor
+
+
+def _init_worker():
+    """Keep worker processes to warnings so they don't repeat the parent's per-page logging."""
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+
+def parse_page(
+    source: Dict[str, Any],
+    content: Union[str, bytes, etree._Element],
+    url: str,
+    default_engine: str = "soup",
+    scoped: bool = False,
+    profile: bool = False,
+    max_content_length: Optional[int] = None,
+) -> Union[List[Dict[str, Any]], Tuple[List[Dict[str, Any]], PageProfile]]:
+    """Extract a source's articles from a page body; runs in a worker process.
+
+    With profile=True, returns the articles together with the page's PageProfile.
+    """
+    parser = HTMLParser.for_source(source, default_engine, scoped, max_content_length)
+    return parser.parse_profiled(content, url) if profile else parser.parse(content, url)
+
+
+def parse_feed(
+    content: bytes,
+    feed_url: str,
+    since: Optional[datetime] = None,
+    max_content_length: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Parse a fetched RSS/Atom document into article dicts; runs in a worker process.
+
+    Only the entry dicts cross back to the caller, never feedparser's result objects.
+    """
+    return RSSFeedProcessor(max_content_length).parse_feed(content, feed_url, since)
+
+
+class ParsePool:
+    """Parses page bodies and feeds in worker processes, started on first use and reused across runs."""
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        default_engine: str = "soup",
+        scoped: bool = False,
+        profile: bool = False,
+        max_content_length: Optional[int] = None,
+    ):
+        self.workers = workers or os.cpu_count() or 1
+        self.default_engine = default_engine
+        self.scoped = scoped
+        self.profile = profile
+        self.max_content_length = max_content_length
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """The worker pool, created on first use."""
+        with self._lock:
+            if self._executor is None:
+                # Spawned rather than forked: forking while fetch threads hold locks can deadlock the child
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                )
+                logger.info(f"Started parse pool with {self.workers} worker processes")
+            return self._executor
+
+    def submit(self, source: Dict[str, Any], content: Union[str, bytes], url: str) -> Future:
+        """Queue a page for parsing and return a future for its articles."""
+        return self.executor.submit(
+            parse_page, source, content, url, self.default_engine, self.scoped, self.profile, self.max_content_length
+        )
+
+    def parse(self, source: Dict[str, Any], content: Union[str, bytes, etree._Element], url: str):
+        """Parse a page in the pool; documents already built by a streaming fetch are parsed in place.
+
+        Returns what parse_page does: the articles, paired with a PageProfile when profiling.
+        """
+        if isinstance(content, etree._Element):
+            return parse_page(
+                source, content, url, self.default_engine, self.scoped, self.profile, self.max_content_length
+            )
+        return self.submit(source, content, url).result()
+
+    def submit_feed(self, content: bytes, feed_url: str, since: Optional[datetime] = None) -> Future:
+        """Queue a feed document for parsing and return a future for its articles."""
+        return self.executor.submit(parse_feed, content, feed_url, since, self.max_content_length)
+
+    def parse_feed(self, content: bytes, feed_url: str, since: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Parse a feed document in the pool (see RSSFeedProcessor.parse_feed)."""
+        return self.submit_feed(content, feed_url, since).result()
+
+    def shutdown(self):
+        """Stop the worker processes."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
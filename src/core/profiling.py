@@ -0,0 +1,179 @@
+"""
+Extraction profiling.
+
+With scraping.profile_extraction on (or `--profile`), every parse records
+its time, tree size, which engine ran, and per selector the time spent and
+elements matched, plus how many article containers came out with an empty
+title, date or content. Page profiles are aggregated per source and written
+as JSON next to the reports, to show which sources and selectors are worth
+a fast path or a fix.
+"""
+
+import json
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+from loguru import logger
+
+# Fields whose emptiness is reported; articles without a title are dropped by the parser
+EMPTY_FIELDS = ("title", "date", "content")
+
+
+class PageProfile:
+    """Measurements from parsing one page (plain data, so it can come back from a parse worker)."""
+
+    def __init__(self, selectors: Dict[str, str]):
+        self.selectors = dict(selectors)
+        self.engine: Optional[str] = None
+        self.seconds = 0.0
+        self.tree_nodes = 0
+        self.containers = 0
+        self.articles = 0
+        self.empty = {field: 0 for field in EMPTY_FIELDS}
+        self.selector_seconds = {field: 0.0 for field in selectors}
+        self.selector_matched = {field: 0 for field in selectors}
+        self._overhead = 0.0
+
+    def finish(self, articles: List[Dict[str, Any]], seconds: float):
+        """Close the profile once the parse returned its articles."""
+        self.seconds = max(seconds - self._overhead, 0.0)
+        self.engine = self.engine or "structured"
+        self.articles = len(articles)
+        self.containers = max(self.containers, self.articles)
+        self.empty["title"] = self.containers - self.articles
+        self.empty["date"] = sum(1 for article in articles if not article.get("date"))
+        self.empty["content"] = sum(1 for article in articles if not article.get("content"))
+
+
+class ProfiledPlan:
+    """Wraps a SelectorPlan, timing each selection and counting what it matched."""
+
+    def __init__(self, plan, page: PageProfile):
+        self._plan = plan
+        self._page = page
+
+    def __getattr__(self, name: str):
+        return getattr(self._plan, name)
+
+    def select(self, field: str, element, limit: int = 0):
+        self._page.engine = self._page.engine or "soup"
+        matched = self._timed(field, self._plan.select, field, element, limit)
+        if field != "article":
+            self._page.selector_matched[field] += len(matched)
+        elif not limit:
+            # The scoped parse's one-element probe is not the container selection
+            self._page.selector_matched[field] = self._page.containers = len(matched)
+            self._count_nodes(lambda: sum(1 for _ in element.find_all(True)))
+        return matched
+
+    def select_one(self, field: str, element):
+        self._page.engine = self._page.engine or "soup"
+        matched = self._timed(field, self._plan.select_one, field, element)
+        self._page.selector_matched[field] += matched is not None
+        return matched
+
+    def select_tree(self, field: str, element):
+        self._page.engine = "lxml"
+        matched = self._timed(field, self._plan.select_tree, field, element)
+        self._page.selector_matched[field] += len(matched)
+        if field == "article":
+            self._page.containers = len(matched)
+            self._count_nodes(lambda: sum(1 for _ in element.iter()))
+        return matched
+
+    def _timed(self, field: str, select, *args):
+        start = time.perf_counter()
+        try:
+            return select(*args)
+        finally:
+            self._page.selector_seconds[field] += time.perf_counter() - start
+
+    def _count_nodes(self, count):
+        start = time.perf_counter()
+        self._page.tree_nodes = count()
+        self._page._overhead += time.perf_counter() - start
+
+
+class ExtractionProfiler:
+    """Aggregates page profiles per source for one run."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sources: Dict[str, Dict[str, Any]] = {}
+
+    def record(self, source: str, page: PageProfile):
+        """Add one page's measurements to its source."""
+        with self._lock:
+            entry = self._sources.setdefault(source, {
+                "pages": 0,
+                "engines": {},
+                "parse_seconds": 0.0,
+                "tree_nodes_total": 0,
+                "tree_nodes_max": 0,
+                "containers": 0,
+                "articles": 0,
+                "empty": {field: 0 for field in EMPTY_FIELDS},
+                "selectors": {},
+            })
+            entry["pages"] += 1
+            entry["engines"][page.engine] = entry["engines"].get(page.engine, 0) + 1
+            entry["parse_seconds"] += page.seconds
+            entry["tree_nodes_total"] += page.tree_nodes
+            entry["tree_nodes_max"] = max(entry["tree_nodes_max"], page.tree_nodes)
+            entry["containers"] += page.containers
+            entry["articles"] += page.articles
+            for field in EMPTY_FIELDS:
+                entry["empty"][field] += page.empty[field]
+            for field, selector in page.selectors.items():
+                stats = entry["selectors"].setdefault(
+                    field, {"selector": selector, "seconds": 0.0, "matched": 0, "pages_without_match": 0}
+                )
+                stats["seconds"] += page.selector_seconds[field]
+                stats["matched"] += page.selector_matched[field]
+                if page.engine != "structured" and not page.selector_matched[field]:
+                    stats["pages_without_match"] += 1
+
+    def report(self) -> Dict[str, Any]:
+        """Per-source profile, most expensive source first."""
+        with self._lock:
+            sources = sorted(self._sources.items(), key=lambda item: item[1]["parse_seconds"], reverse=True)
+            report = {}
+            for name, entry in sources:
+                pages = entry["pages"]
+                report[name] = {
+                    "pages": pages,
+                    "engines": dict(entry["engines"]),
+                    "parse_seconds": round(entry["parse_seconds"], 6),
+                    "seconds_per_page": round(entry["parse_seconds"] / pages, 6),
+                    "tree_nodes": {"mean": round(entry["tree_nodes_total"] / pages), "max": entry["tree_nodes_max"]},
+                    "containers": entry["containers"],
+                    "articles": entry["articles"],
+                    "empty_share": {
+                        "title": self._share(entry["empty"]["title"], entry["containers"]),
+                        "date": self._share(entry["empty"]["date"], entry["articles"]),
+                        "content": self._share(entry["empty"]["content"], entry["articles"]),
+                    },
+                    "selectors": {
+                        field: {**stats, "seconds": round(stats["seconds"], 6)}
+                        for field, stats in entry["selectors"].items()
+                    },
+                }
+        return report
+
+    def write(self, output_dir: str) -> Optional[Path]:
+        """Write the profile as JSON into output_dir, returning its path (None if nothing was parsed)."""
+        report = self.report()
+        if not report:
+            return None
+        path = Path(output_dir) / f"extraction_profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"generated_at": datetime.now().isoformat(), "sources": report}, indent=2))
+        logger.info(f"Extraction profile written to {path}")
+        return path
+
+    @staticmethod
+    def _share(count: int, total: int) -> float:
+        return round(count / total, 3) if total else 0.0
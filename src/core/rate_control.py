@@ -0,0 +1,124 @@
+"""
+Adaptive per-domain rate control.
+
+Learns a request delay for each domain from the responses it returns:
+multiplicative backoff on 429/503 or latency spikes, additive speed-up
+while responses stay healthy. The learned delays are persisted so the
+next run starts from them instead of the configured defaults.
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from loguru import logger
+
+from src.utils.json_store import load_json, save_json
+
+THROTTLE_STATUS_CODES = (429, 503)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        logger.debug(f"Ignoring unparseable Retry-After: {value}")
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class AdaptiveRateController:
+    """AIMD controller for per-domain request delays, persisted between runs."""
+
+    def __init__(
+        self,
+        initial_delay: float = 2.0,
+        floor_delay: float = 1.0,
+        ceiling_delay: float = 120.0,
+        increase_step: float = 0.05,
+        decrease_factor: float = 2.0,
+        latency_factor: float = 3.0,
+        latency_backoff: float = 1.25,
+        state_path: Optional[str] = None,
+        ttl_days: float = 7,
+    ):
+        self.initial_delay = initial_delay
+        self.floor_delay = floor_delay
+        self.ceiling_delay = ceiling_delay
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.latency_factor = latency_factor
+        self.latency_backoff = latency_backoff
+        self.state_path = Path(state_path) if state_path else None
+        self.ttl_seconds = ttl_days * 86400
+        self.state: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+        self.load()
+
+    def delay_for(self, domain: str) -> float:
+        """Return the current base delay for a domain."""
+        entry = self.state.get(domain)
+        return entry["delay"] if entry else self.initial_delay
+
+    def latency_for(self, domain: str) -> Optional[float]:
+        """Return the smoothed response latency seen for a domain, if any."""
+        entry = self.state.get(domain)
+        return entry.get("latency") if entry else None
+
+    def record_response(self, domain: str, status_code: int, latency: float) -> float:
+        """Update a domain's delay from one response and return the new delay."""
+        with self._lock:
+            entry = self.state.setdefault(domain, {"delay": self.initial_delay, "latency": None})
+            delay = entry["delay"]
+            avg_latency = entry["latency"]
+
+            if status_code in THROTTLE_STATUS_CODES:
+                delay = min(self.ceiling_delay, max(delay, self.floor_delay, 0.1) * self.decrease_factor)
+                logger.warning(f"Throttled by {domain} ({status_code}), delay now {delay:.2f}s")
+
+            elif status_code < 400:
+                if avg_latency and latency > self.latency_factor * avg_latency:
+                    delay = min(self.ceiling_delay, max(delay, self.floor_delay, 0.1) * self.latency_backoff)
+                    logger.debug(f"Latency spike on {domain} ({latency:.2f}s), delay now {delay:.2f}s")
+                elif delay > 0:
+                    delay = max(self.floor_delay, 1 / (1 / delay + self.increase_step))
+
+                entry["latency"] = latency if avg_latency is None else 0.8 * avg_latency + 0.2 * latency
+
+            entry["delay"] = delay
+            entry["updated_at"] = time.time()
+            return delay
+
+    def load(self):
+        """Load learned delays from the previous run, dropping stale entries."""
+        state = load_json(self.state_path, "rate state") if self.state_path else None
+        if state is None:
+            return
+
+        cutoff = time.time() - self.ttl_seconds
+        self.state = {domain: entry for domain, entry in state.items() if entry.get("updated_at", 0) >= cutoff}
+        logger.debug(f"Loaded learned rates for {len(self.state)} domains")
+
+    def save(self):
+        """Persist learned delays for the next run."""
+        if not self.state_path:
+            return
+
+        with self._lock:
+            save_json(self.state_path, self.state, indent=2, sort_keys=True)
+        logger.debug(f"Saved learned rates for {len(self.state)} domains to {self.state_path}")
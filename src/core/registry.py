@@ -0,0 +1,263 @@
+"""
+Source registry.
+
+Sources come from the `sources: tier1/tier2/tier3` lists in the config and
+from a registry file (`sources.registry`) filled by importing OPML or CSV
+source lists. The registry keys every source by id, indexes it by domain
+and tier, and is what the scraper, dashboard and reports read. Imported
+sources are stored as one JSON document, so a catalogue of thousands of
+feeds loads with a single parse.
+"""
+
+import csv
+import io
+import re
+from pathlib import Path
+from typing import Dict, Iterator, List, Any, Optional
+from urllib.parse import urlparse
+
+from loguru import logger
+from lxml import etree
+
+from src.core.scheduler import PRIORITY_RANKS
+from src.utils.json_store import load_json, save_json
+
+TIERS = ("tier1", "tier2", "tier3")
+DEFAULT_TIER = "tier3"
+DEFAULT_PRIORITY = "medium"
+
+# CSV headers accepted for each source field (compared lowercased)
+CSV_FIELDS = {
+    "id": ("id",),
+    "name": ("name", "title", "text"),
+    "url": ("url", "htmlurl", "site", "homepage"),
+    "rss": ("rss", "feed", "xmlurl", "feed_url"),
+    "tier": ("tier",),
+    "priority": ("priority",),
+}
+
+
+def source_domain(source: Dict[str, Any]) -> str:
+    """Host a source lives on, without a leading www."""
+    host = urlparse(source.get("url") or source.get("rss") or "").netloc.lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+def _slug(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+
+def source_id(source: Dict[str, Any]) -> str:
+    """A source's explicit id, else a slug of its name (or domain)."""
+    if source.get("id"):
+        return str(source["id"])
+    return _slug(source.get("name") or source_domain(source))
+
+
+def feed_id(source: Dict[str, Any]) -> str:
+    """Id for an imported source: a slug of its feed (or site) URL without scheme and www.
+
+    Imported lists often reuse names ("Blog", untitled outlines) across sites, so
+    imports are keyed by what is fetched; importing the same list again updates in place.
+    """
+    parts = urlparse(source.get("rss") or source.get("url") or "")
+    host = parts.netloc.lower()
+    host = host[4:] if host.startswith("www.") else host
+    return _slug(f"{host}{parts.path}{'?' + parts.query if parts.query else ''}")
+
+
+def _fetch_url(source: Dict[str, Any]) -> Optional[str]:
+    return source.get("rss") or source.get("url")
+
+
+def iter_opml(content: bytes) -> Iterator[Dict[str, Any]]:
+    """Yield a source for each OPML outline with a feed or site URL.
+
+    A `tier`/`priority` attribute on the outline (or a parent folder named
+    tier1..tier3) sets the source's tier and priority.
+    """
+    root = etree.fromstring(content, etree.XMLParser(recover=True, resolve_entities=False))
+    if root is None:
+        return
+    for outline in root.iter("outline"):
+        rss, url = outline.get("xmlUrl"), outline.get("htmlUrl")
+        if not rss and not url:
+            continue
+        source = {"name": outline.get("title") or outline.get("text"), "url": url or rss}
+        if rss:
+            source["rss"] = rss
+        folder = outline.getparent()
+        folder_name = folder.get("text", "").strip().lower() if folder is not None and folder.tag == "outline" else ""
+        tier = outline.get("tier") or (folder_name if folder_name in TIERS else None)
+        if tier:
+            source["tier"] = tier
+        if outline.get("priority"):
+            source["priority"] = outline.get("priority")
+        yield source
+
+
+def iter_csv(text: str) -> Iterator[Dict[str, Any]]:
+    """Yield a source per CSV row; the header names the columns (name, url, rss, tier, priority, id)."""
+    reader = csv.DictReader(io.StringIO(text))
+    columns = {}
+    for header in reader.fieldnames or []:
+        for field, aliases in CSV_FIELDS.items():
+            if header.strip().lower() in aliases:
+                columns.setdefault(field, header)
+    for row in reader:
+        source = {field: row[header].strip() for field, header in columns.items() if (row.get(header) or "").strip()}
+        if source.get("url") or source.get("rss"):
+            source.setdefault("url", source.get("rss"))
+            yield source
+
+
+class SourceRegistry:
+    """Sources keyed by id and indexed by domain and tier."""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = Path(path) if path else None
+        self._sources: Dict[str, Dict[str, Any]] = {}
+        self._by_domain: Dict[str, List[str]] = {}
+        self._by_tier: Dict[str, List[str]] = {}
+        self._by_name: Dict[str, str] = {}
+        self._configured = set()
+        # Imported sources, written back by save(); configured sources live in the config
+        self._stored: Dict[str, Dict[str, Any]] = {}
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "SourceRegistry":
+        """Build the registry from the configured tiers, then the imported registry file."""
+        sources_config = config.get("sources", {})
+        registry = cls(sources_config.get("registry"))
+        for tier in TIERS:
+            for source in sources_config.get(tier, []):
+                registry.add(source, tier)
+        registry._configured = set(registry._sources)
+        registry.load()
+        return registry
+
+    def __len__(self) -> int:
+        return len(self._sources)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self._sources.values())
+
+    def __contains__(self, source_id: str) -> bool:
+        return source_id in self._sources
+
+    def get(self, source_id: str) -> Optional[Dict[str, Any]]:
+        """The source with this id, if any."""
+        return self._sources.get(source_id)
+
+    def for_domain(self, domain: str) -> List[Dict[str, Any]]:
+        """Sources hosted on a domain."""
+        domain = domain.lower()
+        domain = domain[4:] if domain.startswith("www.") else domain
+        return [self._sources[sid] for sid in self._by_domain.get(domain, [])]
+
+    def in_tier(self, tier: str) -> List[Dict[str, Any]]:
+        """Sources in a tier, in registry order."""
+        return [self._sources[sid] for sid in self._by_tier.get(tier, [])]
+
+    def find(self, name: str) -> Optional[Dict[str, Any]]:
+        """The source a result or article names."""
+        sid = self._by_name.get(name)
+        return self._sources.get(sid) if sid else self._sources.get(name)
+
+    def add(self, source: Dict[str, Any], tier: Optional[str] = None, store: bool = False) -> Dict[str, Any]:
+        """Register a source (a copy carrying id, tier and priority) and return it.
+
+        A configured source keeps its place over an imported one with the same id.
+        """
+        entry = dict(source)
+        entry["id"] = source_id(entry)
+        if not entry.get("name"):
+            entry["name"] = source_domain(entry) or entry["id"]
+        entry["tier"] = entry.get("tier") or tier or DEFAULT_TIER
+        if entry["tier"] not in TIERS:
+            logger.warning(f"Unknown tier {entry['tier']!r} for {entry['name']}, using {DEFAULT_TIER}")
+            entry["tier"] = DEFAULT_TIER
+        entry["priority"] = entry.get("priority") or DEFAULT_PRIORITY
+        if entry["priority"] not in PRIORITY_RANKS:
+            logger.warning(f"Unknown priority {entry['priority']!r} for {entry['name']}, using {DEFAULT_PRIORITY}")
+            entry["priority"] = DEFAULT_PRIORITY
+
+        sid = entry["id"]
+        if sid in self._configured:
+            if store:
+                self._stored[sid] = entry
+            return self._sources[sid]
+
+        previous = self._sources.get(sid)
+        if previous is not None:
+            if _fetch_url(previous) != _fetch_url(entry):
+                logger.warning(
+                    f"Duplicate source id {sid!r}; {entry['name']} ({_fetch_url(entry)}) "
+                    f"replaces {previous['name']} ({_fetch_url(previous)})"
+                )
+            self._by_domain[source_domain(previous)].remove(sid)
+            self._by_name.pop(previous["name"], None)
+        if self._by_name.get(entry["name"], sid) != sid:
+            # Results, history and reports refer to sources by name, so names stay unique
+            entry["name"] = f"{entry['name']} ({source_domain(entry) or sid})"
+        if store:
+            self._stored[sid] = entry
+        self._sources[sid] = entry
+        self._by_domain.setdefault(source_domain(entry), []).append(sid)
+        self._by_name[entry["name"]] = sid
+        if previous is None:
+            self._by_tier.setdefault(entry["tier"], []).append(sid)
+        elif previous["tier"] != entry["tier"]:
+            self._by_tier[previous["tier"]].remove(sid)
+            # The entry keeps its predecessor's place in the registry, so its new tier is re-read in order
+            tier = entry["tier"]
+            self._by_tier[tier] = [other for other, known in self._sources.items() if known["tier"] == tier]
+        return entry
+
+    def import_file(self, path: str, tier: Optional[str] = None, priority: Optional[str] = None) -> Dict[str, int]:
+        """Add the sources of an OPML or CSV file to the registry and return import counts.
+
+        Entries without an explicit id are keyed by feed_id(). `tier` and `priority` apply
+        to entries that do not set their own. The counts are: read, added, updated (same id
+        and URL as a known source), collisions (same id, different URL; the later entry wins)
+        and configured (ids a configured source already holds; kept as configured).
+        """
+        path = Path(path)
+        if path.suffix.lower() == ".csv":
+            sources = iter_csv(path.read_text(encoding="utf-8-sig"))
+        else:
+            sources = iter_opml(path.read_bytes())
+
+        counts = {"read": 0, "added": 0, "updated": 0, "collisions": 0, "configured": 0}
+        for source in sources:
+            if priority and not source.get("priority"):
+                source["priority"] = priority
+            source["id"] = source.get("id") or feed_id(source)
+            previous = self._sources.get(source["id"])
+            if source["id"] in self._configured:
+                counts["configured"] += 1
+            elif previous is None:
+                counts["added"] += 1
+            elif _fetch_url(previous) == _fetch_url(source):
+                counts["updated"] += 1
+            else:
+                counts["collisions"] += 1
+            self.add(source, tier, store=True)
+            counts["read"] += 1
+        logger.info(
+            f"Imported {counts['read']} sources from {path}: {counts['added']} new, {counts['updated']} updated, "
+            f"{counts['collisions']} id collisions, {counts['configured']} already configured"
+        )
+        return counts
+
+    def load(self):
+        """Load imported sources from the registry file."""
+        stored = load_json(self.path, "source registry") if self.path else None
+        for source in (stored or {}).get("sources", []):
+            self.add(source, store=True)
+
+    def save(self):
+        """Persist imported sources to the registry file."""
+        if not self.path:
+            raise ValueError("No registry file configured (sources.registry)")
+        save_json(self.path, {"sources": list(self._stored.values())})
@@ -0,0 +1,153 @@
+"""
+Config-driven retry policy with a run-wide retry budget and per-source deadlines.
+"""
+
+import threading
+import time
+from functools import partial
+from typing import Callable, Dict, Any, Optional, Union
+
+from loguru import logger
+from tenacity import AsyncRetrying, Retrying, RetryCallState, retry_if_exception, stop_after_attempt, wait_exponential
+
+from src.core.cache import NotModified
+
+# Client errors worth retrying; every other 4xx is treated as permanent
+RETRYABLE_CLIENT_ERRORS = (408, 429)
+
+# An absolute deadline, or a callable returning one for a deadline that starts later
+Deadline = Union[float, Callable[[], Optional[float]], None]
+
+
+class RetryBudgetExhausted(Exception):
+    """Raised when a retry is needed but the run-wide retry budget is spent."""
+
+
+class DeadlineExceeded(Exception):
+    """Raised when a source's wall-clock deadline would be overrun."""
+
+
+class RetryLater(Exception):
+    """Raised instead of retrying in place so the scheduler can requeue the work."""
+
+
+class RetryBudget:
+    """Caps retries per run to a fraction of first attempts."""
+
+    def __init__(self, ratio: float = 0.1, min_retries: int = 3):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Start a fresh budget for a new run."""
+        self.requests = 0
+        self.retries = 0
+        self.denied = 0
+
+    def record_request(self):
+        """Count a first attempt, which grows the budget."""
+        with self._lock:
+            self.requests += 1
+
+    def try_spend(self) -> bool:
+        """Reserve one retry, returning False when the budget is exhausted."""
+        with self._lock:
+            if self.retries + 1 > max(self.min_retries, self.ratio * self.requests):
+                self.denied += 1
+                return False
+            self.retries += 1
+            return True
+
+    def summary(self) -> Dict[str, Any]:
+        """Return per-run retry counters."""
+        return {"requests": self.requests, "retries": self.retries, "denied": self.denied}
+
+
+class RetryPolicy:
+    """Builds tenacity retry loops from configuration, gated by budget and deadline."""
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 2,
+        max_backoff: float = 30,
+        budget: Optional[RetryBudget] = None,
+    ):
+        self.max_attempts = max(1, max_retries)
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.budget = budget
+
+    @classmethod
+    def from_config(cls, scraping_config: Dict[str, Any]) -> "RetryPolicy":
+        """Create a policy from the scraping section of the configuration."""
+        return cls(
+            max_retries=scraping_config.get("max_retries", 3),
+            backoff_factor=scraping_config.get("retry_backoff_factor", 2),
+            max_backoff=scraping_config.get("retry_max_backoff", 30),
+            budget=RetryBudget(
+                ratio=scraping_config.get("retry_budget_ratio", 0.1),
+                min_retries=scraping_config.get("retry_budget_min", 3),
+            ),
+        )
+
+    def retrying(self, deadline: Optional[float] = None) -> Retrying:
+        """Return a synchronous retry loop for one request."""
+        return Retrying(**self._retry_kwargs(deadline))
+
+    def async_retrying(self, deadline: Deadline = None) -> AsyncRetrying:
+        """Return an asyncio retry loop for one request.
+
+        `deadline` may be a callable, read before each retry, for a deadline
+        that only starts once the first attempt is under way.
+        """
+        return AsyncRetrying(**self._retry_kwargs(deadline))
+
+    def record_request(self):
+        """Count a first attempt against the retry budget."""
+        if self.budget:
+            self.budget.record_request()
+
+    def _retry_kwargs(self, deadline: Deadline) -> Dict[str, Any]:
+        self.record_request()
+        return {
+            "stop": stop_after_attempt(self.max_attempts),
+            "wait": wait_exponential(multiplier=self.backoff_factor, max=self.max_backoff),
+            "retry": retry_if_exception(self.is_retryable),
+            "before_sleep": partial(self._authorize_retry, deadline),
+            "reraise": True,
+        }
+
+    def backoff(self, attempt: int) -> float:
+        """Seconds to wait after the given (1-based) failed attempt."""
+        return min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+
+    @staticmethod
+    def is_retryable(exc: BaseException) -> bool:
+        """Transient network errors, 5xx, 408 and 429 are retried; other failures are not."""
+        if isinstance(exc, (NotModified, RetryBudgetExhausted, DeadlineExceeded)):
+            return False
+
+        response = getattr(exc, "response", None)
+        status = getattr(response, "status_code", None) or getattr(exc, "status", None)
+        if isinstance(status, int) and 400 <= status < 500:
+            return status in RETRYABLE_CLIENT_ERRORS
+        return True
+
+    def authorize_retry(self, wait: float, deadline: Optional[float] = None):
+        """Raise unless a retry after `wait` seconds fits the deadline and the budget."""
+        if deadline is not None and time.time() + wait > deadline:
+            raise DeadlineExceeded(f"retry in {wait:.1f}s would overrun the source deadline")
+
+        if self.budget and not self.budget.try_spend():
+            raise RetryBudgetExhausted("run-wide retry budget exhausted")
+
+    def _authorize_retry(self, deadline: Deadline, retry_state: RetryCallState):
+        wait = retry_state.next_action.sleep
+        self.authorize_retry(wait, deadline() if callable(deadline) else deadline)
+        logger.warning(
+            f"Retrying in {wait:.1f}s (attempt {retry_state.attempt_number + 1}/{self.max_attempts}): "
+            f"{retry_state.outcome.exception()}"
+        )
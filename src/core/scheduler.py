@@ -0,0 +1,236 @@
+"""
+Per-domain work scheduler for the threaded engine.
+
+Workers ask the scheduler for their next item instead of sleeping inside
+RateLimiter.wait, so a worker is only ever handed work for a domain whose
+politeness delay has already elapsed. Among ready domains, the one whose
+next item has the best priority key goes first. Failed items can be parked
+on a time-ordered delay queue so retry backoff never pins a worker.
+
+Also holds the source ordering and run-wide time budget shared by both
+engines.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, Callable, Collection, Deque, Dict, List, Optional, Set, Tuple
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from src.core.scraper import RateLimiter
+
+PRIORITY_RANKS = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+
+
+def priority_rank(source: Dict[str, Any]) -> int:
+    """Rank a source by its configured priority, lower first."""
+    return PRIORITY_RANKS.get(source.get("priority", "medium"), PRIORITY_RANKS["medium"])
+
+
+def order_sources(
+    sources: List[Dict[str, Any]],
+    latency_for: Callable[[Dict[str, Any]], Optional[float]],
+    deferred: Collection[str] = (),
+) -> List[Dict[str, Any]]:
+    """Sort sources by priority, then those deferred last run, then historical latency.
+
+    Sources without latency history sort as fastest so they are measured early.
+    Ties keep configuration (tier) order.
+    """
+    return sorted(
+        sources,
+        key=lambda source: (
+            priority_rank(source),
+            source.get("name") not in deferred,
+            latency_for(source) or 0.0,
+        ),
+    )
+
+
+class RunBudget:
+    """Run-wide time budget; once spent, sources outside the exempt priorities are deferred."""
+
+    def __init__(self, seconds: Optional[float] = None, exempt_priorities: Collection[str] = ("critical",)):
+        self.seconds = seconds
+        self.exempt_priorities = set(exempt_priorities)
+        self.deadline: Optional[float] = None
+
+    def start(self):
+        """Start the clock for a new run."""
+        self.deadline = time.time() + self.seconds if self.seconds else None
+
+    def applies_to(self, source: Dict[str, Any]) -> bool:
+        """Whether the budget limits this source at all."""
+        return self.deadline is not None and source.get("priority", "medium") not in self.exempt_priorities
+
+    def exhausted(self) -> bool:
+        """Whether the run's time budget has been spent."""
+        return self.deadline is not None and time.time() >= self.deadline
+
+    def should_defer(self, source: Dict[str, Any]) -> bool:
+        """Whether a source not yet finished should be left for the next run."""
+        return self.applies_to(source) and self.exhausted()
+
+    def cap_deadline(self, source: Dict[str, Any], deadline: Optional[float]) -> Optional[float]:
+        """Shorten a source's deadline so it cannot outlive the run budget."""
+        if not self.applies_to(source):
+            return deadline
+        return self.deadline if deadline is None else min(deadline, self.deadline)
+
+    def deferred_result(self, source: Dict[str, Any], attempts: int = 0, backoff_seconds: float = 0.0) -> Dict[str, Any]:
+        """Build the result for a source left for the next run."""
+        logger.info(f"Deferring {source.get('name')} to the next run: run time budget exhausted")
+        return {
+            "source": source.get("name"),
+            "status": "deferred",
+            "articles": [],
+            "url": source.get("url"),
+            "priority": source.get("priority", "medium"),
+            "error": "run time budget exhausted",
+            "attempts": attempts,
+            "backoff_seconds": round(backoff_seconds, 3),
+        }
+
+
+class DomainScheduler:
+    """Hands workers items for ready domains, sleeping only when every domain is cooling down.
+
+    `priority` maps an item to a sort key; among ready domains, the one whose
+    next item has the lowest key is served first.
+    """
+
+    def __init__(self, rate_limiter: "RateLimiter", priority: Optional[Callable[[Any], Any]] = None):
+        self.rate_limiter = rate_limiter
+        self.priority = priority
+        self._queues: Dict[str, Deque[Any]] = {}
+        self._ready_heap: List[Tuple[float, str]] = []
+        self._runnable: List[Tuple[Any, int, str]] = []
+        self._scheduled: Set[str] = set()
+        self._busy: Set[str] = set()
+        self._delayed: List[Tuple[float, int, str, Any]] = []
+        self._sequence = itertools.count()
+        self._outstanding = 0
+        self._cond = threading.Condition()
+
+    def submit(self, domain: str, item: Any):
+        """Queue an item for a domain."""
+        with self._cond:
+            self._queues.setdefault(domain, deque()).append(item)
+            self._outstanding += 1
+            self._schedule(domain)
+            self._cond.notify()
+
+    def submit_later(self, domain: str, item: Any, delay: float):
+        """Queue an item for a domain once `delay` seconds have passed.
+
+        Call before task_done for the failed attempt so the scheduler never
+        briefly looks drained while a retry is pending.
+        """
+        with self._cond:
+            heapq.heappush(self._delayed, (time.time() + delay, next(self._sequence), domain, item))
+            self._outstanding += 1
+            self._cond.notify()
+
+    def next_item(self) -> Optional[Tuple[str, Any]]:
+        """Block until some domain is ready and return (domain, item), or None when all work is done.
+
+        The returned domain is marked busy until task_done is called, so at
+        most one request per domain is in flight.
+        """
+        with self._cond:
+            while True:
+                if self._outstanding == 0:
+                    return None
+
+                now = time.time()
+                self._release_due_retries(now)
+                self._promote_ready(now)
+                retry_at = self._delayed[0][0] if self._delayed else None
+
+                if not self._runnable:
+                    if not self._ready_heap:
+                        self._cond.wait(timeout=retry_at - now if retry_at else None)
+                        continue
+
+                    ready_at = self._ready_heap[0][0]
+                    wake_at = min(ready_at, retry_at) if retry_at else ready_at
+                    logger.debug(f"All domains cooling down, sleeping {wake_at - now:.2f}s")
+                    self._cond.wait(timeout=wake_at - now)
+                    continue
+
+                _, _, domain = heapq.heappop(self._runnable)
+                self._scheduled.discard(domain)
+                if not self._queues[domain]:
+                    continue
+
+                # The limiter is authoritative; its deadline may have moved since we scheduled
+                wait_time = self.rate_limiter.time_until_ready(domain)
+                if wait_time > 0:
+                    self._push(domain, now + wait_time)
+                    continue
+
+                self._busy.add(domain)
+                return domain, self._queues[domain].popleft()
+
+    def task_done(self, domain: str):
+        """Release a domain after its item has been processed."""
+        with self._cond:
+            self._busy.discard(domain)
+            self._outstanding -= 1
+            self._schedule(domain)
+            self._cond.notify_all()
+
+    def cancel(self, predicate: Callable[[Any], bool]) -> List[Any]:
+        """Remove and return every queued or delayed item matching predicate.
+
+        Items already handed to a worker are not affected.
+        """
+        cancelled = []
+        with self._cond:
+            for queue in self._queues.values():
+                keep = deque(item for item in queue if not predicate(item))
+                cancelled.extend(item for item in queue if predicate(item))
+                queue.clear()
+                queue.extend(keep)
+
+            delayed = [entry for entry in self._delayed if not predicate(entry[3])]
+            cancelled.extend(entry[3] for entry in self._delayed if predicate(entry[3]))
+            heapq.heapify(delayed)
+            self._delayed = delayed
+
+            self._outstanding -= len(cancelled)
+            self._cond.notify_all()
+        return cancelled
+
+    def _release_due_retries(self, now: float):
+        """Move delayed items whose backoff has passed to the front of their domain queue."""
+        while self._delayed and self._delayed[0][0] <= now:
+            _, _, domain, item = heapq.heappop(self._delayed)
+            self._queues.setdefault(domain, deque()).appendleft(item)
+            self._schedule(domain)
+
+    def _promote_ready(self, now: float):
+        """Move domains whose delay has elapsed onto the priority-ordered runnable heap."""
+        while self._ready_heap and self._ready_heap[0][0] <= now:
+            _, domain = heapq.heappop(self._ready_heap)
+            queue = self._queues.get(domain)
+            if not queue:
+                # Emptied by cancel() while waiting for its delay
+                self._scheduled.discard(domain)
+                continue
+            key = self.priority(queue[0]) if self.priority else 0
+            heapq.heappush(self._runnable, (key, next(self._sequence), domain))
+
+    def _schedule(self, domain: str):
+        """Put a domain on the ready heap if it has queued work and is idle."""
+        if domain in self._busy or domain in self._scheduled or not self._queues.get(domain):
+            return
+        self._push(domain, time.time() + self.rate_limiter.time_until_ready(domain))
+
+    def _push(self, domain: str, ready_at: float):
+        heapq.heappush(self._ready_heap, (ready_at, domain))
+        self._scheduled.add(domain)
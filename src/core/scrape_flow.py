@@ -0,0 +1,391 @@
+"""
+Engine-agnostic source scraping.
+
+Both engines reach a source the same way: its feed when feed_first is on,
+else the pages its sitemap lists as changed, else its listing page and any
+further pages, then each article's own page for full-article sources.
+ScrapeFlow holds that logic once, as generators that yield the I/O they
+need (Fetch, FetchEach, Parse, ParseFeed) and are sent back its outcome,
+or have its exception raised at the yield. The threaded engine drives them
+with blocking calls through `run`, the async engine with awaits through
+`run_async`; validators, snapshots, watermarks and result dicts are
+handled here for both.
+"""
+
+import hashlib
+import json
+from typing import Any, Awaitable, Callable, Dict, Generator, List, Optional, Union
+
+from loguru import logger
+from lxml import etree
+
+from src.core.cache import NotModified
+from src.core.pagination import Paginator
+from src.core.retry_policy import DeadlineExceeded, RetryBudgetExhausted
+from src.core.sitemap import SitemapDiscovery
+
+Content = Optional[Union[str, bytes, etree._Element]]
+
+
+class Fetch:
+    """A GET the flow needs; the outcome is the body, or bytes with raw=True.
+
+    `mode` says how the engine makes it: ONCE is a single attempt, FIRST is
+    the source's first request (its retries count towards the result, and
+    the threaded engine may defer them to its scheduler), RETRY retries inline.
+    """
+
+    ONCE = "once"
+    FIRST = "first"
+    RETRY = "retry"
+
+    def __init__(self, url: str, mode: str, raw: bool = False):
+        self.url = url
+        self.mode = mode
+        self.raw = raw
+
+
+class FetchEach:
+    """Article pages to fetch with retries, at most `limit` at a time, without recording them.
+
+    `links` maps a key to the URL to fetch; each outcome is passed to
+    `handle(key, content, error)` as soon as it arrives.
+    """
+
+    def __init__(
+        self,
+        links: Dict[str, str],
+        limit: int,
+        handle: Callable[[str, Content, Optional[Exception]], None],
+    ):
+        self.links = links
+        self.limit = limit
+        self.handle = handle
+
+
+class Parse:
+    """Articles to extract from a fetched page with a source's selectors."""
+
+    def __init__(self, source: Dict[str, Any], content: Content, url: str):
+        self.source = source
+        self.content = content
+        self.url = url
+
+
+class ParseFeed:
+    """Entries to read from a fetched feed, only those newer than `since` if given."""
+
+    def __init__(self, content: bytes, url: str, since: Optional[str]):
+        self.content = content
+        self.url = url
+        self.since = since
+
+
+Step = Union[Fetch, FetchEach, Parse, ParseFeed]
+Flow = Generator[Step, Any, Any]
+
+
+def run(flow: Flow, perform: Callable[[Step], Any]) -> Any:
+    """Drive a flow to completion with a blocking `perform`, returning its value."""
+    outcome, error = None, None
+    while True:
+        try:
+            step = flow.send(outcome) if error is None else flow.throw(error)
+        except StopIteration as stop:
+            return stop.value
+        try:
+            outcome, error = perform(step), None
+        except Exception as e:
+            outcome, error = None, e
+
+
+async def run_async(flow: Flow, perform: Callable[[Step], Awaitable[Any]]) -> Any:
+    """Drive a flow to completion with an awaitable `perform`, returning its value."""
+    outcome, error = None, None
+    while True:
+        try:
+            step = flow.send(outcome) if error is None else flow.throw(error)
+        except StopIteration as stop:
+            return stop.value
+        try:
+            outcome, error = await perform(step), None
+        except Exception as e:
+            outcome, error = None, e
+
+
+class ScrapeFlow:
+    """The steps that scrape one source.
+
+    `engine` is the CompetitorScraper or AsyncScrapeEngine driving the flow;
+    its validator cache, snapshot store, history, watermarks, full-article
+    fetcher, run budget, feed_first and parser settings are used.
+    """
+
+    def __init__(self, engine: Any, source: Dict[str, Any]):
+        self.source = source
+        self.name = source.get("name")
+        self.http_cache = engine.http_cache
+        self.snapshots = engine.snapshots
+        self.history = engine.history
+        self.watermarks = engine.watermarks
+        self.feed_watermarks = engine.feed_watermarks
+        self.full_articles = engine.full_articles
+        self.run_budget = engine.run_budget
+        self.feed_first = engine.feed_first
+        self.parser_engine = engine.parser_engine
+        self.scoped_parsing = engine.scoped_parsing
+
+    def scrape(self) -> Flow:
+        """Scrape the source, returning its result dict without attempt counts."""
+        source = self.source
+        articles = None
+        if self.feed_first and source.get("rss"):
+            articles = yield from self.read_feed()
+        if articles is not None:
+            logger.success(f"Read {len(articles)} articles from the feed of {self.name}")
+            result = self.result(articles, source.get("rss"))
+        elif self.watermarks and SitemapDiscovery.enabled(source):
+            articles = yield from self.discover_sitemap()
+            logger.success(f"Found {len(articles)} new or changed articles in the sitemap of {self.name}")
+            result = self.result(articles, source.get("url"))
+        else:
+            result = yield from self.scrape_listing()
+
+        if result["status"] == "success" and self.full_articles and self.full_articles.enabled(source):
+            yield from self.fetch_full_articles(result["articles"])
+        return result
+
+    def result(self, articles: List[Dict[str, Any]], url: Optional[str]) -> Dict[str, Any]:
+        """A successful result for the source."""
+        return {
+            "source": self.name,
+            "status": "success",
+            "articles": articles,
+            "url": url,
+            "priority": self.source.get("priority", "medium"),
+        }
+
+    def fingerprint(self, source: Dict[str, Any]) -> str:
+        """Identify how pages are parsed for `source`: its selector plan and the parser that runs it."""
+        plan = {
+            "selectors": source.get("selectors", {}),
+            "structured": source.get("structured"),
+            "parser": source.get("parser", self.parser_engine),
+            "scoped": source.get("scoped_parse", self.scoped_parsing),
+        }
+        return hashlib.sha256(json.dumps(plan, sort_keys=True, default=str).encode()).hexdigest()
+
+    def check_fingerprint(self, url: str, source: Dict[str, Any]) -> str:
+        """Return the fingerprint for a page parsed with `source`, dropping any cache entry made under another."""
+        fingerprint = self.fingerprint(source)
+        if self.http_cache:
+            self.http_cache.check_fingerprint(url, fingerprint)
+        return fingerprint
+
+    def error_result(self, error: Exception) -> Dict[str, Any]:
+        """The result of a scrape that raised `error`; a source out of time may be deferred instead."""
+        name = self.name
+        if isinstance(error, DeadlineExceeded):
+            if self.run_budget.should_defer(self.source):
+                return self.run_budget.deferred_result(self.source)
+            logger.error(f"Deadline exceeded for {name}: {error}")
+            return {"source": name, "status": "deadline_exceeded", "articles": [], "error": str(error)}
+        if isinstance(error, RetryBudgetExhausted):
+            logger.error(f"Giving up on {name}: {error}")
+            return {"source": name, "status": "retry_budget_exhausted", "articles": [], "error": str(error)}
+        logger.error(f"Failed to scrape {name}: {error}")
+        return {"source": name, "status": "failed", "articles": [], "error": str(error)}
+
+    @staticmethod
+    def finish(result: Dict[str, Any], fetch_stats: Dict[str, Any]) -> Dict[str, Any]:
+        """Add the first request's attempt count and backoff time to a result."""
+        result["attempts"] = fetch_stats.get("attempts", 1)
+        result["backoff_seconds"] = round(fetch_stats.get("backoff_seconds", 0.0), 3)
+        return result
+
+    def scrape_listing(self) -> Flow:
+        """Extract the listing page, and further pages for paginated sources."""
+        name = self.name
+        url = self.source.get("url")
+        fingerprint = self.check_fingerprint(url, self.source)
+        try:
+            content = yield Fetch(url, Fetch.FIRST)
+        except NotModified:
+            articles = self.http_cache.record_not_modified(url)
+            if self.snapshots:
+                self.snapshots.index_not_modified(name, url)
+            logger.success(f"Reused {len(articles)} cached articles from {name}")
+            return self.result(articles, url)
+
+        if self.snapshots:
+            self.snapshots.index(name, url)
+        if content is None or content in ("", b""):
+            return {"source": name, "status": "failed", "articles": [], "error": "No content fetched"}
+
+        articles = yield Parse(self.source, content, url)
+        if self.http_cache:
+            self.http_cache.store_articles(url, articles, fingerprint)
+        pages = 1
+        if self.history and Paginator.enabled(self.source):
+            more, pages = yield from self.follow_pages(content, articles)
+            articles = articles + more
+
+        logger.success(f"Scraped {len(articles)} articles from {name}")
+        result = self.result(articles, url)
+        if pages > 1:
+            result["pages"] = pages
+        return result
+
+    def read_feed(self) -> Flow:
+        """Fetch and parse the source's RSS/Atom feed from bytes.
+
+        Returns None when the feed cannot be fetched or lists nothing, so the
+        source falls back to its listing page (which has its own retries).
+        With feed watermarks, only entries newer than the last run's are returned.
+        """
+        name = self.name
+        feed_url = self.source.get("rss")
+        try:
+            content = yield Fetch(feed_url, Fetch.ONCE, raw=True)
+        except NotModified:
+            articles = self.http_cache.record_not_modified(feed_url)
+            if self.snapshots:
+                self.snapshots.index_not_modified(name, feed_url)
+            return articles
+        except DeadlineExceeded:
+            raise
+        except Exception as e:
+            logger.warning(f"Feed for {name} failed, falling back to HTML: {e}")
+            return None
+
+        if self.snapshots:
+            self.snapshots.index(name, feed_url)
+        since = self.feed_watermarks.since(feed_url) if self.feed_watermarks else None
+        articles = (yield ParseFeed(content, feed_url, since)) if content else []
+        if not articles and (since is None or not content):
+            logger.warning(f"No entries in the feed for {name}, falling back to HTML")
+            return None
+        if self.feed_watermarks:
+            self.feed_watermarks.record(feed_url, articles)
+        if self.http_cache:
+            # Past the watermark, an unchanged feed has nothing new to report
+            self.http_cache.store_articles(feed_url, [] if self.feed_watermarks else articles)
+        return articles
+
+    def follow_pages(self, content: Content, articles: List[Dict[str, Any]]) -> Flow:
+        """Fetch further listing pages until one holds an article already in history.
+
+        Returns the articles of the extra pages and the number of pages read.
+        A failed page ends pagination but keeps what was already collected.
+        """
+        name = self.name
+        paginator = Paginator(self.source, self.history)
+        page_url = self.source.get("url")
+        collected = []
+        page = 1
+        while paginator.should_continue(page, articles):
+            next_url = paginator.next_url(page, content, page_url)
+            if not next_url:
+                break
+            fingerprint = self.check_fingerprint(next_url, self.source)
+            try:
+                content = yield Fetch(next_url, Fetch.RETRY)
+            except NotModified:
+                self.http_cache.record_not_modified(next_url)
+                break
+            except Exception as e:
+                logger.warning(f"Stopped paginating {name} at {next_url}: {e}")
+                break
+            if self.snapshots:
+                self.snapshots.index(name, next_url)
+            if content is None or content in ("", b""):
+                break
+
+            articles = yield Parse(self.source, content, next_url)
+            if self.http_cache:
+                self.http_cache.store_articles(next_url, articles, fingerprint)
+            collected.extend(articles)
+            page_url = next_url
+            page += 1
+
+        if page > 1:
+            logger.info(f"Followed {page - 1} more listing pages for {name}")
+        return collected, page
+
+    def discover_sitemap(self) -> Flow:
+        """Fetch and extract the pages the source's sitemap lists as new or changed since the last run.
+
+        Failing to fetch the root sitemap fails the source; a child sitemap
+        or page that fails is skipped and retried on the next run.
+        """
+        discovery = SitemapDiscovery(self.source, self.watermarks)
+        content = yield from self.fetch_sitemap(discovery.url, Fetch.FIRST)
+        if content:
+            discovery.read(content)
+
+        for sitemap_url, lastmod in discovery.pending_sitemaps():
+            try:
+                content = yield from self.fetch_sitemap(sitemap_url, Fetch.RETRY)
+            except Exception as e:
+                discovery.failed(sitemap_url, e)
+                continue
+            if content:
+                discovery.read(content, sitemap_url, lastmod)
+
+        articles = []
+        for loc, lastmod in discovery.changed_pages():
+            fingerprint = self.check_fingerprint(loc, discovery.page_source)
+            try:
+                content = yield Fetch(loc, Fetch.RETRY)
+            except NotModified:
+                page_articles = self.http_cache.record_not_modified(loc)
+            except Exception as e:
+                discovery.failed(loc, e)
+                continue
+            else:
+                if self.snapshots:
+                    self.snapshots.index(self.name, loc)
+                page_articles = (yield Parse(discovery.page_source, content, loc)) if content else []
+                if self.http_cache:
+                    self.http_cache.store_articles(loc, page_articles, fingerprint)
+
+            article = discovery.article(page_articles, loc, lastmod)
+            if article:
+                articles.append(article)
+            discovery.done(loc, lastmod)
+
+        discovery.finish()
+        if self.http_cache and discovery.complete:
+            # Sitemap validators are only kept once nothing they list is left to fetch
+            for sitemap_url, _ in discovery.sitemaps_read:
+                self.http_cache.store_articles(sitemap_url, [])
+        return articles
+
+    def fetch_sitemap(self, url: str, mode: str) -> Flow:
+        """Fetch one sitemap document, returning None when it is unchanged since the last run."""
+        try:
+            content = yield Fetch(url, mode, raw=True)
+        except NotModified:
+            self.http_cache.record_not_modified(url)
+            if self.snapshots:
+                self.snapshots.index_not_modified(self.name, url)
+            return None
+        if self.snapshots:
+            self.snapshots.index(self.name, url)
+        return content
+
+    def fetch_full_articles(self, articles: List[Dict[str, Any]]) -> Flow:
+        """Fetch the uncached article pages and update articles in place."""
+        selector = self.full_articles.selector_for(self.source)
+        pending = self.full_articles.plan(articles, selector)
+        if not pending:
+            return
+
+        def handle(url: str, content: Content, error: Optional[Exception]):
+            if error is not None:
+                self.full_articles.failed(url, error)
+            else:
+                self.full_articles.store(url, pending[url], content, selector)
+
+        links = {url: group[0]["link"] for url, group in pending.items()}
+        yield FetchEach(links, self.full_articles.max_per_source, handle)
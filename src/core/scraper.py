@@ -6,77 +6,218 @@ intelligent rate limiting, and anti-detection mechanisms.
 import time
 import random
 import hashlib
-from typing import Dict, List, Optional, Any
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple, Union
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from urllib.parse import urlparse
+from pathlib import Path
+from urllib.parse import urljoin, urlparse
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer, UnicodeDammit
 from loguru import logger
-from tenacity import retry, stop_after_attempt, wait_exponential
+from lxml import etree
+
+from src.core.cache import NotModified, ValidatorCache
+from src.core.feeds import FeedWatermarks
+from src.core.history import ArticleHistory
+from src.core.http_pool import DNSCache, PooledHTTPAdapter
+from src.core.pagination import Paginator
+from src.core.profiling import ExtractionProfiler, PageProfile, ProfiledPlan
+from src.core.rate_control import THROTTLE_STATUS_CODES, AdaptiveRateController, parse_retry_after
+from src.core.registry import SourceRegistry
+from src.core.retry_policy import DeadlineExceeded, RetryBudgetExhausted, RetryLater, RetryPolicy
+from src.core.scheduler import DomainScheduler, RunBudget, order_sources
+from src.core.scrape_flow import Fetch, FetchEach, ParseFeed, ScrapeFlow, Step, run as run_flow
+from src.core.selectors import RegionTarget, SelectorPlan, compile_plan
+from src.core.sitemap import SitemapDiscovery, SitemapWatermarks
+from src.core.snapshots import SnapshotStore
+from src.core.streaming import (
+    DEFAULT_MAX_RESPONSE_BYTES,
+    STREAM_CHUNK_SIZE,
+    IncrementalHTMLParser,
+    charset_from_content_type,
+)
+from src.core.structured import StructuredExtractor
+from src.processors.content_processor import RSSFeedProcessor
+from src.utils.json_store import load_json, save_json
+
+
+# Extraction engines: BeautifulSoup + soupsieve, or compiled XPath straight on an lxml tree
+PARSER_ENGINES = ("soup", "lxml")
+
+# Article fields the lxml engine matches once per document
+TREE_FIELDS = ("title", "date", "content")
+
+# Backoff applied on 429/503 when the server sends no Retry-After and rate control is off
+DEFAULT_THROTTLE_BACKOFF = 10.0
+
+DEFAULT_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate, br",
+    "DNT": "1",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+}
 
 
 class SessionManager:
     """Manages HTTP sessions with rotation and persistence."""
 
-    def __init__(self, user_agents: List[str]):
+    def __init__(self, user_agents: List[str], pool_size: int = 10, max_sessions: int = 256, dns_ttl: float = 300):
         self.user_agents = user_agents
-        self.sessions: Dict[str, requests.Session] = {}
+        self.pool_size = pool_size
+        self.max_sessions = max_sessions
+        self.sessions: "OrderedDict[str, requests.Session]" = OrderedDict()
+        self._retired_stats = {"requests": 0, "connections": 0, "tls_requests": 0, "tls_handshakes": 0}
+        self._lock = threading.Lock()
+        self.dns_cache = DNSCache(ttl=dns_ttl)
 
     def get_session(self, domain: str) -> requests.Session:
         """Get or create a session for a specific domain."""
-        if domain not in self.sessions:
+        with self._lock:
+            if domain in self.sessions:
+                self.sessions.move_to_end(domain)
+                return self.sessions[domain]
+
             session = requests.Session()
             session.headers.update(self._get_random_headers())
+            adapter = PooledHTTPAdapter(pool_connections=4, pool_maxsize=self.pool_size, dns_cache=self.dns_cache)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
             self.sessions[domain] = session
             logger.debug(f"Created new session for domain: {domain}")
-        return self.sessions[domain]
+
+            # Close least recently used sessions beyond the limit
+            while len(self.sessions) > self.max_sessions:
+                idle_domain, idle_session = self.sessions.popitem(last=False)
+                self._retire(idle_session)
+                logger.debug(f"Closed idle session for domain: {idle_domain}")
+
+            return session
 
     def _get_random_headers(self) -> Dict[str, str]:
         """Generate randomized request headers."""
-        return {
-            "User-Agent": random.choice(self.user_agents),
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate, br",
-            "DNT": "1",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-        }
+        return {"User-Agent": random.choice(self.user_agents), **DEFAULT_HEADERS}
 
     def rotate_user_agent(self, domain: str):
         """Rotate the user agent for a specific domain."""
-        if domain in self.sessions:
-            self.sessions[domain].headers["User-Agent"] = random.choice(self.user_agents)
-            logger.debug(f"Rotated user agent for domain: {domain}")
+        with self._lock:
+            if domain in self.sessions:
+                self.sessions[domain].headers["User-Agent"] = random.choice(self.user_agents)
+                logger.debug(f"Rotated user agent for domain: {domain}")
+
+    def connection_stats(self) -> Dict[str, Any]:
+        """Return connection reuse counters, including TLS handshakes saved."""
+        with self._lock:
+            stats = dict(self._retired_stats)
+            for session in self.sessions.values():
+                for key, value in self._session_stats(session).items():
+                    stats[key] += value
+
+        stats["reused"] = stats["requests"] - stats["connections"]
+        stats["tls_handshakes_saved"] = stats["tls_requests"] - stats["tls_handshakes"]
+        stats["dns_cache_hits"] = self.dns_cache.hits
+        stats["dns_cache_misses"] = self.dns_cache.misses
+        return stats
+
+    @staticmethod
+    def _session_stats(session: requests.Session) -> Dict[str, int]:
+        stats = {"requests": 0, "connections": 0, "tls_requests": 0, "tls_handshakes": 0}
+        # Both schemes share one adapter per session
+        for adapter in {id(a): a for a in session.adapters.values()}.values():
+            if isinstance(adapter, PooledHTTPAdapter):
+                for key, value in adapter.connection_stats().items():
+                    stats[key] += value
+        return stats
+
+    def _retire(self, session: requests.Session):
+        """Fold a session's counters into the totals and close it."""
+        for key, value in self._session_stats(session).items():
+            self._retired_stats[key] += value
+        session.close()
 
     def close_all(self):
         """Close all active sessions."""
-        for session in self.sessions.values():
-            session.close()
-        self.sessions.clear()
+        with self._lock:
+            for session in self.sessions.values():
+                self._retire(session)
+            self.sessions.clear()
         logger.info("All sessions closed")
 
 
 class RateLimiter:
     """Implements intelligent rate limiting with per-domain tracking."""
 
-    def __init__(self, min_delay: float = 2.0, max_delay: float = 5.0):
+    def __init__(
+        self,
+        min_delay: float = 2.0,
+        max_delay: float = 5.0,
+        controller: Optional[AdaptiveRateController] = None,
+        max_retry_after: float = 300.0,
+    ):
         self.min_delay = min_delay
         self.max_delay = max_delay
+        self.controller = controller
+        self.max_retry_after = max_retry_after
         self.last_request_time: Dict[str, float] = {}
+        self.next_allowed_time: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def time_until_ready(self, domain: str) -> float:
+        """Seconds until the next request to a domain is allowed (0 if ready now)."""
+        return max(0.0, self.next_allowed_time.get(domain, 0.0) - time.time())
 
     def wait(self, domain: str):
         """Wait before making a request to respect rate limits."""
-        if domain in self.last_request_time:
-            elapsed = time.time() - self.last_request_time[domain]
-            delay = random.uniform(self.min_delay, self.max_delay)
-            wait_time = max(0, delay - elapsed)
-            if wait_time > 0:
-                logger.debug(f"Rate limiting: waiting {wait_time:.2f}s for {domain}")
-                time.sleep(wait_time)
-
-        self.last_request_time[domain] = time.time()
+        while True:
+            wait_time = self._try_acquire(domain)
+            if wait_time <= 0:
+                return
+
+            logger.debug(f"Rate limiting: waiting {wait_time:.2f}s for {domain}")
+            time.sleep(wait_time)
+
+    def _try_acquire(self, domain: str) -> float:
+        """Claim the next request slot for a domain, or return the seconds until it is free."""
+        with self._lock:
+            wait_time = self.time_until_ready(domain)
+            if wait_time <= 0:
+                now = time.time()
+                self.last_request_time[domain] = now
+                self.next_allowed_time[domain] = now + self._next_delay(domain)
+            return wait_time
+
+    def _next_delay(self, domain: str) -> float:
+        """Draw the randomized delay before the following request to a domain."""
+        if self.controller:
+            return self.controller.delay_for(domain) + random.uniform(0, self.max_delay - self.min_delay)
+        return random.uniform(self.min_delay, self.max_delay)
+
+    def record_response(self, domain: str, status_code: int, latency: float, retry_after: Optional[str] = None):
+        """Feed a response back into the limiter, honouring Retry-After on throttling responses."""
+        if self.controller:
+            self.controller.record_response(domain, status_code, latency)
+
+        if status_code not in THROTTLE_STATUS_CODES:
+            return
+
+        penalty = parse_retry_after(retry_after)
+        if penalty is None:
+            penalty = self.controller.delay_for(domain) if self.controller else DEFAULT_THROTTLE_BACKOFF
+        elif penalty > self.max_retry_after:
+            logger.warning(f"Retry-After of {penalty:.0f}s from {domain} capped at {self.max_retry_after:.0f}s")
+            penalty = self.max_retry_after
+
+        self.penalize(domain, penalty)
+
+    def penalize(self, domain: str, seconds: float):
+        """Push a domain's next allowed request at least `seconds` into the future."""
+        with self._lock:
+            not_before = time.time() + seconds
+            self.next_allowed_time[domain] = max(self.next_allowed_time.get(domain, 0.0), not_before)
+        logger.info(f"Backing off {domain} for {seconds:.1f}s")
 
 
 class ContentFetcher:
@@ -88,20 +229,67 @@ class ContentFetcher:
         rate_limiter: RateLimiter,
         timeout: int = 30,
         max_retries: int = 3,
+        cache: Optional[ValidatorCache] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        stream: bool = False,
+        max_response_bytes: Optional[int] = DEFAULT_MAX_RESPONSE_BYTES,
+        snapshots: Optional[SnapshotStore] = None,
+        raw: bool = False,
     ):
         self.session_manager = session_manager
         self.rate_limiter = rate_limiter
         self.timeout = timeout
         self.max_retries = max_retries
-
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-        reraise=True,
-    )
-    def fetch(self, url: str) -> Optional[str]:
-        """Fetch content from a URL with retry logic."""
+        self.cache = cache
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=max_retries)
+        self.stream = stream
+        self.max_response_bytes = max_response_bytes
+        self.snapshots = snapshots
+        self.raw = raw
+
+    def fetch(
+        self,
+        url: str,
+        deadline: Optional[float] = None,
+        stats: Optional[Dict[str, Any]] = None,
+        raw: bool = False,
+        record: bool = True,
+    ) -> Optional[Union[str, bytes, etree._Element]]:
+        """Fetch content from a URL with retry logic.
+
+        Returns the page text (undecoded bytes with raw=True, here or on the
+        fetcher), or a parsed lxml document in streaming mode.
+        Raises NotModified when a cached validator is still current, and
+        DeadlineExceeded / RetryBudgetExhausted when retrying is not allowed.
+        If `stats` is given, it receives the attempt count and time spent in backoff.
+        With record=False the response is neither snapshotted nor given cache validators.
+        """
+        retrying = self.retry_policy.retrying(deadline)
+        try:
+            for attempt in retrying:
+                with attempt:
+                    return self.fetch_once(url, deadline, raw, record)
+        finally:
+            if stats is not None:
+                stats["attempts"] = retrying.statistics.get("attempt_number", 1)
+                stats["backoff_seconds"] = round(retrying.statistics.get("idle_for", 0.0), 3)
+
+    def fetch_once(
+        self, url: str, deadline: Optional[float] = None, raw: bool = False, record: bool = True
+    ) -> Optional[Union[str, bytes, etree._Element]]:
+        """Perform a single rate-limited GET without retrying."""
         domain = urlparse(url).netloc
+        stream = self.stream and not raw
+        cache = self.cache if record else None
+        snapshots = self.snapshots if record else None
+        headers = cache.conditional_headers(url) if cache else {}
+        timeout = self.timeout
+
+        if deadline is not None:
+            remaining = deadline - time.time() - self.rate_limiter.time_until_ready(domain)
+            if remaining <= 0:
+                raise DeadlineExceeded(f"no time left to fetch {url}")
+            timeout = min(timeout, remaining)
 
         try:
             # Apply rate limiting
@@ -111,17 +299,44 @@ class ContentFetcher:
             session = self.session_manager.get_session(domain)
             logger.info(f"Fetching: {url}")
 
-            response = session.get(url, timeout=self.timeout, allow_redirects=True)
-            response.raise_for_status()
+            start = time.time()
+            response = session.get(url, headers=headers, timeout=timeout, allow_redirects=True, stream=stream)
+            try:
+                self.rate_limiter.record_response(
+                    domain,
+                    response.status_code,
+                    time.time() - start,
+                    retry_after=response.headers.get("Retry-After") if response.status_code in THROTTLE_STATUS_CODES else None,
+                )
+                if response.status_code == 304 and headers:
+                    logger.info(f"Not modified since last run: {url}")
+                    raise NotModified(url)
+
+                response.raise_for_status()
+                if stream:
+                    content, size = self._read_stream(url, response, snapshots)
+                else:
+                    content = response.content if self.raw or raw else response.text
+                    size = len(response.content) if cache else 0
+                    if snapshots:
+                        snapshots.save(url, response.content, response.headers.get("Content-Type"))
+                if cache:
+                    cache.record_response(url, response.headers, size)
+            finally:
+                if stream:
+                    # Hands a fully read connection back to the pool, drops a truncated one
+                    response.close()
 
             logger.success(f"Successfully fetched: {url} (Status: {response.status_code})")
-            return response.text
+            return content
+
+        except NotModified:
+            raise
 
         except requests.exceptions.HTTPError as e:
             logger.error(f"HTTP error for {url}: {e}")
             if e.response.status_code == 429:
                 logger.warning(f"Rate limited by {domain}, increasing delay")
-                time.sleep(10)
             raise
 
         except requests.exceptions.Timeout:
@@ -136,21 +351,151 @@ class ContentFetcher:
             logger.error(f"Unexpected error fetching {url}: {e}")
             return None
 
+    def _read_stream(
+        self, url: str, response: requests.Response, snapshots: Optional[SnapshotStore] = None
+    ) -> Tuple[Optional[etree._Element], int]:
+        """Feed the body into an incremental lxml parser, stopping at the byte cap."""
+        content_type = response.headers.get("Content-Type")
+        snapshot = snapshots.writer(url, content_type) if snapshots else None
+        parser = IncrementalHTMLParser(
+            url,
+            charset=charset_from_content_type(content_type),
+            max_bytes=self.max_response_bytes,
+            on_chunk=snapshot.write if snapshot else None,
+        )
+        try:
+            for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                if not parser.feed(chunk):
+                    break
+        except Exception:
+            if snapshot:
+                snapshot.discard()
+            raise
+
+        if snapshot:
+            snapshot.commit()
+        return parser.close(), parser.size
+
 
 class HTMLParser:
-    """Parses HTML content and extracts structured data."""
+    """Parses HTML content and extracts structured data.
+
+    The "soup" engine walks a BeautifulSoup tree; the "lxml" engine runs the
+    plan's compiled XPath directly on an lxml document and returns the same
+    articles. Sources whose selectors have no XPath translation always use soup.
+
+    With scoped=True only the elements matching the article selector (and
+    their contents) are built, falling back to a full parse if none are
+    found. Field selectors then see just the article, not its ancestors.
 
-    def __init__(self, selectors: Dict[str, str]):
+    A `structured` mapping reads articles from the page's embedded JSON
+    first; selectors are only used when it yields nothing.
+    """
+
+    # Elements whose text BeautifulSoup's get_text leaves out
+    NON_TEXT_TAGS = {"script", "style", "template"}
+
+    def __init__(
+        self,
+        selectors: Dict[str, str],
+        plan: Optional[SelectorPlan] = None,
+        engine: str = "soup",
+        scoped: bool = False,
+        structured: Optional[Dict[str, Any]] = None,
+        max_content_length: Optional[int] = None,
+    ):
+        if engine not in PARSER_ENGINES:
+            raise ValueError(f"Unknown parser engine {engine!r}; expected one of {PARSER_ENGINES}")
         self.selectors = selectors
+        self.plan = plan or compile_plan(selectors)
+        self.engine = engine if self.plan.xpath is not None else "soup"
+        # Article selectors with combinators or pseudo-classes need the full document
+        self.scoped = scoped and self.plan.region is not None
+        self.structured = StructuredExtractor(structured, max_content_length) if structured else None
+
+    @classmethod
+    def for_source(
+        cls,
+        source: Dict[str, Any],
+        default_engine: str = "soup",
+        scoped: bool = False,
+        max_content_length: Optional[int] = None,
+    ) -> "HTMLParser":
+        """Build the parser for a source, honouring its per-source "parser", "scoped_parse" and "structured" keys.
+
+        max_content_length caps the text of structured-data bodies, as for feed entries.
+        """
+        return cls(
+            source.get("selectors", {}),
+            engine=source.get("parser", default_engine),
+            scoped=source.get("scoped_parse", scoped),
+            structured=source.get("structured"),
+            max_content_length=max_content_length,
+        )
 
-    def parse(self, html_content: str, source_url: str) -> List[Dict[str, Any]]:
-        """Parse HTML and extract articles using configured selectors."""
-        soup = BeautifulSoup(html_content, "lxml")
+    def parse(self, html_content: Union[str, bytes, etree._Element], source_url: str) -> List[Dict[str, Any]]:
+        """Parse HTML and extract articles using configured selectors.
+
+        Accepts page text or bytes, or an lxml document already built by a streaming fetch.
+        """
+        if self.structured:
+            articles = self.structured.extract(html_content, source_url)
+            if articles:
+                logger.info(f"Found {len(articles)} articles in embedded {self.structured.type} data")
+                return articles
+            logger.debug(f"No {self.structured.type} articles in {source_url}, falling back to selectors")
+
+        if isinstance(html_content, etree._Element):
+            return self.parse_tree(html_content, source_url)
+
+        if self.scoped:
+            articles = self._parse_scoped(html_content, source_url)
+            if articles is not None:
+                return articles
+            logger.debug(f"No articles from scoped parse of {source_url}, parsing the full page")
+
+        if self.engine == "lxml":
+            root = self._build_tree(html_content)
+            return self.parse_tree(root, source_url) if root is not None else []
+
+        return self._parse_soup(BeautifulSoup(html_content, "lxml"), source_url)
+
+    def parse_profiled(
+        self, html_content: Union[str, bytes, etree._Element], source_url: str
+    ) -> Tuple[List[Dict[str, Any]], PageProfile]:
+        """Parse like parse(), also measuring time, tree size and the cost of each selector."""
+        page = PageProfile(self.plan.selectors)
+        plan, self.plan = self.plan, ProfiledPlan(self.plan, page)
+        start = time.perf_counter()
+        try:
+            articles = self.parse(html_content, source_url)
+        finally:
+            self.plan = plan
+        page.finish(articles, time.perf_counter() - start)
+        return articles, page
+
+    def _parse_scoped(self, html_content: Union[str, bytes], source_url: str) -> Optional[List[Dict[str, Any]]]:
+        """Parse only the article containers, or return None if no article comes out of them.
+
+        Field selectors that need context outside the containers (e.g. "main h2") find nothing
+        in the scoped tree, so an empty result is retried with a full parse.
+        """
+        if self.engine == "lxml":
+            root = self._build_tree(html_content, target=RegionTarget(self.plan.region))
+            articles = self.parse_tree(root, source_url) if root is not None else []
+        else:
+            strainer = SoupStrainer(self.plan.region.matches)
+            soup = BeautifulSoup(html_content, "lxml", parse_only=strainer)
+            articles = self._parse_soup(soup, source_url) if self.plan.select("article", soup, limit=1) else []
+        return articles or None
+
+    def _parse_soup(self, soup: BeautifulSoup, source_url: str) -> List[Dict[str, Any]]:
+        """Extract articles from a BeautifulSoup tree."""
         articles = []
 
         # Find all article elements
-        article_selector = self.selectors.get("article", "article")
-        article_elements = soup.select(article_selector)
+        article_selector = self.plan.selectors["article"]
+        article_elements = self.plan.select("article", soup)
 
         logger.info(f"Found {len(article_elements)} articles using selector: {article_selector}")
 
@@ -168,20 +513,19 @@ class HTMLParser:
     def _extract_article_data(self, element: BeautifulSoup, source_url: str) -> Optional[Dict[str, Any]]:
         """Extract data from a single article element."""
         # Extract title
-        title_elem = element.select_one(self.selectors.get("title", "h1, h2"))
+        title_elem = self.plan.select_one("title", element)
         title = title_elem.get_text(strip=True) if title_elem else None
 
         if not title:
             return None
 
         # Extract date
-        date_elem = element.select_one(self.selectors.get("date", "time"))
+        date_elem = self.plan.select_one("date", element)
         date = date_elem.get("datetime") or date_elem.get_text(strip=True) if date_elem else None
 
         # Extract content/summary
-        content_selector = self.selectors.get("content", "p")
-        content_elems = element.select(content_selector)
-        content = " ".join([p.get_text(strip=True) for p in content_elems[:3]])  # First 3 paragraphs
+        content_elems = self.plan.select("content", element, limit=3)
+        content = " ".join([p.get_text(strip=True) for p in content_elems])  # First 3 paragraphs
 
         # Extract link
         link_elem = element.find("a", href=True)
@@ -189,7 +533,6 @@ class HTMLParser:
 
         # Make link absolute if relative
         if link.startswith("/"):
-            from urllib.parse import urljoin
             link = urljoin(source_url, link)
 
         # Generate content hash for deduplication
@@ -204,6 +547,114 @@ class HTMLParser:
             "content_hash": content_hash,
         }
 
+    @staticmethod
+    def _build_tree(html_content: Union[str, bytes], target: Optional[RegionTarget] = None) -> Optional[etree._Element]:
+        """Build an lxml document, decoding bytes the way BeautifulSoup would."""
+        if isinstance(html_content, bytes):
+            html_content = UnicodeDammit(html_content, is_html=True).unicode_markup or ""
+        if not html_content.strip():
+            return None
+        # Parse as UTF-8 bytes, since lxml rejects str input that carries an encoding
+        # declaration; plain etree elements skip lxml.html's per-element class lookup
+        parser = etree.HTMLParser(encoding="utf-8", target=target)
+        return etree.fromstring(html_content.encode("utf-8"), parser=parser)
+
+    def parse_tree(self, root: etree._Element, source_url: str) -> List[Dict[str, Any]]:
+        """Extract articles from an lxml document, mirroring parse() on BeautifulSoup."""
+        if self.plan.xpath is None:
+            # Selectors lxml cannot run; hand the document to BeautifulSoup instead
+            html_content = etree.tostring(root, encoding="unicode", method="html")
+            return self._parse_soup(BeautifulSoup(html_content, "lxml"), source_url)
+
+        article_selector = self.plan.selectors["article"]
+        article_elements = self.plan.select_tree("article", root)
+
+        logger.info(f"Found {len(article_elements)} articles using selector: {article_selector}")
+
+        matches = self._match_fields(root, article_elements)
+        articles = []
+        for idx, article_elem in enumerate(article_elements):
+            try:
+                article_data = self._extract_tree_article_data(article_elem, matches[idx], source_url)
+                if article_data:
+                    articles.append(article_data)
+            except Exception as e:
+                logger.error(f"Error parsing article {idx} from {source_url}: {e}")
+                continue
+
+        return articles
+
+    def _match_fields(
+        self, root: etree._Element, article_elements: List[etree._Element]
+    ) -> List[Dict[str, List[etree._Element]]]:
+        """Run each field selector once over the document and file matches under their articles.
+
+        Like soupsieve, a selector is matched against the whole document, so
+        the ancestor part of "article p" may be the article itself or lie
+        outside it; only the matched element has to be inside the article.
+        """
+        positions = {element: idx for idx, element in enumerate(article_elements)}
+        matches = [{field: [] for field in TREE_FIELDS} for _ in article_elements]
+        for field in TREE_FIELDS:
+            for element in self.plan.select_tree(field, root):
+                for ancestor in element.iterancestors():
+                    idx = positions.get(ancestor)
+                    if idx is not None:
+                        matches[idx][field].append(element)
+        return matches
+
+    def _extract_tree_article_data(
+        self, element: etree._Element, matches: Dict[str, List[etree._Element]], source_url: str
+    ) -> Optional[Dict[str, Any]]:
+        """Extract data from a single lxml article element given its field matches."""
+        title_elems = matches["title"]
+        title = self._tree_text(title_elems[0]) if title_elems else None
+
+        if not title:
+            return None
+
+        date_elems = matches["date"]
+        date = date_elems[0].get("datetime") or self._tree_text(date_elems[0]) if date_elems else None
+
+        content_elems = matches["content"]
+        content = " ".join([self._tree_text(p) for p in content_elems[:3]])  # First 3 paragraphs
+
+        link_elems = self.plan.link_xpath(element)
+        link = link_elems[0].get("href") if link_elems else source_url
+
+        if link.startswith("/"):
+            link = urljoin(source_url, link)
+
+        content_hash = hashlib.sha256(f"{title}{content}".encode()).hexdigest()
+
+        return {
+            "title": title,
+            "date": date,
+            "content": content,
+            "link": link,
+            "source_url": source_url,
+            "content_hash": content_hash,
+        }
+
+    @classmethod
+    def _tree_text(cls, element: etree._Element) -> str:
+        """Equivalent of BeautifulSoup's get_text(strip=True) for lxml elements."""
+        if element.tag != "template" and next(element.iterancestors("template"), None) is not None:
+            # BeautifulSoup files everything under <template> as template strings, which get_text skips
+            return ""
+        return "".join(text.strip() for text in cls._iter_text(element))
+
+    @classmethod
+    def _iter_text(cls, element: etree._Element):
+        """Yield an element's own text and that of descendants outside script, style and template."""
+        if isinstance(element.tag, str) and element.text:
+            yield element.text
+        for child in element:
+            if isinstance(child.tag, str) and child.tag not in cls.NON_TEXT_TAGS:
+                yield from cls._iter_text(child)
+            if child.tail:
+                yield child.tail
+
 
 class CompetitorScraper:
     """Main scraper class orchestrating the intelligence gathering."""
@@ -211,94 +662,511 @@ class CompetitorScraper:
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         scraping_config = config.get("scraping", {})
+        storage_config = config.get("storage", {})
 
         # Initialize components
-        self.session_manager = SessionManager(scraping_config.get("user_agents", []))
+        self.http_cache = None
+        if storage_config.get("http_cache", True):
+            self.http_cache = ValidatorCache(
+                cache_dir=storage_config.get("cache_dir", "data/processed"),
+                ttl_days=storage_config.get("cache_ttl_days", 7),
+            )
+
+        self.snapshots = None
+        if storage_config.get("snapshots", True):
+            self.snapshots = SnapshotStore(raw_dir=storage_config.get("raw_data_dir", "data/raw"))
+
+        self.rate_controller = self._build_rate_controller()
+        self.parser_engine = scraping_config.get("parser_engine", "soup")
+        self.scoped_parsing = scraping_config.get("scoped_parsing", False)
+        self.max_content_length = config.get("processing", {}).get("max_content_length", 50000)
+        self.profiler = ExtractionProfiler() if scraping_config.get("profile_extraction", False) else None
+        self.profile_path = None
+        self.parse_pool = self._build_parse_pool()
+        self.feed_first = scraping_config.get("feed_first", True)
+        self.feed_processor = RSSFeedProcessor.from_config(config)
+
+        self.session_manager = SessionManager(
+            scraping_config.get("user_agents", []),
+            pool_size=scraping_config.get("max_workers", 5),
+            max_sessions=scraping_config.get("max_sessions", 256),
+            dns_ttl=scraping_config.get("dns_cache_ttl", 300),
+        )
         self.rate_limiter = RateLimiter(
             min_delay=scraping_config.get("min_delay", 2),
             max_delay=scraping_config.get("max_delay", 5),
+            controller=self.rate_controller,
+            max_retry_after=scraping_config.get("adaptive_rate", {}).get("max_retry_after", 300),
         )
+        self.retry_policy = RetryPolicy.from_config(scraping_config)
         self.content_fetcher = ContentFetcher(
             self.session_manager,
             self.rate_limiter,
             timeout=scraping_config.get("request_timeout", 30),
             max_retries=scraping_config.get("max_retries", 3),
+            cache=self.http_cache,
+            retry_policy=self.retry_policy,
+            stream=scraping_config.get("stream_responses", False),
+            max_response_bytes=scraping_config.get("max_response_bytes", DEFAULT_MAX_RESPONSE_BYTES),
+            snapshots=self.snapshots,
+            raw=self.parse_pool is not None,
+        )
+        self.source_deadline = scraping_config.get("source_deadline")
+
+        self.run_budget = RunBudget(
+            scraping_config.get("run_budget"),
+            exempt_priorities=scraping_config.get("run_budget_exempt", ["critical"]),
         )
+        self.deferred_path = Path(storage_config.get("cache_dir", "data/processed")) / "deferred_sources.json"
 
+        self.engine = scraping_config.get("engine", "threaded")
         self.max_workers = scraping_config.get("max_workers", 5)
+        self.registry = SourceRegistry.from_config(config)
         self.sources = self._load_sources()
+        self.history = self._build_history()
+        self.watermarks = self._build_watermarks()
+        self.feed_watermarks = self._build_feed_watermarks()
+        self.full_articles = self._build_full_articles()
+
+    def _build_rate_controller(self) -> Optional[AdaptiveRateController]:
+        """Create the adaptive rate controller if enabled in configuration."""
+        scraping_config = self.config.get("scraping", {})
+        adaptive_config = scraping_config.get("adaptive_rate", {})
+        if not adaptive_config.get("enabled", False):
+            return None
+
+        storage_config = self.config.get("storage", {})
+        min_delay = scraping_config.get("min_delay", 2)
+        return AdaptiveRateController(
+            initial_delay=min_delay,
+            floor_delay=adaptive_config.get("floor_delay", min_delay),
+            ceiling_delay=adaptive_config.get("ceiling_delay", 120),
+            increase_step=adaptive_config.get("increase_step", 0.05),
+            decrease_factor=adaptive_config.get("decrease_factor", 2),
+            latency_factor=adaptive_config.get("latency_factor", 3),
+            state_path=str(Path(storage_config.get("cache_dir", "data/processed")) / "rate_state.json"),
+            ttl_days=storage_config.get("cache_ttl_days", 7),
+        )
+
+    def _build_parse_pool(self):
+        """Create the parser process pool if enabled in configuration."""
+        scraping_config = self.config.get("scraping", {})
+        if not scraping_config.get("parse_pool", False):
+            return None
+
+        from src.core.parse_pool import ParsePool
+
+        return ParsePool(
+            workers=scraping_config.get("parse_workers"),
+            default_engine=self.parser_engine,
+            scoped=self.scoped_parsing,
+            profile=self.profiler is not None,
+            max_content_length=self.max_content_length,
+        )
+
+    def _build_full_articles(self):
+        """Create the full-article fetch stage if enabled in configuration."""
+        full_config = self.config.get("scraping", {}).get("full_articles", {})
+        if not full_config.get("enabled", False):
+            return None
+
+        from src.core.article_fetch import DEFAULT_BODY_SELECTOR, ArticleBodyCache, FullArticleFetcher
+
+        return FullArticleFetcher(
+            ArticleBodyCache(cache_dir=self.config.get("storage", {}).get("cache_dir", "data/processed")),
+            max_per_source=full_config.get("max_per_source", 4),
+            selector=full_config.get("content", DEFAULT_BODY_SELECTOR),
+        )
+
+    def _build_history(self):
+        """Create the article history if any source follows listing pages."""
+        if not any(Paginator.enabled(source) for source in self.sources):
+            return None
+
+        storage_config = self.config.get("storage", {})
+        return ArticleHistory(
+            cache_dir=storage_config.get("cache_dir", "data/processed"),
+            max_per_source=storage_config.get("history_size", 1000),
+        )
+
+    def _build_watermarks(self):
+        """Create the sitemap watermark store if any source is discovered through a sitemap."""
+        if not any(SitemapDiscovery.enabled(source) for source in self.sources):
+            return None
+        return SitemapWatermarks(cache_dir=self.config.get("storage", {}).get("cache_dir", "data/processed"))
+
+    def _build_feed_watermarks(self):
+        """Create the feed watermark store if sources are read from their feeds."""
+        if not self.feed_first or not self.config.get("scraping", {}).get("feed_watermarks", True):
+            return None
+        if not any(source.get("rss") for source in self.sources):
+            return None
+        return FeedWatermarks(cache_dir=self.config.get("storage", {}).get("cache_dir", "data/processed"))
 
     def _load_sources(self) -> List[Dict[str, Any]]:
-        """Load all sources from configuration."""
-        sources = []
-        sources_config = self.config.get("sources", {})
+        """Load all sources from the registry (configured tiers, then imported sources)."""
+        sources = list(self.registry)
 
-        for tier in ["tier1", "tier2", "tier3"]:
-            tier_sources = sources_config.get(tier, [])
-            sources.extend(tier_sources)
+        # Compile selector plans up front (scrapes then share them via compile_plan's cache) and check mappings
+        for source in sources:
+            try:
+                compile_plan(source.get("selectors", {}))
+                if source.get("structured"):
+                    StructuredExtractor(source["structured"])
+            except Exception as e:
+                logger.error(f"Invalid extraction config for {source.get('name')}: {e}")
 
-        logger.info(f"Loaded {len(sources)} sources from configuration")
+        logger.info(f"Loaded {len(sources)} sources from the source registry")
         return sources
 
-    def scrape_source(self, source: Dict[str, Any]) -> Dict[str, Any]:
-        """Scrape a single source and return structured data."""
+    def _ordered_sources(self) -> List[Dict[str, Any]]:
+        """Order sources by priority, deferral last run and historical latency."""
+        return order_sources(self.sources, self._source_latency, self._load_deferred())
+
+    def _source_latency(self, source: Dict[str, Any]) -> Optional[float]:
+        if not self.rate_controller:
+            return None
+        return self.rate_controller.latency_for(self._first_host(source))
+
+    def _first_host(self, source: Dict[str, Any]) -> str:
+        """Host a source's first request goes to: its feed, else its sitemap, else its listing page."""
+        if self.feed_first and source.get("rss"):
+            return urlparse(source["rss"]).netloc
+        if self.watermarks and SitemapDiscovery.enabled(source):
+            return urlparse(SitemapDiscovery(source, self.watermarks).url).netloc
+        return urlparse(source.get("url", "")).netloc
+
+    def _load_deferred(self) -> List[str]:
+        """Names of sources the previous run deferred."""
+        return load_json(self.deferred_path, "deferred list") or []
+
+    def _save_deferred(self, results: List[Dict[str, Any]]):
+        """Remember deferred sources so the next run serves them first within their priority."""
+        deferred = [result["source"] for result in results if result.get("status") == "deferred"]
+        if not deferred and not self.deferred_path.exists():
+            return
+        save_json(self.deferred_path, deferred)
+
+    def scrape_source(self, source: Dict[str, Any], task: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Scrape a single source and return structured data.
+
+        When called with a scheduler task, a retryable fetch failure raises
+        RetryLater instead of sleeping through the backoff in this thread.
+        """
         name = source.get("name")
         url = source.get("url")
 
         logger.info(f"Starting scrape for {name}: {url}")
-
+        if task is not None:
+            fetch_stats = task
+            deadline = task["deadline"]
+        else:
+            fetch_stats = {}
+            deadline = time.time() + self.source_deadline if self.source_deadline else None
+            deadline = self.run_budget.cap_deadline(source, deadline)
+
+        flow = ScrapeFlow(self, source)
         try:
-            # Try RSS feed first if available
-            rss_url = source.get("rss")
-            if rss_url:
-                logger.info(f"Attempting RSS feed for {name}: {rss_url}")
-                # RSS parsing will be implemented in processors module
-
-            # Fetch HTML content
-            html_content = self.content_fetcher.fetch(url)
-
-            if not html_content:
-                return {"source": name, "status": "failed", "articles": [], "error": "No content fetched"}
-
-            # Parse HTML
-            parser = HTMLParser(source.get("selectors", {}))
-            articles = parser.parse(html_content, url)
-
-            logger.success(f"Scraped {len(articles)} articles from {name}")
-
-            return {
-                "source": name,
-                "status": "success",
-                "articles": articles,
-                "url": url,
-                "priority": source.get("priority", "medium"),
-            }
-
+            result = run_flow(flow.scrape(), lambda step: self._perform(step, deadline, task, fetch_stats))
+        except RetryLater:
+            raise
         except Exception as e:
-            logger.error(f"Failed to scrape {name}: {e}")
-            return {"source": name, "status": "failed", "articles": [], "error": str(e)}
+            result = flow.error_result(e)
+        return flow.finish(result, fetch_stats)
+
+    def _perform(
+        self, step: Step, deadline: Optional[float], task: Optional[Dict[str, Any]], fetch_stats: Dict[str, Any]
+    ) -> Any:
+        """Carry out one step of a source's ScrapeFlow in this thread."""
+        if isinstance(step, Fetch):
+            if step.mode == Fetch.ONCE:
+                return self.content_fetcher.fetch_once(step.url, deadline, raw=step.raw)
+            if step.mode == Fetch.FIRST:
+                return self._fetch_listing(step.url, deadline, task, fetch_stats, raw=step.raw)
+            return self.content_fetcher.fetch(step.url, deadline=deadline, raw=step.raw)
+
+        if isinstance(step, FetchEach):
+            def fetch_one(key: str):
+                try:
+                    content = self.content_fetcher.fetch(step.links[key], deadline=deadline, record=False)
+                except Exception as e:
+                    step.handle(key, None, e)
+                    return
+                step.handle(key, content, None)
+
+            with ThreadPoolExecutor(max_workers=min(step.limit, len(step.links))) as executor:
+                list(executor.map(fetch_one, step.links))
+            return None
+
+        if isinstance(step, ParseFeed):
+            if self.parse_pool:
+                return self.parse_pool.parse_feed(step.content, step.url, step.since)
+            return self.feed_processor.parse_feed(step.content, step.url, step.since)
+
+        return self._parse_articles(step.source, step.content, step.url)
+
+    def _parse_articles(
+        self, source: Dict[str, Any], content: Union[str, bytes, etree._Element], url: str
+    ) -> List[Dict[str, Any]]:
+        """Extract a source's articles in the parse pool if one is configured, else in this thread."""
+        if self.parse_pool:
+            parsed = self.parse_pool.parse(source, content, url)
+        else:
+            parser = HTMLParser.for_source(source, self.parser_engine, self.scoped_parsing, self.max_content_length)
+            if not self.profiler:
+                return parser.parse(content, url)
+            parsed = parser.parse_profiled(content, url)
+
+        if not self.profiler:
+            return parsed
+        articles, page = parsed
+        self.profiler.record(source.get("name"), page)
+        return articles
+
+    def _fetch_listing(
+        self,
+        url: str,
+        deadline: Optional[float],
+        task: Optional[Dict[str, Any]],
+        fetch_stats: Dict[str, Any],
+        raw: bool = False,
+    ) -> Optional[Union[str, bytes, etree._Element]]:
+        """Fetch a listing page, retrying inline or deferring retries to the scheduler."""
+        if task is None:
+            return self.content_fetcher.fetch(url, deadline=deadline, stats=fetch_stats, raw=raw)
+
+        try:
+            return self.content_fetcher.fetch_once(url, deadline, raw)
+        except requests.exceptions.RequestException as e:
+            if self.retry_policy.is_retryable(e) and task["attempts"] < self.retry_policy.max_attempts:
+                raise RetryLater(str(e)) from e
+            raise
 
     def scrape_all(self) -> List[Dict[str, Any]]:
         """Scrape all configured sources concurrently."""
-        logger.info(f"Starting concurrent scraping of {len(self.sources)} sources")
+        if self.http_cache:
+            self.http_cache.reset_stats()
+        if self.full_articles:
+            self.full_articles.reset_stats()
+        if self.profiler:
+            self.profiler = ExtractionProfiler()
+        if self.retry_policy.budget:
+            self.retry_policy.budget.reset()
+        if self.snapshots:
+            self.snapshots.start_run()
+        sources = self._ordered_sources()
+        self.run_budget.start()
+
+        if self.engine == "async":
+            from src.core.async_engine import AsyncScrapeEngine
+
+            results = AsyncScrapeEngine(
+                self.config,
+                http_cache=self.http_cache,
+                rate_controller=self.rate_controller,
+                retry_policy=self.retry_policy,
+                snapshots=self.snapshots,
+                run_budget=self.run_budget,
+                parse_pool=self.parse_pool,
+                history=self.history,
+                watermarks=self.watermarks,
+                feed_watermarks=self.feed_watermarks,
+                full_articles=self.full_articles,
+                profiler=self.profiler,
+            ).run(sources)
+            self._finish_run(results)
+            return results
+
+        logger.info(f"Starting concurrent scraping of {len(sources)} sources")
+        scheduler = DomainScheduler(self.rate_limiter, priority=lambda task: task["rank"])
+        for rank, source in enumerate(sources):
+            task = {
+                "source": source,
+                "rank": rank,
+                "attempts": 0,
+                "backoff_seconds": 0.0,
+                "deadline": None,
+                "requeued_at": None,
+            }
+            # Queue by the host that is hit first, so shared feed hosts are paced as one domain
+            scheduler.submit(self._first_host(source), task)
+
+        # Once the budget is spent, pull queued low-priority sources instead of waiting on their domains
+        deferred = []
+        budget_timer = None
+        if self.run_budget.deadline is not None:
+            budget_timer = threading.Timer(
+                self.run_budget.deadline - time.time(), self._defer_remaining, args=(scheduler, deferred)
+            )
+            budget_timer.daemon = True
+            budget_timer.start()
+
         results = []
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                workers = [executor.submit(self._scrape_worker, scheduler) for _ in range(self.max_workers)]
+                for future in as_completed(workers):
+                    results.extend(future.result())
+        finally:
+            if budget_timer:
+                budget_timer.cancel()
+        results.extend(deferred)
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_source = {executor.submit(self.scrape_source, source): source for source in self.sources}
+        logger.info(f"Completed scraping. Total results: {len(results)}")
+        self._finish_run(results)
+        return results
 
-            for future in as_completed(future_to_source):
-                source = future_to_source[future]
-                try:
-                    result = future.result()
+    def _defer_remaining(self, scheduler: DomainScheduler, deferred: List[Dict[str, Any]]):
+        """Take every not-yet-started source the budget applies to off the scheduler."""
+        tasks = scheduler.cancel(lambda task: self.run_budget.applies_to(task["source"]))
+        if tasks:
+            logger.warning(f"Run time budget exhausted, deferring {len(tasks)} sources to the next run")
+        deferred.extend(
+            self.run_budget.deferred_result(task["source"], task["attempts"], task["backoff_seconds"]) for task in tasks
+        )
+
+    def _scrape_worker(self, scheduler: DomainScheduler) -> List[Dict[str, Any]]:
+        """Scrape sources handed out by the scheduler until none remain."""
+        results = []
+        while True:
+            scheduled = scheduler.next_item()
+            if scheduled is None:
+                return results
+
+            domain, task = scheduled
+            source = task["source"]
+            if self.run_budget.should_defer(source):
+                results.append(self.run_budget.deferred_result(source, task["attempts"], task["backoff_seconds"]))
+                scheduler.task_done(domain)
+                continue
+
+            now = time.time()
+            task["attempts"] += 1
+            if task["requeued_at"] is not None:
+                task["backoff_seconds"] += now - task["requeued_at"]
+            else:
+                deadline = now + self.source_deadline if self.source_deadline else None
+                task["deadline"] = self.run_budget.cap_deadline(source, deadline)
+            if task["attempts"] == 1:
+                self.retry_policy.record_request()
+
+            try:
+                results.append(self.scrape_source(source, task=task))
+            except RetryLater as e:
+                result = self._requeue(scheduler, domain, task, e)
+                if result:
                     results.append(result)
-                except Exception as e:
-                    logger.error(f"Exception for {source.get('name')}: {e}")
-                    results.append({"source": source.get("name"), "status": "error", "articles": [], "error": str(e)})
+            except Exception as e:
+                logger.error(f"Exception for {source.get('name')}: {e}")
+                results.append({"source": source.get("name"), "status": "error", "articles": [], "error": str(e)})
+            finally:
+                scheduler.task_done(domain)
+
+    def _requeue(
+        self, scheduler: DomainScheduler, domain: str, task: Dict[str, Any], error: RetryLater
+    ) -> Optional[Dict[str, Any]]:
+        """Park a failed source on the scheduler's delay queue, or return its final result."""
+        name = task["source"].get("name")
+        wait = self.retry_policy.backoff(task["attempts"])
+        if self.run_budget.should_defer(task["source"]):
+            return self.run_budget.deferred_result(task["source"], task["attempts"], task["backoff_seconds"])
 
-        logger.info(f"Completed scraping. Total results: {len(results)}")
-        return results
+        try:
+            self.retry_policy.authorize_retry(wait, task["deadline"])
+        except DeadlineExceeded as e:
+            logger.error(f"Deadline exceeded for {name}: {e}")
+            status = "deadline_exceeded"
+        except RetryBudgetExhausted as e:
+            logger.error(f"Giving up on {name}: {e}")
+            status = "retry_budget_exhausted"
+        else:
+            logger.warning(
+                f"Retrying {name} in {wait:.1f}s (attempt {task['attempts'] + 1}/{self.retry_policy.max_attempts}): {error}"
+            )
+            task["requeued_at"] = time.time()
+            scheduler.submit_later(domain, task, wait)
+            return None
+
+        return {
+            "source": name,
+            "status": status,
+            "articles": [],
+            "error": str(error),
+            "attempts": task["attempts"],
+            "backoff_seconds": round(task["backoff_seconds"], 3),
+        }
+
+    def get_run_stats(self) -> Dict[str, Any]:
+        """Return fetch-layer statistics for the last run."""
+        stats = {}
+        if self.http_cache:
+            stats["http_cache"] = self.http_cache.summary()
+        if self.retry_policy.budget:
+            stats["retry_budget"] = self.retry_policy.budget.summary()
+        if self.snapshots:
+            stats["snapshots"] = self.snapshots.summary()
+        if self.profile_path:
+            stats["extraction_profile"] = str(self.profile_path)
+        if self.engine != "async":
+            stats["connections"] = self.session_manager.connection_stats()
+        return stats
+
+    def _finish_run(self, results: List[Dict[str, Any]]):
+        """Persist learned state and log per-run fetch statistics."""
+        if self.rate_controller:
+            self.rate_controller.save()
+        self._save_deferred(results)
+        if self.history:
+            self.history.update(results)
+            self.history.save()
+        if self.watermarks:
+            self.watermarks.save()
+        if self.feed_watermarks:
+            self.feed_watermarks.save()
+
+        if self.retry_policy.budget:
+            budget = self.retry_policy.budget.summary()
+            logger.info(f"Retries: {budget['retries']} used, {budget['denied']} denied by budget")
+
+        if self.engine != "async":
+            connections = self.session_manager.connection_stats()
+            logger.info(
+                f"Connections: {connections['requests']} requests over {connections['connections']} connections, "
+                f"{connections['tls_handshakes_saved']} TLS handshakes saved, "
+                f"DNS cache {connections['dns_cache_hits']} hits / {connections['dns_cache_misses']} misses"
+            )
+
+        if self.http_cache:
+            summary = self.http_cache.summary()
+            logger.info(
+                f"HTTP cache: {summary['hits']}/{summary['requests']} not modified "
+                f"({summary['hit_rate']:.0%}), {summary['bytes_saved'] / 1024:.1f} KB saved, "
+                f"{summary['bytes_downloaded'] / 1024:.1f} KB downloaded"
+            )
+
+        if self.profiler:
+            output_dir = self.config.get("reporting", {}).get("output_dir", "data/reports")
+            self.profile_path = self.profiler.write(output_dir)
+
+        if self.full_articles:
+            summary = self.full_articles.summary()
+            logger.info(
+                f"Full articles: {summary['fetched']} fetched, {summary['cached']} from cache, "
+                f"{summary['empty']} without a body, {summary['failed']} failed"
+            )
+
+        if self.snapshots:
+            self.snapshots.save_latest()
+            summary = self.snapshots.summary()
+            logger.info(
+                f"Snapshots: {summary['snapshots']} indexed as run {summary['run_id']}, "
+                f"{summary['new_blobs']} new blobs ({summary['bytes_stored'] / 1024:.1f} KB compressed), "
+                f"{summary['deduplicated']} unchanged"
+            )
 
     def cleanup(self):
         """Cleanup resources."""
         self.session_manager.close_all()
+        if self.parse_pool:
+            self.parse_pool.shutdown()
         logger.info("Scraper cleanup completed")
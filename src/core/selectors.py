@@ -0,0 +1,213 @@
+"""
+Precompiled extraction plans for source selectors.
+
+Every parse used to hand the same CSS strings to soupsieve (and, for lxml
+documents, to cssselect) again. A SelectorPlan compiles a source's
+selectors once, to soupsieve patterns for BeautifulSoup trees and to XPath
+for lxml trees. Selectors cssselect cannot translate (soupsieve supports a
+wider CSS dialect) leave the plan without XPath, so such sources fall back
+to BeautifulSoup. Plans are immutable and cached by selector set, so one plan
+is shared by every thread and every run in the process.
+
+An article selector made only of simple compounds (tag, classes, id and
+attribute tests, comma-separated) also gets an ArticleRegion: a start-tag
+test that lets scoped parsing build just the candidate article subtrees.
+"""
+
+import threading
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+import cssselect
+import soupsieve
+from cssselect import SelectorError
+from cssselect.parser import Attrib, Class, Element, Hash
+from cssselect.xpath import ExpressionError
+from lxml import etree
+from lxml.cssselect import LxmlHTMLTranslator
+from loguru import logger
+
+
+# Fallbacks HTMLParser has always used for selectors a source leaves out
+DEFAULT_SELECTORS = {
+    "article": "article",
+    "title": "h1, h2",
+    "date": "time",
+    "content": "p",
+}
+
+
+# Attribute operators an ArticleRegion can test from a start tag alone
+ATTRIBUTE_TESTS: Dict[str, Callable[[str, str], bool]] = {
+    "exists": lambda actual, expected: True,
+    "=": lambda actual, expected: actual == expected,
+    "~=": lambda actual, expected: expected in actual.split(),
+    "|=": lambda actual, expected: actual == expected or actual.startswith(expected + "-"),
+    "^=": lambda actual, expected: bool(expected) and actual.startswith(expected),
+    "$=": lambda actual, expected: bool(expected) and actual.endswith(expected),
+    "*=": lambda actual, expected: bool(expected) and expected in actual,
+}
+
+
+# Wrapper for the subtrees a scoped parse builds
+SCOPED_ROOT_TAG = "scoped-document"
+
+
+class ArticleRegion:
+    """Decides from a start tag alone whether an element is an article container."""
+
+    def __init__(self, compounds: List[Dict[str, Any]]):
+        self.compounds = compounds
+
+    @classmethod
+    def compile(cls, selector: str) -> Optional["ArticleRegion"]:
+        """Build a region for a selector list of simple compounds, or None if context is needed."""
+        try:
+            parsed = cssselect.parse(selector)
+        except SelectorError:
+            return None
+
+        compounds = []
+        for selector_part in parsed:
+            compound = {"tag": None, "classes": [], "attrs": []}
+            node = selector_part.parsed_tree
+            # Combinators and pseudo-classes depend on ancestors or siblings a scoped parse never builds
+            while not isinstance(node, Element):
+                if isinstance(node, Class):
+                    compound["classes"].append(node.class_name)
+                elif isinstance(node, Hash):
+                    compound["attrs"].append(("id", "=", node.id))
+                elif isinstance(node, Attrib) and node.namespace is None and node.operator in ATTRIBUTE_TESTS:
+                    value = node.value.value if node.value is not None else ""
+                    compound["attrs"].append((node.attrib.lower(), node.operator, value))
+                else:
+                    return None
+                node = node.selector
+            if selector_part.pseudo_element or node.namespace is not None:
+                return None
+            if node.element not in (None, "*"):
+                compound["tag"] = node.element.lower()
+            elif not compound["classes"] and not compound["attrs"]:
+                # A bare "*" matches everything, the wrapper around the scoped subtrees included
+                return None
+            compounds.append(compound)
+        return cls(compounds)
+
+    def matches(self, tag: str, attrs: Mapping[str, Any]) -> bool:
+        """Whether a start tag with these attributes opens an article container."""
+        for compound in self.compounds:
+            if compound["tag"] and compound["tag"] != tag:
+                continue
+            if compound["classes"]:
+                classes = attrs.get("class") or ""
+                classes = classes.split() if isinstance(classes, str) else classes
+                if not all(name in classes for name in compound["classes"]):
+                    continue
+            if all(self._attr_matches(attrs, *test) for test in compound["attrs"]):
+                return True
+        return False
+
+    @staticmethod
+    def _attr_matches(attrs: Mapping[str, Any], name: str, operator: str, expected: str) -> bool:
+        actual = attrs.get(name)
+        if actual is None:
+            return False
+        if not isinstance(actual, str):
+            actual = " ".join(actual)
+        return ATTRIBUTE_TESTS[operator](actual, expected)
+
+
+class RegionTarget:
+    """lxml parser target that builds only the subtrees an ArticleRegion matches.
+
+    The candidates are collected under one attribute-less wrapper element
+    that no tag or attribute selector can match, so everything else on the
+    page (navigation, footers, inline scripts) is never turned into elements.
+    """
+
+    def __init__(self, region: ArticleRegion):
+        self.region = region
+        self.depth = 0
+        self.candidates = 0
+        self._builder = etree.TreeBuilder()
+        self._builder.start(SCOPED_ROOT_TAG, {})
+
+    def start(self, tag, attrib):
+        if not self.depth:
+            if not self.region.matches(tag, attrib):
+                return
+            self.candidates += 1
+        self.depth += 1
+        self._builder.start(tag, dict(attrib))
+
+    def end(self, tag):
+        if self.depth:
+            self.depth -= 1
+            self._builder.end(tag)
+
+    def data(self, data):
+        if self.depth:
+            self._builder.data(data)
+
+    def comment(self, text):
+        # Kept so text on either side of a comment stays separate strings, as in a full parse
+        if self.depth:
+            self._builder.comment(text)
+
+    def close(self) -> Optional[etree._Element]:
+        self._builder.end(SCOPED_ROOT_TAG)
+        root = self._builder.close()
+        return root if self.candidates else None
+
+
+class SelectorPlan:
+    """A source's selectors compiled for both BeautifulSoup and lxml trees."""
+
+    def __init__(self, selectors: Optional[Dict[str, str]] = None):
+        selectors = selectors or {}
+        self.selectors = {field: selectors.get(field, default) for field, default in DEFAULT_SELECTORS.items()}
+
+        self.css: Dict[str, soupsieve.SoupSieve] = {
+            field: soupsieve.compile(selector) for field, selector in self.selectors.items()
+        }
+        self.xpath = self._compile_xpath()
+        self.link_xpath = etree.XPath("descendant::a[@href]")
+        self.region = ArticleRegion.compile(self.selectors["article"])
+
+    def _compile_xpath(self) -> Optional[Dict[str, etree.XPath]]:
+        """Translate every selector to XPath, or return None if any has no translation."""
+        translator = LxmlHTMLTranslator()
+        xpath = {}
+        for field, selector in self.selectors.items():
+            try:
+                xpath[field] = etree.XPath(translator.css_to_xpath(selector, prefix="descendant-or-self::"))
+            except (SelectorError, ExpressionError, etree.XPathError) as e:
+                logger.debug(f"No XPath for {field} selector {selector!r}, using BeautifulSoup: {e}")
+                return None
+        return xpath
+
+    def select(self, field: str, element, limit: int = 0):
+        """Return elements matching a field's selector within a BeautifulSoup element."""
+        return self.css[field].select(element, limit=limit)
+
+    def select_one(self, field: str, element):
+        """Return the first element matching a field's selector, or None."""
+        return self.css[field].select_one(element)
+
+    def select_tree(self, field: str, element: etree._Element):
+        """Return elements matching a field's selector in an lxml subtree, the root included."""
+        return self.xpath[field](element)
+
+
+_plans: Dict[Tuple[Tuple[str, str], ...], SelectorPlan] = {}
+_plans_lock = threading.Lock()
+
+
+def compile_plan(selectors: Optional[Dict[str, str]] = None) -> SelectorPlan:
+    """Return the shared plan for a selector set, compiling it on first use."""
+    key = tuple(sorted((selectors or {}).items()))
+    plan = _plans.get(key)
+    if plan is None:
+        plan = SelectorPlan(selectors)
+        with _plans_lock:
+            plan = _plans.setdefault(key, plan)
+    return plan
@@ -0,0 +1,195 @@
+"""
+Sitemap-driven change discovery.
+
+A source with a `sitemap` block is discovered through its XML sitemap (or
+sitemap index) instead of its listing page. Entries are stream-parsed and
+each `lastmod` is compared with a per-URL watermark stored under
+storage.cache_dir, so only new or changed pages go on to be fetched and
+extracted. Child sitemaps whose own `lastmod` has not moved are skipped.
+"""
+
+import gzip
+import io
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Any, Optional, Tuple
+
+from loguru import logger
+from lxml import etree
+
+from src.utils.json_store import load_json, save_json
+
+# Page URLs fetched per source per run unless the source sets max_urls
+DEFAULT_MAX_URLS = 20
+
+SITEMAP_TAGS = ("{*}url", "{*}sitemap")
+
+
+def iter_sitemap(content: bytes) -> Iterator[Tuple[str, str, Optional[str]]]:
+    """Yield (kind, loc, lastmod) for each <url> or <sitemap> entry of a sitemap document.
+
+    Entries are cleared as soon as they are read, so memory stays flat
+    however many URLs the sitemap lists. Gzipped sitemaps are accepted.
+    """
+    stream = io.BytesIO(content)
+    if content[:2] == b"\x1f\x8b":
+        stream = gzip.GzipFile(fileobj=stream)
+
+    for _, element in etree.iterparse(stream, tag=SITEMAP_TAGS, recover=True, resolve_entities=False):
+        loc = element.findtext("{*}loc")
+        lastmod = element.findtext("{*}lastmod")
+        kind = etree.QName(element).localname
+        element.clear(keep_tail=True)
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+        if loc and loc.strip():
+            yield kind, loc.strip(), lastmod.strip() if lastmod and lastmod.strip() else None
+
+
+def lastmod_key(lastmod: Optional[str]) -> str:
+    """Normalise a W3C datetime to a sortable UTC string; unparseable values sort as given."""
+    if not lastmod:
+        return ""
+    try:
+        value = datetime.fromisoformat(lastmod)
+    except ValueError:
+        return lastmod
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat()
+
+
+class SitemapWatermarks:
+    """Last seen lastmod per sitemap and page URL, persisted across runs.
+
+    With no cache_dir the watermarks live in memory only and start empty.
+    """
+
+    FILENAME = "sitemap_watermarks.json"
+
+    def __init__(self, cache_dir: Optional[str] = "data/processed"):
+        self.path = Path(cache_dir) / self.FILENAME if cache_dir else None
+        self._marks: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._marks
+
+    def is_changed(self, url: str, lastmod: Optional[str]) -> bool:
+        """Whether a URL is new, or its lastmod is later than its watermark."""
+        if url not in self._marks:
+            return True
+        return lastmod_key(lastmod) > self._marks[url]
+
+    def advance(self, url: str, lastmod: Optional[str]):
+        """Record a URL as processed up to lastmod."""
+        with self._lock:
+            self._marks[url] = max(lastmod_key(lastmod), self._marks.get(url, ""))
+
+    def load(self):
+        """Load watermarks from previous runs."""
+        self._marks = (load_json(self.path, "watermarks") if self.path else None) or {}
+
+    def save(self):
+        """Persist watermarks for the next run."""
+        if self.path is None:
+            return
+        with self._lock:
+            save_json(self.path, self._marks)
+
+
+class SitemapDiscovery:
+    """Works out which of a source's sitemap entries to fetch this run.
+
+    The fetching itself is left to the engine: it reads the root sitemap,
+    fetches each of `pending_sitemaps()` and feeds it back through `read`,
+    then fetches `changed_pages()`, reporting each with `done` or `failed`,
+    and calls `finish`.
+    """
+
+    def __init__(self, source: Dict[str, Any], watermarks: SitemapWatermarks):
+        config = source.get("sitemap") or {}
+        if isinstance(config, str):
+            config = {"url": config}
+        self.source = source.get("name")
+        self.url = config.get("url")
+        self.include = config.get("include")
+        self.max_urls = config.get("max_urls", DEFAULT_MAX_URLS)
+        self.watermarks = watermarks
+        # Until the root has been read once, only the newest max_urls pages are fetched
+        self.first_run = self.url not in watermarks
+        self.page_source = {**source, "selectors": config.get("selectors") or source.get("selectors", {})}
+
+        self.pages: Dict[str, Optional[str]] = {}
+        self._sitemaps: List[Tuple[str, Optional[str]]] = []
+        self.sitemaps_read: List[Tuple[str, Optional[str]]] = []
+        self.complete = True
+
+    @staticmethod
+    def enabled(source: Dict[str, Any]) -> bool:
+        """Whether the source is discovered through a sitemap."""
+        config = source.get("sitemap")
+        return bool(config.get("url") if isinstance(config, dict) else config)
+
+    def read(self, content: bytes, sitemap_url: Optional[str] = None, lastmod: Optional[str] = None):
+        """Collect the page entries of one sitemap document and queue changed child sitemaps."""
+        for kind, loc, entry_lastmod in iter_sitemap(content):
+            if kind == "sitemap":
+                if self.watermarks.is_changed(loc, entry_lastmod) or entry_lastmod is None:
+                    self._sitemaps.append((loc, entry_lastmod))
+            elif not self.include or self.include in loc:
+                self.pages[loc] = entry_lastmod
+        self.sitemaps_read.append((sitemap_url or self.url, lastmod))
+
+    def pending_sitemaps(self) -> Iterator[Tuple[str, Optional[str]]]:
+        """Child sitemaps still to fetch, including ones queued while iterating."""
+        while self._sitemaps:
+            yield self._sitemaps.pop(0)
+
+    def changed_pages(self) -> List[Tuple[str, Optional[str]]]:
+        """New or changed pages, newest first, capped at max_urls.
+
+        Pages beyond the cap wait for the next run, except on the first run,
+        where they are recorded as already seen rather than backfilled.
+        """
+        changed = [(loc, lastmod) for loc, lastmod in self.pages.items() if self.watermarks.is_changed(loc, lastmod)]
+        changed.sort(key=lambda entry: lastmod_key(entry[1]), reverse=True)
+        selected, rest = changed[:self.max_urls], changed[self.max_urls:]
+
+        if rest:
+            if self.first_run:
+                for loc, lastmod in rest:
+                    self.watermarks.advance(loc, lastmod)
+                logger.info(f"Recorded {len(rest)} older sitemap URLs for {self.source} without fetching them")
+            else:
+                self.complete = False
+                logger.info(f"Deferring {len(rest)} changed sitemap URLs for {self.source} to the next run")
+        return selected
+
+    def done(self, loc: str, lastmod: Optional[str]):
+        """Record a page as fetched up to its lastmod."""
+        self.watermarks.advance(loc, lastmod)
+
+    def failed(self, url: str, error: Exception):
+        """Note a sitemap or page that could not be fetched, so its sitemaps are read again next run."""
+        logger.warning(f"Sitemap discovery for {self.source} skipped {url}: {error}")
+        self.complete = False
+
+    def article(self, articles: List[Dict[str, Any]], loc: str, lastmod: Optional[str]) -> Optional[Dict[str, Any]]:
+        """The article extracted from a page, linked to its sitemap URL and dated by lastmod if undated."""
+        if not articles:
+            logger.debug(f"No article extracted from {loc}")
+            return None
+        article = {**articles[0], "link": loc}
+        if not article.get("date") and lastmod:
+            article["date"] = lastmod
+        return article
+
+    def finish(self):
+        """Mark the root as read, and child sitemaps too once every changed page was handled."""
+        self.watermarks.advance(self.url, None)
+        if self.complete:
+            for url, lastmod in self.sitemaps_read:
+                self.watermarks.advance(url, lastmod)
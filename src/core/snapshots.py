@@ -0,0 +1,204 @@
+"""
+Content-addressed store of raw response bodies.
+
+Every fetched body is gzipped under the SHA-256 of its bytes, so a page
+that has not changed since an earlier run costs no new storage. A JSON
+Lines index per run maps (source, url, fetch time) to the blob, which is
+what lets extraction be re-run later without going back to the network.
+
+Layout under storage.raw_data_dir:
+
+    blobs/ab/ab12...ef.gz     compressed bodies, named by digest
+    index/<run_id>.jsonl      one line per fetched (or 304-reused) page
+    latest.json               url -> digest of the most recent body
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+from loguru import logger
+
+from src.utils.json_store import load_json, save_json
+
+
+class SnapshotWriter:
+    """Hashes and compresses a body as it arrives, then files it under its digest."""
+
+    def __init__(self, store: "SnapshotStore", url: str, content_type: Optional[str] = None):
+        self.store = store
+        self.url = url
+        self.content_type = content_type
+        self.size = 0
+        self._digest = hashlib.sha256()
+        fd, self._tmp_path = tempfile.mkstemp(dir=store.blobs_dir, suffix=".tmp")
+        self._file = os.fdopen(fd, "wb")
+        # mtime=0 keeps the compressed bytes a pure function of the content
+        self._gzip = gzip.GzipFile(fileobj=self._file, mode="wb", compresslevel=store.compress_level, mtime=0)
+
+    def write(self, chunk: bytes):
+        """Add the next chunk of the body."""
+        self._digest.update(chunk)
+        self._gzip.write(chunk)
+        self.size += len(chunk)
+
+    def commit(self) -> str:
+        """Finish the blob, record it for the URL and return its digest."""
+        self._gzip.close()
+        self._file.close()
+        digest = self._digest.hexdigest()
+        self.store._add_blob(digest, Path(self._tmp_path), self.size)
+        self.store.record(self.url, digest, self.size, self.content_type)
+        return digest
+
+    def discard(self):
+        """Drop a partially written body."""
+        self._gzip.close()
+        self._file.close()
+        Path(self._tmp_path).unlink(missing_ok=True)
+
+
+class SnapshotStore:
+    """Deduplicated, compressed raw bodies plus a per-run index."""
+
+    def __init__(self, raw_dir: str = "data/raw", compress_level: int = 6):
+        self.raw_dir = Path(raw_dir)
+        self.blobs_dir = self.raw_dir / "blobs"
+        self.index_dir = self.raw_dir / "index"
+        self.latest_path = self.raw_dir / "latest.json"
+        self.blobs_dir.mkdir(parents=True, exist_ok=True)
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        self.compress_level = compress_level
+        self.run_id: Optional[str] = None
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._latest: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.reset_stats()
+        self.load()
+
+    def start_run(self, run_id: Optional[str] = None) -> str:
+        """Begin a new index and reset per-run counters."""
+        run_id = run_id or datetime.now().strftime("%Y%m%d_%H%M%S")
+        suffix = 1
+        self.run_id = run_id
+        while (self.index_dir / f"{self.run_id}.jsonl").exists():
+            suffix += 1
+            self.run_id = f"{run_id}_{suffix}"
+        self.reset_stats()
+        return self.run_id
+
+    def reset_stats(self):
+        """Start a fresh set of per-run counters."""
+        self.stats = {"snapshots": 0, "new_blobs": 0, "deduplicated": 0, "bytes_raw": 0, "bytes_stored": 0}
+
+    def blob_path(self, digest: str) -> Path:
+        """Return where the body with this digest is stored."""
+        return self.blobs_dir / digest[:2] / f"{digest}.gz"
+
+    def writer(self, url: str, content_type: Optional[str] = None) -> SnapshotWriter:
+        """Return a writer for a body that arrives in chunks."""
+        return SnapshotWriter(self, url, content_type)
+
+    def save(self, url: str, body: bytes, content_type: Optional[str] = None) -> str:
+        """Store a complete body and return its digest."""
+        writer = self.writer(url, content_type)
+        try:
+            writer.write(body)
+        except Exception:
+            writer.discard()
+            raise
+        return writer.commit()
+
+    def read(self, digest: str) -> bytes:
+        """Return the decompressed body for a digest."""
+        with gzip.open(self.blob_path(digest), "rb") as f:
+            return f.read()
+
+    def record(self, url: str, digest: str, size: int, content_type: Optional[str] = None):
+        """Hold a stored body for a URL until the source that fetched it is indexed."""
+        with self._lock:
+            self._pending[url] = {
+                "sha256": digest,
+                "size": size,
+                "content_type": content_type,
+                "fetched_at": datetime.now().isoformat(),
+            }
+
+    def index(self, source: str, url: str) -> Optional[Dict[str, Any]]:
+        """Append the body recorded for a URL to this run's index."""
+        with self._lock:
+            pending = self._pending.pop(url, None)
+        if not pending:
+            return None
+        return self._append({"source": source, "url": url, **pending})
+
+    def index_not_modified(self, source: str, url: str) -> Optional[Dict[str, Any]]:
+        """Index the most recent body for a URL that answered 304, so the run stays replayable."""
+        digest = self._latest.get(url)
+        if not digest or not self.blob_path(digest).exists():
+            return None
+        entry = {
+            "source": source,
+            "url": url,
+            "sha256": digest,
+            "fetched_at": datetime.now().isoformat(),
+            "not_modified": True,
+        }
+        return self._append(entry)
+
+    def load_index(self, run: str) -> List[Dict[str, Any]]:
+        """Read the index for a run id, or from an explicit index file path."""
+        path = Path(run)
+        if not path.is_file():
+            path = self.index_dir / f"{run}.jsonl"
+        with open(path) as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def runs(self) -> List[str]:
+        """Return the ids of all indexed runs, oldest first."""
+        return sorted(path.stem for path in self.index_dir.glob("*.jsonl"))
+
+    def load(self):
+        """Load the url -> latest digest map from previous runs."""
+        self._latest = load_json(self.latest_path, "snapshot map") or {}
+
+    def save_latest(self):
+        """Persist the url -> latest digest map for the next run."""
+        with self._lock:
+            save_json(self.latest_path, self._latest, indent=2, sort_keys=True)
+
+    def summary(self) -> Dict[str, Any]:
+        """Return per-run counters."""
+        return {"run_id": self.run_id, **self.stats}
+
+    def _add_blob(self, digest: str, tmp_path: Path, size: int):
+        """Move a finished temp file into place unless the same body is already stored."""
+        path = self.blob_path(digest)
+        with self._lock:
+            self.stats["bytes_raw"] += size
+            if path.exists():
+                self.stats["deduplicated"] += 1
+                tmp_path.unlink(missing_ok=True)
+                return
+            self.stats["new_blobs"] += 1
+            self.stats["bytes_stored"] += tmp_path.stat().st_size
+            path.parent.mkdir(exist_ok=True)
+            tmp_path.replace(path)
+
+    def _append(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        if self.run_id is None:
+            self.start_run()
+        line = json.dumps(entry) + "\n"
+        with self._lock:
+            self.stats["snapshots"] += 1
+            self._latest[entry["url"]] = entry["sha256"]
+            with open(self.index_dir / f"{self.run_id}.jsonl", "a") as f:
+                f.write(line)
+        logger.debug(f"Indexed snapshot of {entry['url']} as {entry['sha256'][:12]}")
+        return entry
@@ -0,0 +1,82 @@
+"""
+Streaming response parsing.
+
+Response bodies are fed chunk by chunk into lxml's incremental HTML parser,
+which decodes bytes natively, so a large page is never held both as raw
+bytes and as a decoded string. Reading stops once a byte cap is reached.
+"""
+
+from typing import Callable, Optional
+
+import lxml.html
+from loguru import logger
+
+# Bytes read from the socket per iteration
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Default cap on bytes read per response in streaming mode
+DEFAULT_MAX_RESPONSE_BYTES = 5 * 1024 * 1024
+
+
+def charset_from_content_type(content_type: Optional[str]) -> Optional[str]:
+    """Return the charset parameter of a Content-Type header, if any."""
+    if not content_type:
+        return None
+
+    for param in content_type.split(";")[1:]:
+        key, _, value = param.strip().partition("=")
+        if key.strip().lower() == "charset" and value.strip("\"' "):
+            return value.strip("\"' ")
+    return None
+
+
+class IncrementalHTMLParser:
+    """Builds an lxml document from body chunks, ignoring bytes past max_bytes.
+
+    If given, on_chunk receives exactly the bytes that were parsed.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        charset: Optional[str] = None,
+        max_bytes: Optional[int] = DEFAULT_MAX_RESPONSE_BYTES,
+        on_chunk: Optional[Callable[[bytes], None]] = None,
+    ):
+        self.url = url
+        self.max_bytes = max_bytes
+        self.on_chunk = on_chunk
+        self.size = 0
+        self.truncated = False
+
+        try:
+            self._parser = lxml.html.HTMLParser(encoding=charset)
+        except LookupError:
+            # Unknown charset in the header; let libxml2 sniff the document instead
+            logger.debug(f"Ignoring unknown charset {charset!r} for {url}")
+            self._parser = lxml.html.HTMLParser()
+
+    def feed(self, chunk: bytes) -> bool:
+        """Parse the next chunk, returning False once the byte cap is reached."""
+        if self.max_bytes:
+            remaining = self.max_bytes - self.size
+            if len(chunk) > remaining:
+                chunk = chunk[:remaining]
+                self.truncated = True
+
+        if chunk:
+            self._parser.feed(chunk)
+            self.size += len(chunk)
+            if self.on_chunk:
+                self.on_chunk(chunk)
+
+        if self.truncated:
+            logger.warning(f"Stopped reading {self.url} at {self.max_bytes} bytes")
+            return False
+        return True
+
+    def close(self) -> Optional[lxml.html.HtmlElement]:
+        """Finish parsing and return the document root, or None for an empty body."""
+        if not self.size:
+            return None
+        return self._parser.close()
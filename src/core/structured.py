@@ -0,0 +1,192 @@
+"""
+Structured-data extraction from embedded JSON.
+
+Many listings are rendered from JSON shipped in the page itself: schema.org
+`application/ld+json` blocks, a Next.js `__NEXT_DATA__` payload, or a state
+object assigned in an inline script. A source's `structured` block names
+where the JSON lives and maps article fields to paths inside it. Script
+bodies are located with a linear scan of the raw page and only those bytes
+are decoded, so no DOM is built and no CSS selector is evaluated.
+"""
+
+import hashlib
+import json
+import re
+from typing import Dict, Iterator, List, Any, Optional, Union
+from urllib.parse import urljoin
+
+from loguru import logger
+from lxml import etree
+
+from src.core.text import html_to_text
+
+STRUCTURED_TYPES = ("json_ld", "next_data", "script")
+
+# schema.org types treated as articles in JSON-LD
+ARTICLE_TYPES = {"Article", "BlogPosting", "NewsArticle", "TechArticle", "Report", "ScholarlyArticle"}
+
+# Field paths used for JSON-LD unless the source maps its own
+JSON_LD_FIELDS = {
+    "title": ["headline", "name"],
+    "date": ["datePublished", "dateCreated", "dateModified"],
+    "content": ["description", "abstract", "articleBody"],
+    "link": ["url", "mainEntityOfPage.@id", "mainEntityOfPage", "@id"],
+}
+
+_SCRIPT_RE = {
+    str: re.compile(r"<script\b([^>]*)>", re.IGNORECASE),
+    bytes: re.compile(rb"<script\b([^>]*)>", re.IGNORECASE),
+}
+_SCRIPT_END = {str: re.compile(r"</script\s*>", re.IGNORECASE), bytes: re.compile(rb"</script\s*>", re.IGNORECASE)}
+_ATTR_RE = re.compile(r"""([\w:-]+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""")
+
+
+def iter_scripts(content: Union[str, bytes]) -> Iterator[Dict[str, Any]]:
+    """Yield the attributes and raw body of each inline <script> in a page, without parsing the page."""
+    kind = bytes if isinstance(content, bytes) else str
+    start_re, end_re = _SCRIPT_RE[kind], _SCRIPT_END[kind]
+    pos = 0
+    while True:
+        start = start_re.search(content, pos)
+        if not start:
+            return
+        end = end_re.search(content, start.end())
+        if not end:
+            return
+        attrs = start.group(1)
+        if isinstance(attrs, bytes):
+            attrs = attrs.decode("latin-1")
+        yield {
+            "attrs": {m.group(1).lower(): m.group(2) or m.group(3) or m.group(4) for m in _ATTR_RE.finditer(attrs)},
+            "body": content[start.end():end.start()],
+        }
+        pos = end.end()
+
+
+def resolve(value: Any, path: str) -> Iterator[Any]:
+    """Yield the values at a dotted path; `*` steps into every item of a list or dict."""
+    if not path:
+        yield value
+        return
+    key, _, rest = path.partition(".")
+    if key == "*":
+        children = value.values() if isinstance(value, dict) else value if isinstance(value, list) else []
+        for child in children:
+            yield from resolve(child, rest)
+    elif isinstance(value, dict) and key in value:
+        yield from resolve(value[key], rest)
+    elif isinstance(value, list) and key.lstrip("-").isdigit() and -len(value) <= int(key) < len(value):
+        yield from resolve(value[int(key)], rest)
+
+
+class StructuredExtractor:
+    """Extracts articles from a page's embedded JSON using a source's field mapping."""
+
+    def __init__(self, config: Dict[str, Any], max_content_length: Optional[int] = None):
+        self.type = config.get("type", "json_ld")
+        if self.type not in STRUCTURED_TYPES:
+            raise ValueError(f"Unknown structured data type {self.type!r}; expected one of {STRUCTURED_TYPES}")
+        self.items = config.get("items")
+        if self.type != "json_ld" and not self.items:
+            raise ValueError(f"Structured data of type {self.type!r} needs an `items` path")
+        self.script_id = config.get("script_id")
+        self.marker = config.get("marker")
+        fields = config.get("fields") or (JSON_LD_FIELDS if self.type == "json_ld" else {})
+        self.fields = {field: [paths] if isinstance(paths, str) else list(paths) for field, paths in fields.items()}
+        self.link_base = config.get("link_base")
+        self.max_content_length = max_content_length
+
+    def extract(self, content: Union[str, bytes, etree._Element], source_url: str) -> List[Dict[str, Any]]:
+        """Return the articles found in the page's embedded JSON (empty if none was found)."""
+        articles = []
+        for item in self._items(content, source_url):
+            article = self._article(item, source_url)
+            if article:
+                articles.append(article)
+        return articles
+
+    def _documents(self, content: Union[str, bytes, etree._Element], source_url: str) -> Iterator[Any]:
+        """Yield each decoded JSON document this source's type points at."""
+        if isinstance(content, etree._Element):
+            scripts = [{"attrs": dict(el.attrib), "body": el.text or ""} for el in content.iter("script")]
+        else:
+            scripts = iter_scripts(content)
+
+        for script in scripts:
+            attrs, body = script["attrs"], script["body"]
+            if self.type == "json_ld" and attrs.get("type", "").strip().lower() != "application/ld+json":
+                continue
+            if self.type == "next_data" and attrs.get("id") != "__NEXT_DATA__":
+                continue
+            if self.type == "script":
+                if self.script_id and attrs.get("id") != self.script_id:
+                    continue
+                if self.marker:
+                    text = body.decode("utf-8", errors="replace") if isinstance(body, bytes) else body
+                    offset = text.find(self.marker)
+                    if offset < 0:
+                        continue
+                    body = text[offset + len(self.marker):].lstrip()
+            try:
+                # raw_decode stops at the end of the value, ignoring any trailing `;` or code
+                if isinstance(body, bytes):
+                    body = body.decode("utf-8", errors="replace")
+                yield json.JSONDecoder().raw_decode(body.strip())[0]
+            except ValueError as e:
+                logger.debug(f"Skipping unparseable {self.type} block in {source_url}: {e}")
+                continue
+            if self.type == "next_data":
+                return
+
+    def _items(self, content: Union[str, bytes, etree._Element], source_url: str) -> Iterator[Dict[str, Any]]:
+        for document in self._documents(content, source_url):
+            if self.items:
+                for items in resolve(document, self.items):
+                    for item in items if isinstance(items, list) else [items]:
+                        if isinstance(item, dict):
+                            yield item
+            else:
+                yield from self._json_ld_articles(document)
+
+    def _json_ld_articles(self, node: Any) -> Iterator[Dict[str, Any]]:
+        """Walk a JSON-LD document for article-typed nodes, through @graph and ItemList entries."""
+        if isinstance(node, list):
+            for child in node:
+                yield from self._json_ld_articles(child)
+        elif isinstance(node, dict):
+            types = node.get("@type")
+            types = set(types) if isinstance(types, list) else {types}
+            if types & ARTICLE_TYPES:
+                yield node
+                return
+            for key in ("@graph", "itemListElement", "item", "mainEntity", "blogPost", "hasPart"):
+                if key in node:
+                    yield from self._json_ld_articles(node[key])
+
+    def _field(self, item: Dict[str, Any], field: str) -> Optional[str]:
+        for path in self.fields.get(field, []):
+            for value in resolve(item, path):
+                if isinstance(value, list) and all(isinstance(v, str) for v in value):
+                    value = " ".join(value)
+                if isinstance(value, (str, int, float)) and not isinstance(value, bool) and str(value).strip():
+                    return str(value).strip()
+        return None
+
+    def _article(self, item: Dict[str, Any], source_url: str) -> Optional[Dict[str, Any]]:
+        title = self._field(item, "title")
+        if not title:
+            return None
+
+        # Embedded bodies are often HTML (JSON-LD articleBody, CMS excerpts)
+        content = html_to_text(self._field(item, "content"), self.max_content_length)
+        link = self._field(item, "link")
+        link = urljoin(self.link_base or source_url, link) if link else source_url
+
+        return {
+            "title": title,
+            "date": self._field(item, "date"),
+            "content": content,
+            "link": link,
+            "source_url": source_url,
+            "content_hash": hashlib.sha256(f"{title}{content}".encode()).hexdigest(),
+        }
@@ -0,0 +1,95 @@
+"""
+Streaming HTML-to-text conversion.
+
+Feed entries and embedded JSON carry article bodies as HTML strings. They
+are fed in chunks to lxml's HTML parser with a target that receives the
+tokenizer's events directly, so no tree is built and entities arrive
+decoded. Text inside non-content elements (scripts, styles, embedded
+media) is dropped, and whitespace is collapsed as the text is produced.
+Conversion stops once the output reaches a length cap, so the rest of a
+huge body is never tokenized or joined.
+"""
+
+from typing import List, Optional
+
+from lxml import etree
+
+# Elements whose text is never article content
+SKIP_TAGS = frozenset({
+    "script", "style", "noscript", "template", "head", "title",
+    "iframe", "object", "embed", "svg", "math", "canvas", "select", "button",
+})
+
+# Elements that separate words even without surrounding whitespace ("a</p><p>b" reads "a b")
+BLOCK_TAGS = frozenset({
+    "p", "br", "div", "li", "ul", "ol", "dd", "dt", "dl", "tr", "td", "th", "table",
+    "h1", "h2", "h3", "h4", "h5", "h6", "blockquote", "pre", "hr", "section", "article",
+    "header", "footer", "aside", "figure", "figcaption", "img",
+})
+
+# Characters fed to the tokenizer at a time
+CHUNK_SIZE = 8192
+
+
+class _TextCollector:
+    """lxml parser target collecting normalised text until it holds max_length characters."""
+
+    def __init__(self, max_length: Optional[int]):
+        self.max_length = max_length
+        self.parts: List[str] = []
+        self.full = False
+        self._skip = 0
+        # Raw characters that can still arrive before the normalised text could reach the cap
+        self._unchecked = max_length
+
+    def start(self, tag, attrib):
+        if tag in SKIP_TAGS:
+            self._skip += 1
+        elif tag in BLOCK_TAGS and not self._skip:
+            self.parts.append(" ")
+
+    def end(self, tag):
+        if tag in SKIP_TAGS:
+            self._skip = max(self._skip - 1, 0)
+        elif tag in BLOCK_TAGS and not self._skip:
+            self.parts.append(" ")
+
+    def data(self, data):
+        if self._skip or self.full:
+            return
+        self.parts.append(data)
+        if self._unchecked is None:
+            return
+        self._unchecked -= len(data)
+        if self._unchecked <= 0:
+            # Normalise what was collected so far; each raw character adds at most one to the text
+            raw = "".join(self.parts)
+            text = " ".join(raw.split())
+            self.parts = [text, " "] if raw[-1:].isspace() else [text]
+            self.full = len(text) >= self.max_length
+            self._unchecked = self.max_length - len(text)
+
+    def close(self):
+        text = " ".join("".join(self.parts).split())
+        return text[: self.max_length] if self.max_length is not None else text
+
+
+def html_to_text(markup: Optional[str], max_length: Optional[int] = None) -> str:
+    """Return the visible text of an HTML fragment with entities decoded and whitespace collapsed.
+
+    At most max_length characters are returned; tokenizing stops as soon as they are collected.
+    """
+    if not markup:
+        return ""
+    if "<" not in markup and "&" not in markup:
+        # Plain text: only whitespace to normalise
+        text = " ".join(markup.split())
+        return text[:max_length] if max_length is not None else text
+
+    collector = _TextCollector(max_length)
+    parser = etree.HTMLParser(target=collector)
+    for start in range(0, len(markup), CHUNK_SIZE):
+        parser.feed(markup[start:start + CHUNK_SIZE])
+        if collector.full:
+            break
+    return parser.close()
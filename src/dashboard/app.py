@@ -2,14 +2,27 @@
 Flask-based web dashboard for real-time intelligence viewing.
 """
 
-from flask import Flask, render_template_string, jsonify
+from flask import Flask, render_template_string, jsonify, request
 from typing import Dict, Any
 from datetime import datetime, timedelta
 
+from src.core.registry import SourceRegistry
+
+
+def _source_info(source: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": source["id"],
+        "name": source.get("name"),
+        "url": source.get("url"),
+        "priority": source["priority"],
+        "tier": source["tier"],
+    }
+
 
 def create_app(config: Dict[str, Any], data: Dict[str, Any]) -> Flask:
     """Create and configure Flask application."""
     app = Flask(__name__)
+    registry = SourceRegistry.from_config(config)
 
     @app.route("/")
     def index():
@@ -17,17 +30,8 @@ def create_app(config: Dict[str, Any], data: Dict[str, Any]) -> Flask:
         articles = data.get("articles", [])
         stats = data.get("stats", {})
 
-        # Get all configured sources from config
-        all_sources = []
-        sources_config = config.get("sources", {})
-        for tier in ["tier1", "tier2", "tier3"]:
-            for source in sources_config.get(tier, []):
-                all_sources.append({
-                    "name": source.get("name"),
-                    "url": source.get("url"),
-                    "priority": source.get("priority", "medium"),
-                    "tier": tier
-                })
+        # Get all sources from the registry
+        all_sources = [_source_info(source) for source in registry]
 
         # Group articles by source
         articles_by_source = {}
@@ -67,17 +71,14 @@ def create_app(config: Dict[str, Any], data: Dict[str, Any]) -> Flask:
 
     @app.route("/api/sources")
     def api_sources():
-        """API endpoint for source statistics."""
-        sources_config = config.get("sources", {})
-        all_sources = []
-        for tier in ["tier1", "tier2", "tier3"]:
-            for source in sources_config.get(tier, []):
-                all_sources.append({
-                    "name": source.get("name"),
-                    "url": source.get("url"),
-                    "priority": source.get("priority", "medium"),
-                    "tier": tier
-                })
+        """API endpoint for source statistics (filter with ?tier= or ?domain=)."""
+        if request.args.get("domain"):
+            sources = registry.for_domain(request.args["domain"])
+        elif request.args.get("tier"):
+            sources = registry.in_tier(request.args["tier"])
+        else:
+            sources = list(registry)
+        all_sources = [_source_info(source) for source in sources]
         return jsonify({"sources": all_sources})
 
     return app
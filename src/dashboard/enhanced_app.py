@@ -6,10 +6,13 @@ from flask import Flask, render_template_string, jsonify
 from typing import Dict, Any
 from datetime import datetime, timedelta
 
+from src.core.registry import SourceRegistry
+
 
 def create_app(config: Dict[str, Any], data: Dict[str, Any]) -> Flask:
     """Create and configure Flask application."""
     app = Flask(__name__)
+    registry = SourceRegistry.from_config(config)
 
     @app.route("/")
     def index():
@@ -17,17 +20,16 @@ def create_app(config: Dict[str, Any], data: Dict[str, Any]) -> Flask:
         articles = data.get("articles", [])
         stats = data.get("stats", {})
 
-        # Get all configured sources from config
-        all_sources = []
-        sources_config = config.get("sources", {})
-        for tier in ["tier1", "tier2", "tier3"]:
-            for source in sources_config.get(tier, []):
-                all_sources.append({
-                    "name": source.get("name"),
-                    "url": source.get("url"),
-                    "priority": source.get("priority", "medium"),
-                    "tier": tier.replace("tier", "Tier ")
-                })
+        # Get all sources from the registry
+        all_sources = [
+            {
+                "name": source.get("name"),
+                "url": source.get("url"),
+                "priority": source["priority"],
+                "tier": source["tier"].replace("tier", "Tier "),
+            }
+            for source in registry
+        ]
 
         # Group articles by source
         articles_by_source = {}
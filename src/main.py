@@ -4,11 +4,16 @@ Orchestrates scraping, processing, and reporting.
 """
 
 import sys
+import time
 from pathlib import Path
+from typing import Optional
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from src.core.registry import TIERS, SourceRegistry
+from src.core.replay import SnapshotReplay
+from src.core.scheduler import PRIORITY_RANKS
 from src.core.scraper import CompetitorScraper
 from src.processors.content_processor import ContentProcessor
 from src.reporters.report_generator import ReportGenerator
@@ -19,9 +24,11 @@ from src.utils.logger_setup import setup_logging, get_logger
 class CompetitorIntelligence:
     """Main orchestrator for competitive intelligence gathering."""
 
-    def __init__(self, config_path: str = "config/config.yaml"):
+    def __init__(self, config_path: str = "config/config.yaml", profile: bool = False):
         # Load configuration
         self.config = load_config(config_path)
+        if profile:
+            self.config.setdefault("scraping", {})["profile_extraction"] = True
 
         # Setup logging
         setup_logging(self.config)
@@ -30,32 +37,53 @@ class CompetitorIntelligence:
         # Initialize components
         self.scraper = CompetitorScraper(self.config)
         self.processor = ContentProcessor(self.config)
-        self.reporter = ReportGenerator(self.config)
+        self.reporter = ReportGenerator(self.config, self.scraper.registry)
 
         self.logger.info("AI Competitor Intelligence Tracker initialized")
 
-    def execute_intelligence_gathering(self):
-        """Execute the complete intelligence gathering pipeline."""
+    def execute_intelligence_gathering(self, replay: Optional[str] = None):
+        """Execute the complete intelligence gathering pipeline.
+
+        With `replay` (a run id, index file, raw data directory or "latest"),
+        captured snapshots are parsed instead of fetching from the network.
+        """
         self.logger.info("=" * 80)
         self.logger.info("STARTING COMPETITIVE INTELLIGENCE GATHERING")
         self.logger.info("=" * 80)
 
         try:
+            timings = {}
+
             # Step 1: Scrape all sources
-            self.logger.info("STEP 1: Scraping competitor sources...")
-            scrape_results = self.scraper.scrape_all()
+            started = time.perf_counter()
+            if replay:
+                self.logger.info(f"STEP 1: Replaying captured run {replay}...")
+                replayer = SnapshotReplay(self.config, self.scraper.sources)
+                scrape_results = replayer.run(replay)
+                run_stats = {"replay": replayer.stats}
+            else:
+                self.logger.info("STEP 1: Scraping competitor sources...")
+                scrape_results = self.scraper.scrape_all()
+                run_stats = self.scraper.get_run_stats()
+            timings["scrape"] = time.perf_counter() - started
             self.logger.success(f"Scraping complete. Results from {len(scrape_results)} sources")
 
             # Step 2: Process and validate content
             self.logger.info("STEP 2: Processing and validating content...")
+            started = time.perf_counter()
             processed_data = self.processor.process_scrape_results(scrape_results)
+            processed_data["stats"].update(run_stats)
+            timings["process"] = time.perf_counter() - started
             self.logger.success(
                 f"Processing complete. {len(processed_data['articles'])} valid articles"
             )
 
             # Step 3: Generate reports
             self.logger.info("STEP 3: Generating reports...")
+            started = time.perf_counter()
             report_files = self.reporter.generate_reports(processed_data)
+            timings["report"] = time.perf_counter() - started
+            processed_data["stats"]["timings"] = {stage: round(seconds, 3) for stage, seconds in timings.items()}
             self.logger.success(f"Reports generated: {len(report_files)} formats")
 
             # Display summary
@@ -95,6 +123,25 @@ class CompetitorIntelligence:
         self.logger.info(f"After Deduplication: {stats.get('articles_after_deduplication', 0)}")
         self.logger.info(f"Duplicates Removed: {stats.get('duplicates_removed', 0)}")
         self.logger.info(f"Invalid Articles: {stats.get('invalid_articles', 0)}")
+        if "http_cache" in stats:
+            cache_stats = stats["http_cache"]
+            self.logger.info(
+                f"HTTP Cache Hits: {cache_stats['hits']}/{cache_stats['requests']} "
+                f"({cache_stats['hit_rate']:.0%}), {cache_stats['bytes_saved'] / 1024:.1f} KB saved"
+            )
+        if "replay" in stats:
+            replay_stats = stats["replay"]
+            self.logger.info(
+                f"Replayed Run: {replay_stats['run_id']} ({replay_stats['pages']} pages, "
+                f"{replay_stats['pages_per_second']} pages/s)"
+            )
+        profile_path = stats.get("extraction_profile") or stats.get("replay", {}).get("extraction_profile")
+        if profile_path:
+            self.logger.info(f"Extraction Profile: {profile_path}")
+        if "timings" in stats:
+            self.logger.info(
+                "Stage Timings: " + ", ".join(f"{stage} {seconds:.2f}s" for stage, seconds in stats["timings"].items())
+            )
         self.logger.info("")
         self.logger.info("Generated Reports:")
         for format_name, file_path in report_files.items():
@@ -130,12 +177,58 @@ def main():
         action="store_true",
         help="Launch web dashboard after gathering intelligence",
     )
+    parser.add_argument(
+        "--replay",
+        type=str,
+        metavar="RUN",
+        help="Re-run extraction, processing and reporting on a captured run "
+        "(run id, index file, raw data directory or 'latest') without network access",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile extraction per source and selector and write the profile next to the reports",
+    )
+
+    parser.add_argument(
+        "--import-sources",
+        type=str,
+        metavar="FILE",
+        help="Import an OPML or CSV source list into the source registry (sources.registry) and exit",
+    )
+    parser.add_argument(
+        "--tier",
+        choices=TIERS,
+        help="Tier for imported sources that do not set one (default: tier3)",
+    )
+    parser.add_argument(
+        "--priority",
+        choices=list(PRIORITY_RANKS),
+        help="Priority for imported sources that do not set one (default: medium)",
+    )
 
     args = parser.parse_args()
 
+    if args.import_sources:
+        config = load_config(args.config)
+        setup_logging(config)
+        registry = SourceRegistry.from_config(config)
+        try:
+            counts = registry.import_file(args.import_sources, tier=args.tier, priority=args.priority)
+            registry.save()
+        except (OSError, ValueError) as e:
+            print(f"Source import failed: {e}")
+            return 1
+        print(
+            f"Read {counts['read']} sources: {counts['added']} new, {counts['updated']} updated, "
+            f"{counts['collisions']} id collisions, {counts['configured']} already configured"
+        )
+        print(f"Source registry {registry.path} now holds {len(registry)} sources")
+        return 0
+
     # Initialize and run
-    tracker = CompetitorIntelligence(config_path=args.config)
-    result = tracker.execute_intelligence_gathering()
+    tracker = CompetitorIntelligence(config_path=args.config, profile=args.profile)
+    result = tracker.execute_intelligence_gathering(replay=args.replay)
 
     # Launch dashboard if requested
     if args.dashboard and result["status"] == "success":
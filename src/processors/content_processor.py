@@ -3,14 +3,15 @@ Content processing pipeline for validation, deduplication, and enrichment.
 """
 
 import hashlib
-import re
-from typing import List, Dict, Any, Set
+from typing import List, Dict, Any, Optional, Set, Union
 from datetime import datetime
 from dateutil import parser as date_parser
 
 import feedparser
 from loguru import logger
 
+from src.core.text import html_to_text
+
 
 class ContentValidator:
     """Validates scraped content for quality and relevance."""
@@ -120,31 +121,61 @@ class DateParser:
 class RSSFeedProcessor:
     """Processes RSS/Atom feeds as alternative to HTML scraping."""
 
-    def __init__(self):
-        pass
+    def __init__(self, max_content_length: Optional[int] = None):
+        self.max_content_length = max_content_length
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "RSSFeedProcessor":
+        """Build a processor whose entry text is capped at processing.max_content_length."""
+        return cls(max_content_length=config.get("processing", {}).get("max_content_length", 50000))
 
     def fetch_feed(self, feed_url: str) -> List[Dict[str, Any]]:
         """Fetch and parse RSS feed."""
         try:
             logger.info(f"Fetching RSS feed: {feed_url}")
-            feed = feedparser.parse(feed_url)
-
-            if feed.bozo:
-                logger.warning(f"RSS feed parse warning for {feed_url}: {feed.bozo_exception}")
-
-            articles = []
-            for entry in feed.entries:
-                article = self._parse_feed_entry(entry)
-                if article:
-                    articles.append(article)
-
-            logger.success(f"Parsed {len(articles)} articles from RSS feed")
-            return articles
+            return self._feed_articles(feedparser.parse(feed_url), feed_url)
 
         except Exception as e:
             logger.error(f"Error fetching RSS feed {feed_url}: {e}")
             return []
 
+    def parse_feed(
+        self, content: Union[str, bytes], feed_url: str, since: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """Parse an RSS/Atom document that was already fetched, resolving relative links against feed_url.
+
+        With `since` (naive UTC), only entries published after it are returned:
+        entries are read newest first and reading stops at the first older one.
+        """
+        if isinstance(content, str):
+            # feedparser treats a str as a URL or path; a fetched document is parsed from bytes
+            content = content.encode("utf-8")
+        # A generic XML type: without one feedparser flags every fetched document as bozo, and
+        # application/xml leaves the encoding to the document's own XML declaration
+        headers = {"content-location": feed_url, "content-type": "application/xml"}
+        feed = feedparser.parse(content, response_headers=headers)
+        return self._feed_articles(feed, feed_url, since)
+
+    def _feed_articles(self, feed, feed_url: str, since: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        if feed.bozo:
+            logger.warning(f"RSS feed parse warning for {feed_url}: {feed.bozo_exception}")
+
+        articles = []
+        for entry in feed.entries:
+            article = self._parse_feed_entry(entry)
+            if not article:
+                continue
+            if since is not None:
+                if not article["date"]:
+                    continue
+                if datetime.fromisoformat(article["date"]) <= since:
+                    break
+            article["source_url"] = feed_url
+            articles.append(article)
+
+        logger.success(f"Parsed {len(articles)} articles from RSS feed")
+        return articles
+
     def _parse_feed_entry(self, entry) -> Dict[str, Any]:
         """Parse a single RSS feed entry."""
         try:
@@ -160,17 +191,17 @@ class RSSFeedProcessor:
             elif hasattr(entry, "content"):
                 content = entry.content[0].value if entry.content else ""
 
-            # Remove HTML tags from content
-            content = re.sub(r"<[^>]+>", "", content).strip()
+            # Reduce HTML to text: entities decoded, scripts and styles dropped, length capped
+            content = html_to_text(content, self.max_content_length)
 
             # Extract link
             link = entry.get("link", "")
 
             # Extract date
             date = None
-            if hasattr(entry, "published_parsed"):
+            if entry.get("published_parsed"):
                 date = datetime(*entry.published_parsed[:6])
-            elif hasattr(entry, "updated_parsed"):
+            elif entry.get("updated_parsed"):
                 date = datetime(*entry.updated_parsed[:6])
 
             # Generate content hash
@@ -203,17 +234,19 @@ class ContentProcessor:
 
         self.duplicate_detector = DuplicateDetector()
         self.date_parser = DateParser()
-        self.rss_processor = RSSFeedProcessor()
+        self.rss_processor = RSSFeedProcessor.from_config(config)
 
     def process_scrape_results(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Process raw scraping results into clean, validated data."""
         logger.info("Starting content processing pipeline")
 
         all_articles = []
+        deferred = []
         stats = {
             "total_sources": len(results),
             "successful_sources": 0,
             "failed_sources": 0,
+            "deferred_sources": 0,
             "total_articles_raw": 0,
             "articles_after_validation": 0,
             "articles_after_deduplication": 0,
@@ -232,6 +265,11 @@ class ContentProcessor:
 
             if status == "success":
                 stats["successful_sources"] += 1
+            elif status == "deferred":
+                stats["deferred_sources"] += 1
+                deferred.append(source_name)
+                logger.info(f"Source {source_name} deferred to the next run")
+                continue
             else:
                 stats["failed_sources"] += 1
                 logger.warning(f"Source {source_name} failed: {result.get('error', 'Unknown error')}")
@@ -268,7 +306,12 @@ class ContentProcessor:
 
         logger.info(f"Content processing complete. Valid articles: {len(all_articles)}")
 
-        return {"articles": all_articles, "stats": stats, "timestamp": datetime.now().isoformat()}
+        return {
+            "articles": all_articles,
+            "stats": stats,
+            "deferred": deferred,
+            "timestamp": datetime.now().isoformat(),
+        }
 
     def _enrich_article(self, article: Dict[str, Any]) -> Dict[str, Any]:
         """Enrich article with additional metadata."""
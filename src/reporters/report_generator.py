@@ -4,12 +4,14 @@ Professional report generation in multiple formats (Markdown, JSON, HTML, CSV).
 
 import json
 import csv
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from datetime import datetime
 from pathlib import Path
 
 from loguru import logger
 
+from src.core.registry import SourceRegistry, source_domain
+
 
 class MarkdownReportGenerator:
     """Generates executive-style Markdown reports."""
@@ -62,8 +64,11 @@ class MarkdownReportGenerator:
             articles_by_source[source].append(article)
 
         # Generate section for each source
+        source_info = data.get("sources", {})
         for source, source_articles in sorted(articles_by_source.items()):
-            markdown += f"### {source}\n\n"
+            tier = source_info.get(source, {}).get("tier")
+            heading = f"{source} ({tier.replace('tier', 'Tier ')})" if tier else source
+            markdown += f"### {heading}\n\n"
 
             for article in source_articles[:3]:  # Top 3 per source
                 markdown += self._format_article_compact(article)
@@ -82,6 +87,7 @@ class MarkdownReportGenerator:
 | Total Sources Attempted | {stats.get('total_sources', 0)} |
 | Successful Sources | {stats.get('successful_sources', 0)} |
 | Failed Sources | {stats.get('failed_sources', 0)} |
+| Deferred Sources | {stats.get('deferred_sources', 0)} |
 | Raw Articles Collected | {stats.get('total_articles_raw', 0)} |
 | After Validation | {stats.get('articles_after_validation', 0)} |
 | After Deduplication | {stats.get('articles_after_deduplication', 0)} |
@@ -89,7 +95,18 @@ class MarkdownReportGenerator:
 | Duplicates Removed | {stats.get('duplicates_removed', 0)} |
 | Success Rate | {self._calculate_success_rate(stats)}% |
 
----
+"""
+
+        # Sources the run budget left for the next run
+        deferred = data.get("deferred", [])
+        if deferred:
+            markdown += "### Deferred Sources\n\n"
+            markdown += "*Not scraped this run; they go first within their priority next run.*\n\n"
+            for source in deferred:
+                markdown += f"- {source}\n"
+            markdown += "\n"
+
+        markdown += """---
 
 *Report generated by AI Competitor Intelligence Tracker*
 """
@@ -349,8 +366,9 @@ class HTMLReportGenerator:
 class ReportGenerator:
     """Main report generator coordinating all output formats."""
 
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], registry: Optional[SourceRegistry] = None):
         self.config = config
+        self.registry = registry if registry is not None else SourceRegistry.from_config(config)
         reporting_config = config.get("reporting", {})
 
         self.output_dir = Path(reporting_config.get("output_dir", "data/reports"))
@@ -370,6 +388,7 @@ class ReportGenerator:
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         generated_files = {}
+        data = {**data, "sources": self._source_metadata(data.get("articles", []))}
 
         for format_name in self.formats:
             if format_name not in self.generators:
@@ -400,3 +419,18 @@ class ReportGenerator:
 
         logger.success(f"Report generation complete. Files: {list(generated_files.values())}")
         return generated_files
+
+    def _source_metadata(self, articles: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Registry entries (id, tier, priority, url, domain) for the sources that produced articles."""
+        metadata = {}
+        for name in sorted({article["source"] for article in articles if article.get("source")}):
+            source = self.registry.find(name)
+            if source is not None:
+                metadata[name] = {
+                    "id": source["id"],
+                    "tier": source["tier"],
+                    "priority": source["priority"],
+                    "url": source.get("url"),
+                    "domain": source_domain(source),
+                }
+        return metadata
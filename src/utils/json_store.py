@@ -0,0 +1,38 @@
+"""
+JSON state files.
+
+Caches, watermarks, learned rates and the source registry are each kept in
+a JSON file that is read once at start-up and rewritten after a run. An
+unreadable file is logged and treated as missing, and writes go to a
+temporary file beside the target that is then renamed over it, so an
+interrupted run never leaves a truncated file behind.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+from loguru import logger
+
+
+def load_json(path: Path, description: str) -> Optional[Any]:
+    """Parse a JSON file; None when it is missing or unreadable (logged with `description`)."""
+    if not path.exists():
+        return None
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable {description} {path}: {e}")
+        return None
+
+
+def save_json(path: Path, data: Any, **dump_kwargs):
+    """Write data to path as JSON atomically; `dump_kwargs` go to json.dumps."""
+    payload = json.dumps(data, **dump_kwargs)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Unique per writer, so concurrent saves of the same file never share a temporary file
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_text(payload)
+    tmp_path.replace(path)
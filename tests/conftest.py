@@ -0,0 +1,141 @@
+"""
+Shared test fixtures: a loopback HTTP site, a base scraper configuration and a scraper factory.
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import pytest
+
+from src.core.scraper import CompetitorScraper
+
+# Selectors matching the `<article><h2>title</h2><p>body</p></article>` pages tests serve
+SELECTORS = {"article": "article", "title": "h2", "content": "p"}
+
+# What a route serves: a body (HTML), (body, content_type), (body, content_type, headers),
+# a status code, or None for 404; or a callable taking the request handler and returning one of these
+Route = Union[str, bytes, tuple, int, None, Callable[[BaseHTTPRequestHandler], Any]]
+
+
+class StubSite:
+    """The routes the `site` fixture serves, keyed by path, and what was requested.
+
+    A request is matched on its full path, then on its path without the
+    query string. `delay` holds every response back, and `peak` records the
+    most requests ever in flight at once.
+    """
+
+    def __init__(self, url: str):
+        self.url = url
+        self.routes: Dict[str, Route] = {}
+        self.requests: List[str] = []
+        self.delay = 0.0
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def reset(self):
+        """Forget the requests and the concurrency peak so far."""
+        with self.lock:
+            self.requests = []
+            self.peak = 0
+
+    def respond(self, request: BaseHTTPRequestHandler) -> tuple:
+        """The (status, content_type, headers, body) for a request."""
+        path = request.path
+        route = self.routes.get(path, self.routes.get(path.split("?")[0]))
+        if callable(route):
+            route = route(request)
+        if route is None:
+            return 404, None, {}, b""
+        if isinstance(route, int):
+            return route, None, {}, b""
+        if not isinstance(route, tuple):
+            route = (route,)
+        body, content_type, headers = route + ("text/html; charset=utf-8", {})[len(route) - 1:]
+        return 200, content_type, headers, body.encode() if isinstance(body, str) else body
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        site = self.server.site
+        with site.lock:
+            site.requests.append(self.path)
+            site.active += 1
+            site.peak = max(site.peak, site.active)
+        try:
+            if site.delay:
+                time.sleep(site.delay)
+            status, content_type, headers, body = site.respond(self)
+            self.send_response(status)
+            if content_type:
+                self.send_header("Content-Type", content_type)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with site.lock:
+                site.active -= 1
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def site():
+    """A loopback HTTP server; tests fill in `site.routes`."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.site = StubSite(f"http://127.0.0.1:{server.server_address[1]}")
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server.site
+    server.shutdown()
+
+
+@pytest.fixture
+def make_config(tmp_path):
+    """Build a scraper config with no delays, caches or snapshots, state kept under tmp_path.
+
+    `sources` is a list of tier1 sources or a whole sources section; the
+    scraping and storage dicts are merged over the defaults, and any other
+    keyword becomes a top-level section.
+    """
+
+    def make(
+        sources: Union[List[Dict[str, Any]], Dict[str, Any], None] = None,
+        scraping: Optional[Dict[str, Any]] = None,
+        storage: Optional[Dict[str, Any]] = None,
+        **sections,
+    ) -> Dict[str, Any]:
+        return {
+            "scraping": {"min_delay": 0, "max_delay": 0, "max_retries": 1, "user_agents": ["Test"], **(scraping or {})},
+            "storage": {"http_cache": False, "snapshots": False, "cache_dir": str(tmp_path), **(storage or {})},
+            "sources": sources if isinstance(sources, dict) else {"tier1": list(sources or [])},
+            **sections,
+        }
+
+    return make
+
+
+@pytest.fixture
+def make_scraper(make_config):
+    """Build a CompetitorScraper for one source named "Blog".
+
+    `source` is merged over that source and the default SELECTORS; `engine`
+    goes into the scraping section, and scraping, storage and any other
+    section are passed on to make_config.
+    """
+
+    def make(
+        source: Optional[Dict[str, Any]] = None,
+        engine: str = "threaded",
+        scraping: Optional[Dict[str, Any]] = None,
+        storage: Optional[Dict[str, Any]] = None,
+        **sections,
+    ) -> CompetitorScraper:
+        source = {"name": "Blog", "selectors": dict(SELECTORS), **(source or {})}
+        return CompetitorScraper(make_config([source], {"engine": engine, **(scraping or {})}, storage, **sections))
+
+    return make
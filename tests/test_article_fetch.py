@@ -0,0 +1,122 @@
+"""
+Unit tests for the full-article fetch stage.
+"""
+
+import pytest
+
+from src.core.article_fetch import extract_body
+
+POSTS = 6
+LISTING = "<html><body>" + "".join(
+    f'<article><h2>Post {i}</h2><p>Teaser {i}</p><a href="/post/{i}?utm_source=home">more</a></article>'
+    for i in range(POSTS)
+) + '<article><h2>Broken</h2><p>Teaser</p><a href="/missing">more</a></article></body></html>'
+
+
+def article_page(i):
+    paragraphs = "".join(f"<p>Paragraph {n} of post {i}.</p>" for n in range(5))
+    return f"<html><body><nav><p>Menu</p></nav><article><h1>Post {i}</h1>{paragraphs}</article></body></html>"
+
+
+@pytest.fixture
+def blog(site):
+    """The listing and its article pages, each page slow enough for fetches to overlap."""
+    site.routes["/blog"] = LISTING
+    site.routes.update({f"/post/{i}": article_page(i) for i in range(POSTS)})
+    site.delay = 0.05
+    return site
+
+
+@pytest.fixture
+def source(blog):
+    """The blog's listing as a source; selectors come from make_scraper."""
+    return {"url": f"{blog.url}/blog"}
+
+
+def full_articles(max_per_source=2, content=None):
+    """Scraping settings turning on the full-article stage."""
+    config = {"enabled": True, "max_per_source": max_per_source}
+    if content:
+        config["content"] = content
+    return {"full_articles": config}
+
+
+class TestExtractBody:
+    """Test extract_body functionality."""
+
+    def test_joins_every_matching_paragraph(self):
+        """Test that all body paragraphs are kept, not just the first three, and navigation is left out."""
+        body = extract_body(article_page(1).encode())
+
+        assert body.split("\n\n") == [f"Paragraph {n} of post 1." for n in range(5)]
+        assert extract_body(article_page(1), "article p:nth-of-type(2)") == "Paragraph 1 of post 1."
+        assert extract_body("") == ""
+
+
+class TestFullArticleFetcher:
+    """Test the full-article fetch stage in the scraper."""
+
+    def test_bodies_replace_excerpts_and_are_fetched_once(self, blog, source, make_scraper):
+        """Test that article pages are fetched with bounded fan-out and cached across runs."""
+        result = make_scraper(source, scraping=full_articles()).scrape_all()[0]
+
+        assert result["articles"][0]["content"].startswith("Paragraph 0 of post 0.")
+        assert result["articles"][-1]["content"] == "Teaser"
+        assert sorted(path for path in blog.requests if path.startswith("/post/")) == [
+            f"/post/{i}?utm_source=home" for i in range(POSTS)
+        ]
+        assert blog.peak <= 2
+
+        blog.reset()
+        again = make_scraper(source, scraping=full_articles()).scrape_all()[0]
+
+        assert blog.requests == ["/blog", "/missing"]
+        assert [a["content"] for a in again["articles"]] == [a["content"] for a in result["articles"]]
+
+    def test_async_engine_matches_threaded(self, tmp_path, blog, source, make_scraper):
+        """Test that both engines produce the same enriched articles."""
+        results = {}
+        for engine in ("threaded", "async"):
+            scraper = make_scraper(source, engine, full_articles(), {"cache_dir": str(tmp_path / engine)})
+            results[engine] = scraper.scrape_all()[0]
+
+        assert results["async"]["articles"] == results["threaded"]["articles"]
+        assert blog.peak <= 2
+
+    @pytest.mark.parametrize("engine", ["threaded", "async"])
+    def test_zero_max_per_source_fetches_one_at_a_time(self, blog, source, make_scraper, engine):
+        """Test that max_per_source of 0 is treated as 1 rather than breaking the engine."""
+        result = make_scraper(source, engine, scraping=full_articles(max_per_source=0)).scrape_all()[0]
+
+        assert result["articles"][0]["content"].startswith("Paragraph 0 of post 0.")
+        assert blog.peak == 1
+
+    def test_empty_bodies_are_not_cached_and_selector_changes_reextract(self, tmp_path, blog, source, make_scraper):
+        """Test that a page the selector finds nothing in is fetched again, and a new selector is not served stale."""
+        first = make_scraper(source, scraping=full_articles(content=".missing p")).scrape_all()[0]
+
+        assert first["articles"][0]["content"] == "Teaser 0"
+        assert not list((tmp_path / "articles").iterdir())
+
+        blog.reset()
+        second = make_scraper(source, scraping=full_articles()).scrape_all()[0]
+
+        assert len([path for path in blog.requests if path.startswith("/post/")]) == POSTS
+        assert second["articles"][0]["content"].startswith("Paragraph 0 of post 0.")
+
+        blog.reset()
+        make_scraper(source, scraping=full_articles(content="article p:nth-of-type(2)")).scrape_all()
+
+        assert len([path for path in blog.requests if path.startswith("/post/")]) == POSTS
+
+    @pytest.mark.parametrize("engine", ["threaded", "async"])
+    def test_article_pages_leave_no_pending_cache_or_snapshot_entries(self, tmp_path, source, make_scraper, engine):
+        """Test that article pages are not snapshotted or given validators that nothing would ever index."""
+        storage = {"http_cache": True, "snapshots": True, "raw_data_dir": str(tmp_path / "raw")}
+        scraper = make_scraper(source, engine, scraping=full_articles(), storage=storage)
+
+        scraper.scrape_all()
+
+        assert scraper.http_cache._pending == {}
+        assert scraper.snapshots._pending == {}
+        assert scraper.snapshots.summary()["new_blobs"] == 1
@@ -0,0 +1,99 @@
+"""
+Unit tests for the asyncio fetch engine.
+"""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from src.core.async_engine import AsyncScrapeEngine
+from src.core.scraper import CompetitorScraper, HTMLParser
+
+LISTING_PAGE = b"""<html><body>
+<article><h2>First post</h2><time datetime="2024-01-01">Jan 1</time><p>Hello</p><a href="/p/1">x</a></article>
+<article><h2>Second post</h2><time datetime="2024-01-02">Jan 2</time><p>World</p><a href="/p/2">x</a></article>
+</body></html>"""
+
+
+@pytest.fixture
+def listing_config(site, make_config):
+    """Config for one source per path on the site, each path but /missing serving the listing."""
+    site.routes.update({"/blog/a": LISTING_PAGE, "/blog/b": LISTING_PAGE})
+
+    def make(paths, engine="async"):
+        sources = [
+            {
+                "name": f"src{i}",
+                "url": f"{site.url}{path}",
+                "selectors": {"article": "article", "title": "h2", "date": "time", "content": "p"},
+                "priority": "critical",
+            }
+            for i, path in enumerate(paths)
+        ]
+        return make_config(sources, scraping={"engine": engine})
+
+    return make
+
+
+class TestAsyncScrapeEngine:
+    """Test AsyncScrapeEngine functionality."""
+
+    def test_results_match_threaded_engine(self, listing_config):
+        """Test that both engines return identical result dicts."""
+        paths = ["/blog/a", "/blog/b"]
+        async_results = CompetitorScraper(listing_config(paths, "async")).scrape_all()
+        threaded_results = CompetitorScraper(listing_config(paths, "threaded")).scrape_all()
+
+        by_source = lambda results: {r["source"]: r for r in results}
+        assert by_source(async_results) == by_source(threaded_results)
+        assert all(len(r["articles"]) == 2 for r in async_results)
+
+    def test_failed_source_reports_error(self, listing_config):
+        """Test that HTTP errors produce a failed result instead of raising."""
+        config = listing_config(["/missing"])
+        results = AsyncScrapeEngine(config).run(CompetitorScraper(config).sources)
+
+        assert results[0]["status"] == "failed"
+        assert results[0]["articles"] == []
+        assert "404" in results[0]["error"]
+
+    def test_streaming_matches_buffered(self, listing_config):
+        """Test that streaming mode yields the same articles as buffered fetches."""
+        config = listing_config(["/blog/a"])
+        buffered = AsyncScrapeEngine(config).run(CompetitorScraper(config).sources)
+        config["scraping"]["stream_responses"] = True
+        streamed = AsyncScrapeEngine(config).run(CompetitorScraper(config).sources)
+
+        assert streamed[0]["articles"] == buffered[0]["articles"]
+
+    def test_parsing_without_pool_runs_off_the_loop(self, listing_config):
+        """Test that without a parse pool pages are parsed in an executor thread, not on the event loop."""
+        config = listing_config(["/blog/a", "/blog/b"])
+        parse = HTMLParser.parse
+        threads = []
+
+        def record(parser, content, url):
+            threads.append(threading.current_thread())
+            return parse(parser, content, url)
+
+        with patch.object(HTMLParser, "parse", record):
+            results = AsyncScrapeEngine(config).run(CompetitorScraper(config).sources)
+
+        assert all(len(r["articles"]) == 2 for r in results)
+        assert len(threads) == 2 and threading.main_thread() not in threads
+
+    def test_source_deadline_starts_when_the_domain_slot_is_granted(self, site, make_config):
+        """Test that sources queued behind others on one host do not spend their deadline waiting."""
+        site.routes.update({f"/blog/{i}": LISTING_PAGE for i in range(8)})
+        sources = [
+            {"name": f"src{i}", "url": f"{site.url}/blog/{i}", "selectors": {"article": "article", "title": "h2"}}
+            for i in range(8)
+        ]
+        config = make_config(
+            sources, scraping={"engine": "async", "min_delay": 0.15, "max_delay": 0.15, "source_deadline": 0.5}
+        )
+
+        results = CompetitorScraper(config).scrape_all()
+
+        assert [r["status"] for r in results] == ["success"] * 8
@@ -0,0 +1,154 @@
+"""
+Unit tests for the conditional-GET validator cache.
+"""
+
+import time
+
+import pytest
+import responses
+
+from src.core.cache import NotModified, ValidatorCache
+from src.core.scraper import CompetitorScraper, ContentFetcher, RateLimiter, SessionManager
+
+LISTING_PAGE = "<html><body><article><h2>Launch</h2><p>New model released</p></article></body></html>"
+
+
+class TestValidatorCache:
+    """Test ValidatorCache functionality."""
+
+    def test_store_and_conditional_headers(self, tmp_path):
+        """Test that validators are persisted once articles are stored."""
+        cache = ValidatorCache(str(tmp_path))
+        url = "https://example.com/blog"
+
+        cache.record_response(url, {"ETag": '"abc"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}, 1000)
+        assert cache.conditional_headers(url) == {}
+
+        cache.store_articles(url, [{"title": "Launch"}])
+        assert cache.conditional_headers(url) == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+        }
+
+        # A fresh instance reads the same entry from disk
+        assert ValidatorCache(str(tmp_path)).get(url)["articles"] == [{"title": "Launch"}]
+
+    def test_response_without_validators_is_not_stored(self, tmp_path):
+        """Test that responses lacking ETag and Last-Modified are not cached."""
+        cache = ValidatorCache(str(tmp_path))
+        cache.record_response("https://example.com/blog", {}, 1000)
+        cache.store_articles("https://example.com/blog", [{"title": "Launch"}])
+
+        assert cache.get("https://example.com/blog") is None
+
+    def test_expired_entries_are_ignored(self, tmp_path, monkeypatch):
+        """Test that cache_ttl_days controls expiry."""
+        cache = ValidatorCache(str(tmp_path), ttl_days=1)
+        url = "https://example.com/blog"
+        cache.record_response(url, {"ETag": '"abc"'}, 1000)
+        cache.store_articles(url, [])
+        assert cache.get(url) is not None
+
+        two_days_later = time.time() + 2 * 86400
+        monkeypatch.setattr("src.core.cache.time.time", lambda: two_days_later)
+
+        assert cache.get(url) is None
+        assert not cache._path(url).exists()
+
+    def test_entry_from_another_fingerprint_is_a_miss(self, tmp_path):
+        """Test that checking a different fingerprint drops the entry so no validators are sent."""
+        cache = ValidatorCache(str(tmp_path))
+        url = "https://example.com/blog"
+        cache.record_response(url, {"ETag": '"abc"'}, 100)
+        cache.store_articles(url, [{"title": "Launch"}], "plan-a")
+
+        cache.check_fingerprint(url, "plan-a")
+        assert cache.conditional_headers(url) == {"If-None-Match": '"abc"'}
+        cache.check_fingerprint(url, "plan-b")
+        assert cache.conditional_headers(url) == {}
+
+    def test_summary_reports_hit_rate_and_bytes_saved(self, tmp_path):
+        """Test per-run hit rate and bytes saved accounting."""
+        cache = ValidatorCache(str(tmp_path))
+        url = "https://example.com/blog"
+        cache.record_response(url, {"ETag": '"abc"'}, 2048)
+        cache.store_articles(url, [{"title": "Launch"}])
+
+        assert cache.record_not_modified(url) == [{"title": "Launch"}]
+
+        summary = cache.summary()
+        assert summary["requests"] == 2
+        assert summary["hits"] == 1
+        assert summary["hit_rate"] == 0.5
+        assert summary["bytes_saved"] == 2048
+
+
+class TestConditionalFetch:
+    """Test conditional GET integration with the fetch layer."""
+
+    @responses.activate
+    def test_fetcher_raises_not_modified_on_304(self, tmp_path):
+        """Test that a 304 raises NotModified without retrying."""
+        url = "https://example.com/blog"
+        cache = ValidatorCache(str(tmp_path))
+        cache.record_response(url, {"ETag": '"abc"'}, 100)
+        cache.store_articles(url, [])
+
+        responses.add(
+            responses.GET,
+            url,
+            status=304,
+            match=[responses.matchers.header_matcher({"If-None-Match": '"abc"'})],
+        )
+
+        fetcher = ContentFetcher(SessionManager(["Test Agent"]), RateLimiter(0, 0), cache=cache)
+        with pytest.raises(NotModified):
+            fetcher.fetch(url)
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_scraper_reuses_articles_on_304(self, tmp_path):
+        """Test that a second run skips parsing and reuses cached articles."""
+        url = "https://example.com/blog"
+        responses.add(responses.GET, url, body=LISTING_PAGE, headers={"ETag": '"v1"'})
+        responses.add(responses.GET, url, status=304)
+
+        config = {
+            "scraping": {"min_delay": 0, "max_delay": 0, "user_agents": ["Test"]},
+            "storage": {"cache_dir": str(tmp_path), "raw_data_dir": str(tmp_path / "raw")},
+            "sources": {"tier1": [{"name": "Example", "url": url, "selectors": {"title": "h2"}}]},
+        }
+
+        first = CompetitorScraper(config).scrape_all()
+        scraper = CompetitorScraper(config)
+        second = scraper.scrape_all()
+
+        assert first[0]["articles"] == second[0]["articles"]
+        assert second[0]["articles"][0]["title"] == "Launch"
+        assert scraper.get_run_stats()["http_cache"]["hits"] == 1
+
+    @responses.activate
+    def test_changed_selectors_reparse_instead_of_reusing_articles(self, tmp_path):
+        """Test that a run with different selectors fetches the page in full rather than reusing a 304."""
+        url = "https://example.com/blog"
+
+        def listing(request):
+            if request.headers.get("If-None-Match") == '"v1"':
+                return 304, {}, ""
+            return 200, {"ETag": '"v1"'}, LISTING_PAGE
+
+        responses.add_callback(responses.GET, url, callback=listing)
+
+        def config(selectors):
+            return {
+                "scraping": {"min_delay": 0, "max_delay": 0, "user_agents": ["Test"]},
+                "storage": {"cache_dir": str(tmp_path), "raw_data_dir": str(tmp_path / "raw")},
+                "sources": {"tier1": [{"name": "Example", "url": url, "selectors": selectors}]},
+            }
+
+        CompetitorScraper(config({"title": "h2", "content": "span"})).scrape_all()
+        scraper = CompetitorScraper(config({"title": "h2", "content": "p"}))
+        second = scraper.scrape_all()
+
+        assert second[0]["articles"][0]["content"] == "New model released"
+        assert scraper.get_run_stats()["http_cache"]["hits"] == 0
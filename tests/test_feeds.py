@@ -0,0 +1,172 @@
+"""
+Unit tests for feed-first ingestion and feed watermarks.
+"""
+
+import hashlib
+import json
+from datetime import datetime
+
+import pytest
+
+from src.core.scheduler import DomainScheduler
+from src.processors.content_processor import RSSFeedProcessor
+
+FEED = b"""<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0"><channel><title>Blog</title>
+<item><title>Feed post</title><link>/posts/1</link><description>&lt;p&gt;Summary&lt;/p&gt;</description>
+<pubDate>Mon, 06 May 2024 10:00:00 GMT</pubDate></item>
+<item><title>Undated post</title><link>https://example.com/posts/2</link><pubDate>soon</pubDate></item>
+</channel></rss>"""
+NEW_ITEM = (
+    b"<item><title>Newer post</title><link>/posts/3</link>"
+    b"<pubDate>Tue, 07 May 2024 08:00:00 GMT</pubDate></item>"
+)
+LISTING = b"<html><body><article><h2>Listing post</h2><p>Body</p></article></body></html>"
+
+
+def feed_route(feed):
+    """Serve a feed with an ETag, answering 304 when the client sends it back."""
+    etag = f'"{hashlib.sha256(feed).hexdigest()[:12]}"'
+
+    def respond(request):
+        if request.headers.get("If-None-Match") == etag:
+            return 304
+        return feed, "application/rss+xml", {"ETag": etag}
+
+    return respond
+
+
+@pytest.fixture
+def blog(site):
+    site.routes.update({"/feed.xml": feed_route(FEED), "/blog": LISTING})
+    return site
+
+
+@pytest.fixture
+def feed_source(blog):
+    """The blog as a source with a feed; selectors come from make_scraper."""
+    return {"url": f"{blog.url}/blog", "rss": f"{blog.url}/feed.xml"}
+
+
+class TestRSSFeedProcessor:
+    """Test RSSFeedProcessor.parse_feed."""
+
+    def test_parses_fetched_bytes(self):
+        """Test that a fetched document is parsed without a network call, with links resolved against the feed."""
+        articles = RSSFeedProcessor().parse_feed(FEED, "https://example.com/feed.xml")
+
+        assert [(a["title"], a["link"], a["date"]) for a in articles] == [
+            ("Feed post", "https://example.com/posts/1", "2024-05-06T10:00:00"),
+            ("Undated post", "https://example.com/posts/2", None),
+        ]
+        assert articles[0]["content"] == "Summary"
+        assert articles[0]["source_url"] == "https://example.com/feed.xml"
+        assert RSSFeedProcessor().parse_feed(FEED.decode(), "https://example.com/feed.xml") == articles
+
+    def test_entry_markup_becomes_capped_text(self):
+        """Test that entry HTML loses scripts and styles, has entities decoded and is cut at max_content_length."""
+        body = "&lt;style&gt;p {}&lt;/style&gt;&lt;p&gt;R&amp;amp;D&lt;/p&gt;&lt;script&gt;track()&lt;/script&gt;"
+        feed = FEED.replace(b"&lt;p&gt;Summary&lt;/p&gt;", (body + "&lt;p&gt;" + "long " * 1000).encode())
+
+        article = RSSFeedProcessor(max_content_length=50).parse_feed(feed, "https://example.com/feed.xml")[0]
+
+        assert article["content"].startswith("R&D long long")
+        assert len(article["content"]) <= 50
+
+
+class TestFeedFirst:
+    """Test feed-first ingestion in the scraper."""
+
+    @pytest.mark.parametrize("engine", ["threaded", "async"])
+    def test_feed_replaces_listing(self, blog, feed_source, make_scraper, engine):
+        """Test that a source with a feed is read from it and its listing page is never fetched."""
+        result = make_scraper(feed_source, engine).scrape_all()[0]
+
+        assert [a["title"] for a in result["articles"]] == ["Feed post", "Undated post"]
+        assert result["url"] == f"{blog.url}/feed.xml"
+        assert blog.requests == ["/feed.xml"]
+
+    @pytest.mark.parametrize("engine", ["threaded", "async"])
+    def test_feed_parsed_in_parse_pool(self, blog, feed_source, make_scraper, engine, monkeypatch):
+        """Test that with the parse pool on, feed bytes are parsed in a worker process, not the fetch thread."""
+        def in_process(*args, **kwargs):
+            raise AssertionError("feed parsed in the fetching process")
+
+        monkeypatch.setattr(RSSFeedProcessor, "parse_feed", in_process)
+        scraper = make_scraper(feed_source, engine, scraping={"parse_pool": True, "parse_workers": 1})
+        try:
+            result = scraper.scrape_all()[0]
+        finally:
+            scraper.cleanup()
+
+        assert [a["title"] for a in result["articles"]] == ["Feed post", "Undated post"]
+        assert blog.requests == ["/feed.xml"]
+
+    def test_sources_are_scheduled_by_feed_host(self, blog, feed_source, make_scraper, monkeypatch):
+        """Test that with feed_first the scheduler queues a source under its feed's host, not its listing's."""
+        domains = []
+        submit = DomainScheduler.submit
+
+        def record(scheduler, domain, item):
+            domains.append(domain)
+            submit(scheduler, domain, item)
+
+        monkeypatch.setattr(DomainScheduler, "submit", record)
+        scraper = make_scraper(feed_source)
+        scraper.sources[0]["url"] = "http://listing.invalid/blog"
+
+        result = scraper.scrape_all()[0]
+
+        assert domains == [blog.url.split("//")[1]]
+        assert result["status"] == "success"
+
+        scraper.feed_first = False
+        assert scraper._first_host(scraper.sources[0]) == "listing.invalid"
+
+    @pytest.mark.parametrize("feed", [None, b"<rss><channel></channel></rss>"])
+    def test_falls_back_to_listing(self, blog, feed_source, make_scraper, feed):
+        """Test that a missing or empty feed falls back to HTML scraping."""
+        blog.routes["/feed.xml"] = feed_route(feed) if feed else None
+
+        result = make_scraper(feed_source).scrape_all()[0]
+
+        assert [a["title"] for a in result["articles"]] == ["Listing post"]
+        assert blog.requests == ["/feed.xml", "/blog"]
+
+    def test_unchanged_feed_reuses_cached_articles(self, blog, feed_source, make_scraper):
+        """Test that feeds go through the HTTP cache: without watermarks a 304 returns the previous articles."""
+        scraping, storage = {"feed_watermarks": False}, {"http_cache": True}
+        first = make_scraper(feed_source, scraping=scraping, storage=storage).scrape_all()[0]
+        second = make_scraper(feed_source, scraping=scraping, storage=storage).scrape_all()[0]
+
+        assert second["articles"] == first["articles"]
+        assert blog.requests == ["/feed.xml", "/feed.xml"]
+
+
+class TestFeedWatermarks:
+    """Test conditional polling and high-water marks for feeds."""
+
+    @pytest.mark.parametrize("engine", ["threaded", "async"])
+    def test_only_entries_past_the_watermark_are_returned(self, tmp_path, blog, feed_source, make_scraper, engine):
+        """Test that a 304 reports nothing new and a changed feed yields only the newer entries."""
+        first = make_scraper(feed_source, engine, storage={"http_cache": True}).scrape_all()[0]
+        unchanged = make_scraper(feed_source, engine, storage={"http_cache": True}).scrape_all()[0]
+
+        assert [a["title"] for a in first["articles"]] == ["Feed post", "Undated post"]
+        assert (unchanged["status"], unchanged["articles"]) == ("success", [])
+        assert json.loads((tmp_path / "feed_watermarks.json").read_text()) == {
+            f"{blog.url}/feed.xml": "2024-05-06T10:00:00+00:00"
+        }
+
+        blog.routes["/feed.xml"] = feed_route(FEED.replace(b"<item>", NEW_ITEM + b"<item>", 1))
+        changed = make_scraper(feed_source, engine, storage={"http_cache": True}).scrape_all()[0]
+
+        assert [a["title"] for a in changed["articles"]] == ["Newer post"]
+        assert blog.requests == ["/feed.xml"] * 3
+
+    def test_since_stops_at_the_first_older_entry(self):
+        """Test that parse_feed skips undated entries and stops at the watermark."""
+        feed = FEED.replace(b"<item>", NEW_ITEM + b"<item>", 1)
+        articles = RSSFeedProcessor().parse_feed(feed, "https://example.com/feed.xml", datetime(2024, 5, 6, 10))
+
+        assert [a["title"] for a in articles] == ["Newer post"]
@@ -0,0 +1,145 @@
+"""
+Unit tests for the shared DNS cache.
+"""
+
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+import requests
+from urllib3.exceptions import NameResolutionError
+
+from src.core.http_pool import DNS_CACHE, DNSCache, PooledHTTPAdapter
+from src.core.scraper import SessionManager
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def loopback_port():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server.server_address[1]
+    server.shutdown()
+
+
+def addrinfo(*addresses, port=443):
+    return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (address, port)) for address in addresses]
+
+
+class TestDNSCache:
+    """Test DNSCache functionality."""
+
+    @patch("src.core.http_pool.socket.getaddrinfo")
+    def test_resolutions_cached_within_ttl(self, mock_getaddrinfo):
+        """Test that repeated lookups hit the cache."""
+        mock_getaddrinfo.return_value = [(2, 1, 6, "", ("93.184.216.34", 443))]
+        cache = DNSCache(ttl=60)
+
+        assert cache.resolve("example.com", 443) == ["93.184.216.34"]
+        assert cache.resolve("example.com", 443) == ["93.184.216.34"]
+        assert mock_getaddrinfo.call_count == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    @patch("src.core.http_pool.time.time")
+    @patch("src.core.http_pool.socket.getaddrinfo")
+    def test_expired_entries_resolved_again(self, mock_getaddrinfo, mock_time):
+        """Test that entries are refreshed after the TTL."""
+        mock_getaddrinfo.return_value = [(2, 1, 6, "", ("93.184.216.34", 443))]
+        cache = DNSCache(ttl=60)
+
+        mock_time.return_value = 1000
+        cache.resolve("example.com", 443)
+        mock_time.return_value = 1061
+        cache.resolve("example.com", 443)
+
+        assert mock_getaddrinfo.call_count == 2
+
+    @patch("src.core.http_pool.socket.getaddrinfo")
+    def test_ip_addresses_bypass_cache(self, mock_getaddrinfo):
+        """Test that literal addresses are not resolved."""
+        cache = DNSCache(ttl=60)
+
+        assert cache.resolve("127.0.0.1", 80) == ["127.0.0.1"]
+        assert cache.resolve("[::1]", 80) == ["[::1]"]
+        mock_getaddrinfo.assert_not_called()
+
+    @patch("src.core.http_pool.socket.getaddrinfo")
+    def test_all_addresses_cached_in_order(self, mock_getaddrinfo):
+        """Test that every distinct address is kept, in resolver order."""
+        mock_getaddrinfo.return_value = addrinfo("2001:db8::1", "93.184.216.34", "2001:db8::1")
+        cache = DNSCache(ttl=60)
+
+        assert cache.resolve("example.com", 443) == ["2001:db8::1", "93.184.216.34"]
+
+    @patch("src.core.http_pool.time.time")
+    @patch("src.core.http_pool.socket.getaddrinfo")
+    def test_entries_pruned_beyond_max_entries(self, mock_getaddrinfo, mock_time):
+        """Test that expired and then oldest entries are dropped once the cache is full."""
+        mock_getaddrinfo.return_value = addrinfo("93.184.216.34")
+        cache = DNSCache(ttl=60, max_entries=2)
+
+        mock_time.return_value = 1000
+        cache.resolve("a.example", 443)
+        mock_time.return_value = 1050
+        cache.resolve("b.example", 443)
+        cache.resolve("c.example", 443)
+        assert len(cache) == 2
+
+        mock_time.return_value = 1200
+        for host in ["d.example", "e.example", "f.example"]:
+            cache.resolve(host, 443)
+        assert len(cache) == 2
+
+
+class TestCachedDNSConnections:
+    """Test connections made through PooledHTTPAdapter."""
+
+    def session(self, cache):
+        session = requests.Session()
+        session.mount("http://", PooledHTTPAdapter(dns_cache=cache))
+        return session
+
+    def test_falls_back_to_the_next_address(self, loopback_port):
+        """Test that an address refusing connections is skipped for the next cached one."""
+        cache = DNSCache(ttl=60)
+        getaddrinfo = socket.getaddrinfo
+
+        def resolver(host, port, *args):
+            if host == "site.test":
+                return addrinfo("127.0.0.2", "127.0.0.1", port=port)
+            return getaddrinfo(host, port, *args)
+
+        with patch("src.core.http_pool.socket.getaddrinfo", side_effect=resolver):
+            response = self.session(cache).get(f"http://site.test:{loopback_port}/", timeout=5)
+
+        assert response.text == "ok"
+        assert cache.misses == 1
+
+    def test_failed_lookup_raises_name_resolution_error(self):
+        """Test that an unresolvable host fails with urllib3's NameResolutionError, as without the cache."""
+        failure = socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+        with patch("src.core.http_pool.socket.getaddrinfo", side_effect=failure):
+            with pytest.raises(requests.ConnectionError) as excinfo:
+                self.session(DNSCache(ttl=60)).get("http://missing.test/", timeout=5)
+
+        assert isinstance(excinfo.value.args[0].reason, NameResolutionError)
+
+    def test_session_manager_keeps_its_own_ttl(self):
+        """Test that a SessionManager's dns_ttl does not change the shared cache."""
+        ttl = DNS_CACHE.ttl
+
+        manager = SessionManager(["Test"], dns_ttl=5)
+
+        assert DNS_CACHE.ttl == ttl
+        assert manager.get_session("example.com").get_adapter("https://example.com").dns_cache is manager.dns_cache
@@ -0,0 +1,26 @@
+"""
+Unit tests for JSON state files.
+"""
+
+from src.utils.json_store import load_json, save_json
+
+
+class TestJsonStore:
+    """Test load_json and save_json."""
+
+    def test_round_trip_leaves_no_temporary_file(self, tmp_path):
+        """Test that saved data loads back and only the target file remains."""
+        path = tmp_path / "state" / "marks.json"
+
+        save_json(path, {"a": [1, 2]}, indent=2)
+
+        assert load_json(path, "marks") == {"a": [1, 2]}
+        assert [p.name for p in path.parent.iterdir()] == ["marks.json"]
+
+    def test_missing_or_unreadable_file_loads_as_none(self, tmp_path):
+        """Test that a missing or corrupt file is treated as absent."""
+        path = tmp_path / "marks.json"
+        assert load_json(path, "marks") is None
+
+        path.write_text("{not json")
+        assert load_json(path, "marks") is None
@@ -0,0 +1,113 @@
+"""
+Unit tests for article history and incremental pagination.
+"""
+
+from src.core.history import ArticleHistory, canonical_url
+from src.core.pagination import Paginator
+
+URL = "https://example.com/blog"
+SELECTORS = {"article": "article", "title": "h2", "content": "p", "link": "a.post"}
+
+
+def listing(posts, next_href=None):
+    """A listing page with one article per post id and an optional next link."""
+    body = "".join(
+        f'<article><h2>Post {i}</h2><p>Body {i}</p><a class="post" href="/post/{i}?utm_source=feed">more</a></article>'
+        for i in posts
+    )
+    if next_href:
+        body += f'<a class="next" href="{next_href}">Older</a>'
+    return f"<html><body>{body}</body></html>"
+
+
+def paginated(pagination):
+    """The blog source with a `pagination` block."""
+    return {"url": URL, "selectors": SELECTORS, "pagination": pagination}
+
+
+def serve(scraper, pages):
+    """Serve pages from a dict and record the URLs requested."""
+    requested = []
+
+    def fetch(url, *args, **kwargs):
+        requested.append(url)
+        return pages[url]
+
+    scraper.content_fetcher.fetch = fetch
+    return requested
+
+
+class TestCanonicalUrl:
+    """Test canonical_url functionality."""
+
+    def test_equivalent_links_compare_equal(self):
+        """Test that tracking params, default ports, case, slashes and fragments are ignored."""
+        assert canonical_url("HTTPS://Example.com:443/post/1/?utm_source=x&b=2&a=1#top") == (
+            "https://example.com/post/1?a=1&b=2"
+        )
+        assert canonical_url("http://example.com:8080/post?id=3") == "http://example.com:8080/post?id=3"
+
+
+class TestPagination:
+    """Test incremental pagination."""
+
+    def test_first_run_reads_only_the_first_page(self, make_scraper):
+        """Test that without history for a source no further pages are followed."""
+        scraper = make_scraper(paginated({"next": "a.next"}))
+        requested = serve(scraper, {URL: listing([5, 4], "/blog?page=2")})
+
+        result = scraper.scrape_source(scraper.sources[0])
+
+        assert requested == [URL]
+        assert len(result["articles"]) == 2
+        assert "pages" not in result
+
+    def test_follows_pages_until_a_known_article(self, make_scraper):
+        """Test that pages are followed through a burst and stop at the first known article."""
+        pages = {
+            URL: listing([9, 8], "/blog?page=2"),
+            f"{URL}?page=2": listing([7, 6], "/blog?page=3"),
+            f"{URL}?page=3": listing([5, 4], "/blog?page=4"),
+            f"{URL}?page=4": listing([3, 2]),
+        }
+        scraper = make_scraper(paginated({"next": "a.next"}))
+        scraper.history.add("Blog", [{"link": "https://example.com/post/5", "source_url": URL}])
+        requested = serve(scraper, pages)
+
+        result = scraper.scrape_source(scraper.sources[0])
+
+        assert requested == [URL, f"{URL}?page=2", f"{URL}?page=3"]
+        assert [a["title"] for a in result["articles"]] == ["Post 9", "Post 8", "Post 7", "Post 6", "Post 5", "Post 4"]
+        assert result["pages"] == 3
+
+    def test_url_template_and_page_budget(self, make_scraper):
+        """Test that a URL template is followed for at most max_pages pages."""
+        template = URL + "/page/{page}"
+        pages = {URL: listing([1])}
+        pages.update({template.format(page=n): listing([n * 10]) for n in range(2, 6)})
+        scraper = make_scraper(paginated({"url_template": template, "max_pages": 3}))
+        scraper.history.add("Blog", [{"content_hash": "old"}])
+        requested = serve(scraper, pages)
+
+        result = scraper.scrape_source(scraper.sources[0])
+
+        assert requested == [URL, f"{URL}/page/2", f"{URL}/page/3"]
+        assert result["pages"] == 3
+
+    def test_history_persists_across_runs(self, tmp_path, make_scraper):
+        """Test that a run's articles are saved and recognised by the next run."""
+        scraper = make_scraper(paginated({"next": "a.next"}))
+        serve(scraper, {URL: listing([2, 1], "/blog?page=2")})
+        scraper._finish_run([scraper.scrape_source(scraper.sources[0])])
+
+        history = ArticleHistory(cache_dir=str(tmp_path))
+        paginator = Paginator(scraper.sources[0], history)
+
+        assert history.is_known("Blog", {"link": "https://example.com/post/2?utm_medium=email"})
+        known = {"link": "https://example.com/post/1/"}
+        assert not paginator.should_continue(1, [{"link": "https://example.com/post/3"}, known])
+        assert paginator.should_continue(1, [{"link": "https://example.com/post/3"}])
+
+    def test_sources_without_pagination_keep_no_history(self, make_scraper):
+        """Test that history is only kept when some source paginates."""
+        assert make_scraper(paginated(None)).history is None
@@ -0,0 +1,80 @@
+"""
+Unit tests for the process-pool parsing stage.
+"""
+
+from datetime import datetime
+from pathlib import Path
+
+import lxml.html
+import pytest
+
+from src.core.parse_pool import ParsePool
+from src.core.scraper import CompetitorScraper, HTMLParser
+from src.processors.content_processor import RSSFeedProcessor
+
+PAGE = (Path(__file__).parent / "fixtures" / "pages" / "research_blog.html").read_bytes()
+SELECTORS = {"article": "article.post", "title": "h1", "content": ".post-content p"}
+SOURCE = {"name": "Research", "selectors": SELECTORS}
+URL = "https://example.com/research"
+FEED = (
+    b"<rss version='2.0'><channel><title>Blog</title>"
+    + b"".join(
+        f"<item><title>Post {i}</title><link>/posts/{i}</link><description>&lt;p&gt;Body {i}&lt;/p&gt;"
+        f"</description><pubDate>Mon, 0{9 - i} Sep 2024 10:00:00 GMT</pubDate></item>".encode()
+        for i in range(3)
+    )
+    + b"</channel></rss>"
+)
+
+
+@pytest.fixture(scope="module")
+def pool():
+    pool = ParsePool(workers=2)
+    yield pool
+    pool.shutdown()
+
+
+class TestParsePool:
+    """Test ParsePool functionality."""
+
+    def test_worker_output_matches_inline_parse(self, pool):
+        """Test that articles parsed in a worker process equal an in-thread parse."""
+        expected = HTMLParser(SOURCE["selectors"]).parse(PAGE, URL)
+
+        assert pool.parse(SOURCE, PAGE, URL) == expected
+        assert [future.result() for future in [pool.submit(SOURCE, PAGE, URL) for _ in range(4)]] == [expected] * 4
+
+    def test_feed_parsed_in_worker_matches_inline_parse(self, pool):
+        """Test that feeds parsed in a worker come back as the same plain entry dicts, honouring `since`."""
+        feed_url = "https://example.com/feed.xml"
+        since = datetime(2024, 9, 8, 10)
+
+        assert pool.parse_feed(FEED, feed_url) == RSSFeedProcessor().parse_feed(FEED, feed_url)
+        assert [a["title"] for a in pool.submit_feed(FEED, feed_url, since).result()] == ["Post 0"]
+
+    def test_streamed_documents_parse_in_place(self, pool, monkeypatch):
+        """Test that an lxml document from a streaming fetch is not shipped to a worker."""
+        monkeypatch.setattr(pool, "submit", None)
+
+        articles = pool.parse(SOURCE, lxml.html.document_fromstring(PAGE), URL)
+
+        assert articles[0]["title"].startswith("Scaling")
+
+    @pytest.mark.parametrize("engine", ["threaded", "async"])
+    def test_scrape_all_with_parse_pool(self, site, make_config, engine):
+        """Test that both fetch engines hand raw bytes to the pool and get the same articles back."""
+        site.routes.update({"/0": PAGE, "/1": PAGE})
+        sources = [{"name": f"src{i}", "url": f"{site.url}/{i}", "selectors": SELECTORS} for i in range(2)]
+        config = make_config(sources, scraping={"engine": engine})
+        inline = CompetitorScraper(config).scrape_all()
+
+        config["scraping"].update(parse_pool=True, parse_workers=1)
+        scraper = CompetitorScraper(config)
+        try:
+            pooled = scraper.scrape_all()
+        finally:
+            scraper.cleanup()
+
+        assert scraper.content_fetcher.raw
+        assert [r["articles"] for r in pooled] == [r["articles"] for r in inline]
+        assert all(len(r["articles"]) == 3 for r in pooled)
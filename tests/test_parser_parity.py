@@ -0,0 +1,125 @@
+"""
+Parity tests: the lxml extraction engine must return exactly what BeautifulSoup does.
+"""
+
+from pathlib import Path
+
+import lxml.html
+import pytest
+
+from src.core.scraper import HTMLParser
+
+PAGES_DIR = Path(__file__).parent / "fixtures" / "pages"
+PAGES = sorted(PAGES_DIR.glob("*.html"))
+URL = "https://example.com/blog/"
+
+# Selector sets taken from config/config.yaml, plus defaults and awkward cases
+SELECTOR_SETS = {
+    "openai": {"article": "article.post", "title": "h1, .post-title", "date": "time, .post-date",
+               "content": ".post-content, article p"},
+    "news": {"article": "article, .news-item", "title": "h1, h2", "date": "time, .date",
+             "content": ".content, article p"},
+    "entries": {"article": "article, .blog-post", "title": "h1, .entry-title", "date": ".entry-date, time",
+                "content": ".entry-content"},
+    "nested": {"article": "main article, section > *", "title": "header h2, h1 > em, h2 a",
+               "content": "div p:first-child, li:nth-child(2)"},
+    "non_text": {"article": "body", "title": "template, script", "content": "template p, style, script"},
+    "defaults": {},
+}
+
+
+@pytest.mark.parametrize("page", PAGES, ids=lambda path: path.stem)
+@pytest.mark.parametrize("selectors", SELECTOR_SETS.values(), ids=SELECTOR_SETS.keys())
+class TestEngineParity:
+    """Test that both engines extract identical articles from saved pages."""
+
+    def test_text_input(self, page, selectors):
+        """Test parity on decoded page text."""
+        html = page.read_text(encoding="utf-8")
+
+        assert HTMLParser(selectors, engine="lxml").parse(html, URL) == HTMLParser(selectors).parse(html, URL)
+
+    def test_bytes_input(self, page, selectors):
+        """Test parity on raw bytes, as replayed from snapshots."""
+        body = page.read_bytes()
+
+        assert HTMLParser(selectors, engine="lxml").parse(body, URL) == HTMLParser(selectors).parse(body, URL)
+
+    def test_streamed_document(self, page, selectors):
+        """Test parity on an lxml document built by a streaming fetch."""
+        body = page.read_bytes()
+
+        expected = HTMLParser(selectors).parse(body, URL)
+        assert HTMLParser(selectors).parse(lxml.html.document_fromstring(body), URL) == expected
+
+
+@pytest.mark.parametrize("page", PAGES, ids=lambda path: path.stem)
+@pytest.mark.parametrize("selectors", SELECTOR_SETS.values(), ids=SELECTOR_SETS.keys())
+@pytest.mark.parametrize("engine", ["soup", "lxml"])
+def test_scoped_parse_matches_full_parse(page, selectors, engine):
+    """Test that building only the article containers extracts the same articles."""
+    body = page.read_bytes()
+
+    full = HTMLParser(selectors, engine=engine).parse(body, URL)
+    assert HTMLParser(selectors, engine=engine, scoped=True).parse(body, URL) == full
+
+
+class TestParserEngines:
+    """Test engine selection and fallbacks."""
+
+    def test_unknown_engine_rejected(self):
+        """Test that a misspelt engine name fails loudly."""
+        with pytest.raises(ValueError):
+            HTMLParser({}, engine="xpath")
+
+    def test_source_can_pin_soup(self):
+        """Test that a per-source parser setting overrides the configured default."""
+        assert HTMLParser.for_source({"selectors": {}}, "lxml").engine == "lxml"
+        assert HTMLParser.for_source({"selectors": {}, "parser": "soup"}, "lxml").engine == "soup"
+
+    def test_soup_only_selector_falls_back(self):
+        """Test that selectors with no XPath translation run through BeautifulSoup."""
+        html = (PAGES_DIR / "research_blog.html").read_text(encoding="utf-8")
+        selectors = {"article": "article", "title": 'h1:-soup-contains("Interpretability")'}
+        parser = HTMLParser(selectors, engine="lxml")
+
+        assert parser.engine == "soup"
+        assert [a["title"] for a in parser.parse(lxml.html.fromstring(html), URL)] == ["Interpretability update"]
+
+    @pytest.mark.parametrize("body", ["", "   ", b""])
+    def test_empty_document(self, body):
+        """Test that an empty body yields no articles rather than a parser error."""
+        assert HTMLParser({}, engine="lxml").parse(body, URL) == []
+
+    def test_encoding_declarations(self):
+        """Test that declared encodings are honoured for text and bytes input."""
+        html = '<?xml version="1.0" encoding="utf-8"?><html><body><article><h1>Café</h1></article></body></html>'
+        latin1 = '<html><head><meta charset="iso-8859-1"></head><body><article><h1>Café</h1></article></body></html>'
+
+        assert HTMLParser({}, engine="lxml").parse(html, URL)[0]["title"] == "Café"
+        assert HTMLParser({}, engine="lxml").parse(latin1.encode("iso-8859-1"), URL)[0]["title"] == "Café"
+
+    @pytest.mark.parametrize("engine", ["soup", "lxml"])
+    def test_scoped_parse_falls_back_to_full_parse(self, engine, monkeypatch):
+        """Test that a scoped parse that finds no article containers reparses the whole page."""
+        body = (PAGES_DIR / "research_blog.html").read_bytes()
+        parser = HTMLParser({"article": "article.post", "title": "h1"}, engine=engine, scoped=True)
+        monkeypatch.setattr(parser.plan.region, "matches", lambda tag, attrs: False)
+
+        assert len(parser.parse(body, URL)) == 3
+
+    @pytest.mark.parametrize("engine", ["soup", "lxml"])
+    def test_scoped_parse_without_articles_falls_back(self, engine):
+        """Test that containers yielding no article (a field selector needs an outer ancestor) reparse the page."""
+        body = b"<html><body><main><article><h2>Post</h2><p>Body text</p></article></main></body></html>"
+        selectors = {"article": "article", "title": "main h2", "content": "p"}
+        full = HTMLParser(selectors, engine=engine).parse(body, URL)
+
+        assert [a["title"] for a in full] == ["Post"]
+        assert HTMLParser(selectors, engine=engine, scoped=True).parse(body, URL) == full
+
+    def test_contextual_article_selector_is_not_scoped(self):
+        """Test that article selectors needing ancestors or siblings always get a full parse."""
+        assert not HTMLParser({"article": "main article"}, scoped=True).scoped
+        assert not HTMLParser({"article": "li:first-child"}, scoped=True).scoped
+        assert HTMLParser.for_source({"selectors": {"article": "article"}, "scoped_parse": True}).scoped
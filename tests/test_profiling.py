@@ -0,0 +1,109 @@
+"""
+Unit tests for extraction profiling.
+"""
+
+import json
+
+import pytest
+
+from src.core.parse_pool import ParsePool
+from src.core.profiling import ExtractionProfiler
+from src.core.scraper import CompetitorScraper, HTMLParser
+
+URL = "https://example.com/blog"
+SELECTORS = {"article": "article", "title": "h2", "date": "time", "content": "p"}
+PAGE = (
+    "<html><body><nav><a href='/'>Home</a></nav>"
+    "<article><h2>First</h2><time>2024-01-01</time><p>Body</p></article>"
+    "<article><h2>Second</h2><p>Body</p></article>"
+    "<article><h2>Third</h2></article>"
+    "<article><span>No title</span></article>"
+    "</body></html>"
+)
+
+
+class TestPageProfile:
+    """Test per-page profiling in HTMLParser."""
+
+    @pytest.mark.parametrize("engine", ["soup", "lxml"])
+    @pytest.mark.parametrize("scoped", [False, True])
+    def test_selector_matches_and_empty_fields(self, engine, scoped):
+        """Test that both engines report the same matches and empty fields, and the same articles as parse()."""
+        parser = HTMLParser(SELECTORS, engine=engine, scoped=scoped)
+
+        articles, page = parser.parse_profiled(PAGE, URL)
+
+        assert articles == parser.parse(PAGE, URL)
+        assert page.engine == engine
+        assert (page.containers, page.articles) == (4, 3)
+        assert page.selector_matched == {"article": 4, "title": 3, "date": 1, "content": 2}
+        assert page.empty == {"title": 1, "date": 2, "content": 1}
+        assert page.tree_nodes > page.containers
+        assert page.seconds > 0
+        assert parser.plan.selectors == SELECTORS
+
+    def test_structured_pages_are_reported_as_structured(self):
+        """Test that a page answered from embedded JSON runs no selector."""
+        html = PAGE.replace(
+            "</body>", '<script type="application/ld+json">{"@type": "BlogPosting", "headline": "JSON"}</script></body>'
+        )
+        parser = HTMLParser(SELECTORS, structured={"type": "json_ld"})
+
+        articles, page = parser.parse_profiled(html, URL)
+
+        assert [a["title"] for a in articles] == ["JSON"]
+        assert page.engine == "structured"
+        assert sum(page.selector_matched.values()) == 0
+
+    def test_profiles_come_back_from_the_parse_pool(self):
+        """Test that a worker process returns the articles together with the page profile."""
+        pool = ParsePool(workers=1, profile=True)
+        try:
+            articles, page = pool.parse({"name": "Blog", "selectors": SELECTORS}, PAGE.encode(), URL)
+        finally:
+            pool.shutdown()
+
+        assert len(articles) == 3
+        assert page.selector_matched["article"] == 4
+
+
+class TestExtractionProfiler:
+    """Test ExtractionProfiler aggregation and output."""
+
+    def test_report_aggregates_per_source(self, tmp_path):
+        """Test that pages are summed per source and written as JSON."""
+        profiler = ExtractionProfiler()
+        parser = HTMLParser(SELECTORS)
+        for _ in range(2):
+            profiler.record("Blog", parser.parse_profiled(PAGE, URL)[1])
+
+        report = profiler.report()["Blog"]
+
+        assert (report["pages"], report["containers"], report["articles"]) == (2, 8, 6)
+        assert report["engines"] == {"soup": 2}
+        assert report["empty_share"] == {"title": 0.25, "date": 0.667, "content": 0.333}
+        assert report["selectors"]["date"]["matched"] == 2
+        assert report["selectors"]["date"]["pages_without_match"] == 0
+
+        path = profiler.write(str(tmp_path))
+
+        assert path.parent == tmp_path and path.name.startswith("extraction_profile_")
+        assert json.loads(path.read_text())["sources"]["Blog"]["pages"] == 2
+        assert ExtractionProfiler().write(str(tmp_path / "empty")) is None
+
+    @pytest.mark.parametrize("engine", ["threaded", "async"])
+    def test_scraper_writes_profile_next_to_reports(self, tmp_path, site, make_config, engine):
+        """Test that a profiled run writes the profile into the reports directory."""
+        site.routes["/blog"] = PAGE
+        config = make_config(
+            [{"name": "Blog", "url": f"{site.url}/blog", "selectors": SELECTORS}],
+            scraping={"engine": engine, "profile_extraction": True},
+            reporting={"output_dir": str(tmp_path)},
+        )
+        scraper = CompetitorScraper(config)
+
+        assert len(scraper.scrape_all()[0]["articles"]) == 3
+
+        stats = scraper.get_run_stats()
+        profile = json.loads(open(stats["extraction_profile"]).read())
+        assert profile["sources"]["Blog"]["articles"] == 3
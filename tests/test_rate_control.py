@@ -0,0 +1,94 @@
+"""
+Unit tests for adaptive per-domain rate control.
+"""
+
+import time
+from email.utils import formatdate
+
+from src.core.rate_control import AdaptiveRateController, parse_retry_after
+from src.core.scraper import RateLimiter
+
+
+class TestParseRetryAfter:
+    """Test Retry-After header parsing."""
+
+    def test_delta_seconds(self):
+        """Test integer seconds."""
+        assert parse_retry_after("120") == 120.0
+
+    def test_http_date(self):
+        """Test an absolute HTTP date."""
+        value = formatdate(time.time() + 60, usegmt=True)
+        assert 55 <= parse_retry_after(value) <= 61
+
+    def test_missing_or_invalid(self):
+        """Test that missing or garbage values are ignored."""
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+
+class TestAdaptiveRateController:
+    """Test AdaptiveRateController functionality."""
+
+    def test_multiplicative_backoff_on_throttle(self):
+        """Test that 429 and 503 double the delay up to the ceiling."""
+        controller = AdaptiveRateController(initial_delay=2, floor_delay=1, ceiling_delay=5)
+
+        assert controller.record_response("a.com", 429, 0.1) == 4
+        assert controller.record_response("a.com", 503, 0.1) == 5
+
+    def test_additive_speedup_while_healthy(self):
+        """Test that healthy responses shrink the delay toward the floor."""
+        controller = AdaptiveRateController(initial_delay=2, floor_delay=1, increase_step=0.25)
+
+        first = controller.record_response("a.com", 200, 0.1)
+        assert first < 2
+        for _ in range(20):
+            delay = controller.record_response("a.com", 200, 0.1)
+        assert delay == 1
+
+    def test_latency_spike_slows_down(self):
+        """Test that a latency spike backs off instead of speeding up."""
+        controller = AdaptiveRateController(initial_delay=2, floor_delay=1, latency_factor=3)
+        baseline = controller.record_response("a.com", 200, 0.1)
+
+        assert controller.record_response("a.com", 200, 1.0) > baseline
+
+    def test_state_persists_between_runs(self, tmp_path):
+        """Test that learned delays are loaded by the next run."""
+        state_path = str(tmp_path / "rate_state.json")
+        controller = AdaptiveRateController(initial_delay=2, state_path=state_path)
+        controller.record_response("strict.com", 429, 0.1)
+        controller.save()
+
+        next_run = AdaptiveRateController(initial_delay=2, state_path=state_path)
+        assert next_run.delay_for("strict.com") == 4
+        assert next_run.delay_for("unknown.com") == 2
+
+
+class TestRateLimiterFeedback:
+    """Test RateLimiter integration with throttling responses."""
+
+    def test_retry_after_defers_domain(self):
+        """Test that Retry-After pushes back the domain's next allowed time."""
+        limiter = RateLimiter(min_delay=0, max_delay=0)
+        limiter.record_response("a.com", 429, 0.1, retry_after="30")
+
+        assert 29 <= limiter.time_until_ready("a.com") <= 30
+        assert limiter.time_until_ready("b.com") == 0
+
+    def test_retry_after_is_capped(self):
+        """Test that huge Retry-After values are capped."""
+        limiter = RateLimiter(min_delay=0, max_delay=0, max_retry_after=60)
+        limiter.record_response("a.com", 503, 0.1, retry_after="86400")
+
+        assert limiter.time_until_ready("a.com") <= 60
+
+    def test_controller_drives_delay(self):
+        """Test that the learned delay replaces the configured window."""
+        controller = AdaptiveRateController(initial_delay=0, floor_delay=0)
+        controller.record_response("a.com", 429, 0.1)
+        limiter = RateLimiter(min_delay=0, max_delay=0, controller=controller)
+
+        limiter.wait("a.com")
+        assert limiter.time_until_ready("a.com") > 0
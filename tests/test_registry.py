@@ -0,0 +1,216 @@
+"""
+Unit tests for the source registry and OPML/CSV source import.
+"""
+
+import json
+import time
+
+import pytest
+
+from src.core.registry import SourceRegistry
+from src.core.scraper import CompetitorScraper
+from src.reporters.report_generator import ReportGenerator
+
+OPML = b"""<?xml version="1.0"?>
+<opml version="2.0"><head><title>Feeds</title></head><body>
+<outline text="tier1">
+  <outline text="Lab Blog" xmlUrl="https://www.lab.example/feed.xml" htmlUrl="https://www.lab.example/blog"/>
+</outline>
+<outline text="News">
+  <outline title="Wire" text="wire" xmlUrl="https://wire.example/rss" priority="high"/>
+  <outline text="Wire Tech" htmlUrl="https://wire.example/tech" tier="tier2"/>
+  <outline text="No URL"/>
+</outline>
+</body></opml>"""
+
+CSV = """Name,Site,Feed,Tier,Priority
+Vendor Blog,https://vendor.example/blog,,tier2,critical
+Vendor Feed,,https://vendor.example/feed,,
+,,,,
+"""
+
+
+@pytest.fixture
+def registry_config(make_config, tmp_path):
+    def make(**tiers):
+        return make_config({"registry": str(tmp_path / "source_registry.json"), **tiers})
+
+    return make
+
+
+class TestImport:
+    """Test OPML and CSV import."""
+
+    def test_opml_outlines_become_sources(self, tmp_path):
+        """Test that outlines with a URL are imported, taking tier from folders or attributes."""
+        path = tmp_path / "feeds.opml"
+        path.write_bytes(OPML)
+        registry = SourceRegistry()
+
+        assert registry.import_file(str(path), priority="low")["read"] == 3
+        assert [(s["id"], s["name"], s["tier"], s["priority"]) for s in registry] == [
+            ("lab-example-feed-xml", "Lab Blog", "tier1", "low"),
+            ("wire-example-rss", "Wire", "tier3", "high"),
+            ("wire-example-tech", "Wire Tech", "tier2", "low"),
+        ]
+        assert registry.get("lab-example-feed-xml")["url"] == "https://www.lab.example/blog"
+        assert registry.get("wire-example-rss")["url"] == "https://wire.example/rss"
+
+    def test_csv_rows_become_sources(self, tmp_path):
+        """Test that CSV columns are matched by header and rows without a URL are skipped."""
+        path = tmp_path / "sources.csv"
+        path.write_text(CSV)
+        registry = SourceRegistry()
+
+        assert registry.import_file(str(path), tier="tier1")["read"] == 2
+        assert registry.find("Vendor Blog")["tier"] == "tier2"
+        assert registry.find("Vendor Blog")["priority"] == "critical"
+        assert registry.find("Vendor Feed")["url"] == "https://vendor.example/feed"
+        assert registry.find("Vendor Feed")["tier"] == "tier1"
+
+    def test_same_name_on_different_sites_keeps_both(self, tmp_path):
+        """Test that imported ids come from URLs, so reused names neither collide nor get replaced."""
+        path = tmp_path / "sources.csv"
+        path.write_text("name,url\nBlog,https://a.com/blog\nBlog,https://b.com/blog\n")
+        registry = SourceRegistry()
+
+        counts = registry.import_file(str(path))
+
+        assert counts == {"read": 2, "added": 2, "updated": 0, "collisions": 0, "configured": 0}
+        assert [(s["id"], s["name"]) for s in registry] == [("a-com-blog", "Blog"), ("b-com-blog", "Blog (b.com)")]
+        assert registry.import_file(str(path))["updated"] == 2
+        assert len(registry) == 2
+
+    def test_untitled_outlines_are_named_by_domain(self, tmp_path):
+        """Test that an outline without title or text gets a name instead of None."""
+        path = tmp_path / "feeds.opml"
+        path.write_bytes(b'<opml><body><outline xmlUrl="https://www.quiet.example/rss"/></body></opml>')
+        registry = SourceRegistry()
+
+        registry.import_file(str(path))
+
+        assert [s["name"] for s in registry] == ["quiet.example"]
+
+    def test_id_collisions_are_counted(self, tmp_path):
+        """Test that explicit ids reused for different URLs are reported, the later entry winning."""
+        path = tmp_path / "sources.csv"
+        path.write_text("id,name,url\nblog,A,https://a.com/\nblog,B,https://b.com/\n")
+        registry = SourceRegistry()
+
+        assert registry.import_file(str(path))["collisions"] == 1
+        assert registry.get("blog")["url"] == "https://b.com/"
+
+    def test_unknown_tier_and_priority_fall_back_to_defaults(self):
+        """Test that invalid tier and priority values are replaced rather than stored."""
+        source = SourceRegistry().add({"name": "Odd", "url": "https://odd.example", "tier": "gold", "priority": "x"})
+
+        assert (source["tier"], source["priority"]) == ("tier3", "medium")
+
+
+class TestSourceRegistry:
+    """Test registry indexes, persistence and precedence."""
+
+    def test_indexes(self):
+        """Test lookups by id, domain (ignoring www), tier and name."""
+        registry = SourceRegistry()
+        registry.add({"name": "Lab", "url": "https://www.lab.example/blog"}, "tier1")
+        registry.add({"id": "lab-news", "name": "Lab News", "url": "https://lab.example/news"}, "tier2")
+        registry.add({"name": "Other", "url": "https://other.example"})
+
+        assert [s["id"] for s in registry.for_domain("lab.example")] == ["lab", "lab-news"]
+        assert [s["id"] for s in registry.for_domain("WWW.lab.example")] == ["lab", "lab-news"]
+        assert [s["id"] for s in registry.in_tier("tier3")] == ["other"]
+        assert registry.find("Lab News")["id"] == "lab-news"
+        assert "other" in registry and len(registry) == 3
+
+    def test_tier_index_follows_replacements(self):
+        """Test that a source re-added under another tier moves to that tier, keeping its registry order."""
+        registry = SourceRegistry()
+        for name in ("A", "B", "C"):
+            registry.add({"name": name, "url": f"https://{name.lower()}.example"}, "tier2")
+        registry.add({"name": "D", "url": "https://d.example"}, "tier1")
+
+        registry.add({"name": "B", "url": "https://b.example"}, "tier1")
+        registry.add({"name": "C", "url": "https://c.example"}, "tier2")
+
+        assert [s["id"] for s in registry.in_tier("tier1")] == ["b", "d"]
+        assert [s["id"] for s in registry.in_tier("tier2")] == ["a", "c"]
+        assert registry.in_tier("tier3") == []
+
+    def test_save_and_load_round_trip(self, tmp_path, registry_config):
+        """Test that imported sources persist while configured sources stay in the config."""
+        config = registry_config(tier1=[{"name": "Configured", "url": "https://c.example"}])
+        registry = SourceRegistry.from_config(config)
+        registry.add({"name": "Imported", "url": "https://i.example"}, store=True)
+        registry.save()
+
+        stored = json.loads((tmp_path / "source_registry.json").read_text())
+        reloaded = SourceRegistry.from_config(config)
+
+        assert [s["id"] for s in stored["sources"]] == ["imported"]
+        assert [(s["id"], s["tier"]) for s in reloaded] == [("configured", "tier1"), ("imported", "tier3")]
+
+    def test_configured_source_wins_over_imported(self, registry_config):
+        """Test that an imported source with a configured id keeps the configured entry."""
+        config = registry_config(tier1=[{"name": "Lab", "url": "https://lab.example", "priority": "critical"}])
+        registry = SourceRegistry.from_config(config)
+        registry.add({"name": "Lab", "url": "https://elsewhere.example"}, store=True)
+
+        assert registry.get("lab")["url"] == "https://lab.example"
+        assert registry.for_domain("elsewhere.example") == []
+
+    def test_save_without_path_raises(self):
+        """Test that saving an in-memory registry is an error."""
+        with pytest.raises(ValueError):
+            SourceRegistry().save()
+
+
+class TestRegistryConsumers:
+    """Test that the scraper and reports read sources from the registry."""
+
+    def test_scraper_reads_imported_sources(self, registry_config):
+        """Test that the scraper's sources include imported ones after the configured tiers."""
+        config = registry_config(tier2=[{"name": "Configured", "url": "https://c.example"}])
+        registry = SourceRegistry.from_config(config)
+        registry.add({"name": "Imported", "url": "https://i.example", "rss": "https://i.example/feed"}, store=True)
+        registry.save()
+
+        scraper = CompetitorScraper(config)
+
+        assert [(s["name"], s["tier"]) for s in scraper.sources] == [("Configured", "tier2"), ("Imported", "tier3")]
+
+    def test_reports_carry_source_metadata(self, tmp_path, registry_config):
+        """Test that reports get registry metadata for reporting sources and show their tier."""
+        config = registry_config(tier1=[{"name": "Lab", "url": "https://www.lab.example/blog"}])
+        config["reporting"] = {"output_dir": str(tmp_path / "reports"), "formats": ["json", "markdown"]}
+        data = {"articles": [{"source": "Lab", "title": "Post"}, {"source": "Unknown", "title": "Other"}], "stats": {}}
+
+        files = ReportGenerator(config).generate_reports(data)
+
+        report = json.loads(open(files["json"]).read())
+        assert report["sources"] == {
+            "Lab": {
+                "id": "lab",
+                "tier": "tier1",
+                "priority": "medium",
+                "url": "https://www.lab.example/blog",
+                "domain": "lab.example",
+            }
+        }
+        assert "### Lab (Tier 1)" in open(files["markdown"]).read()
+
+    def test_large_catalogue_loads_quickly(self, registry_config):
+        """Test that a saved registry of 10,000 sources loads with its indexes in well under a second."""
+        config = registry_config()
+        registry = SourceRegistry.from_config(config)
+        for i in range(10_000):
+            registry.add({"name": f"Feed {i}", "rss": f"https://site{i % 500}.example/feed/{i}"}, store=True)
+        registry.save()
+
+        started = time.perf_counter()
+        reloaded = SourceRegistry.from_config(config)
+        elapsed = time.perf_counter() - started
+
+        assert len(reloaded) == 10_000
+        assert len(reloaded.for_domain("site7.example")) == 20
+        assert elapsed < 1.0
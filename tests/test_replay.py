@@ -0,0 +1,134 @@
+"""
+Unit tests for offline replay of captured runs.
+"""
+
+import pytest
+import responses
+
+from src.core.replay import SnapshotReplay
+from src.core.scraper import CompetitorScraper
+
+URL = "https://example.com/blog"
+LISTING_PAGE = (
+    "<html><body>"
+    '<article><h2>Launch</h2><h3>Model card</h3><p>New model released</p><a href="/p/1">x</a></article>'
+    '<article><h2>Update</h2><h3>Pricing</h3><p>Cheaper tokens</p><a href="/p/2">x</a></article>'
+    "</body></html>"
+)
+
+
+SITEMAP_NS = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+SITEMAPS = {
+    "https://example.com/sitemap.xml": (
+        f'<sitemapindex {SITEMAP_NS}><sitemap><loc>https://example.com/posts.xml</loc></sitemap></sitemapindex>'
+    ),
+    "https://example.com/posts.xml": (
+        f"<urlset {SITEMAP_NS}>"
+        "<url><loc>https://example.com/p/1</loc><lastmod>2024-05-01</lastmod></url>"
+        "<url><loc>https://example.com/p/2</loc><lastmod>2024-05-02</lastmod></url>"
+        "</urlset>"
+    ),
+}
+POSTS = {
+    "https://example.com/p/1": "<html><body><article><h1>One</h1><p>First</p></article><h1>Footer</h1></body></html>",
+    "https://example.com/p/2": "<html><body><article><h1>Two</h1><p>Second</p></article></body></html>",
+}
+
+
+@pytest.fixture
+def listing_config(make_config, tmp_path):
+    def make(title="h2", stream=False):
+        source = {"name": "Example", "url": URL, "selectors": {"title": title}, "priority": "high"}
+        return make_config(
+            [source], scraping={"stream_responses": stream}, storage={"snapshots": True, "raw_data_dir": str(tmp_path)}
+        )
+
+    return make
+
+
+@pytest.fixture
+def sitemap_config(make_config, tmp_path):
+    source = {
+        "name": "Blog",
+        "url": URL,
+        "selectors": {"article": "article", "title": "h1", "content": "p"},
+        "sitemap": "https://example.com/sitemap.xml",
+    }
+    return make_config([source], storage={"snapshots": True, "raw_data_dir": str(tmp_path)})
+
+
+@responses.activate
+def _capture(config):
+    responses.add(responses.GET, URL, body=LISTING_PAGE, content_type="text/html; charset=utf-8")
+    scraper = CompetitorScraper(config)
+    results = scraper.scrape_all()
+    return results, scraper.get_run_stats()["snapshots"]["run_id"]
+
+
+@responses.activate
+def _capture_sitemap(config):
+    for url, body in SITEMAPS.items():
+        responses.add(responses.GET, url, body=body, content_type="application/xml")
+    for url, body in POSTS.items():
+        responses.add(responses.GET, url, body=body, content_type="text/html; charset=utf-8")
+    scraper = CompetitorScraper(config)
+    results = scraper.scrape_all()
+    return results, scraper.get_run_stats()["snapshots"]["run_id"]
+
+
+class TestSnapshotReplay:
+    """Test SnapshotReplay functionality."""
+
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_replay_matches_live_run(self, listing_config, stream):
+        """Test that replaying a run reproduces the live results without network access."""
+        config = listing_config(stream=stream)
+        live, run_id = _capture(config)
+
+        replayed = SnapshotReplay(config, CompetitorScraper(config).sources).run(run_id)
+
+        assert replayed[0]["articles"] == live[0]["articles"]
+        assert replayed[0]["priority"] == "high"
+
+    def test_replay_sitemap_source(self, sitemap_config):
+        """Test that a sitemap source replays as one result of its pages' articles, sitemaps not parsed as pages."""
+        config = sitemap_config
+        live, run_id = _capture_sitemap(config)
+        replay = SnapshotReplay(config, CompetitorScraper(config).sources)
+
+        replayed = replay.run(run_id)
+
+        assert [(r["source"], r["status"], [a["title"] for a in r["articles"]]) for r in live] == [
+            ("Blog", "success", ["Two", "One"])
+        ]
+        assert len(replayed) == 1
+        assert replayed[0]["articles"] == live[0]["articles"]
+        assert replayed[0]["articles"][1]["link"] == "https://example.com/p/1"
+        assert replay.stats["pages"] == 4
+
+    def test_replay_uses_current_selectors(self, listing_config):
+        """Test that a selector change applies to captured pages."""
+        _, run_id = _capture(listing_config())
+        config = listing_config(title="h3")
+
+        replayed = SnapshotReplay(config, CompetitorScraper(config).sources).run(run_id)
+
+        assert [a["title"] for a in replayed[0]["articles"]] == ["Model card", "Pricing"]
+
+    def test_resolve_index_path_and_latest(self, tmp_path, listing_config):
+        """Test that a run can be named by index file path or as the latest run."""
+        config = listing_config()
+        _, run_id = _capture(config)
+        replay = SnapshotReplay(config, CompetitorScraper(config).sources)
+
+        assert replay.resolve(str(tmp_path / "index" / f"{run_id}.jsonl"))[1].endswith(f"{run_id}.jsonl")
+        assert replay.resolve("latest")[1] == run_id
+        assert replay.resolve(str(tmp_path))[1] == run_id
+        assert replay.run("latest")[0]["status"] == "success"
+
+    def test_unknown_run_raises(self, listing_config):
+        """Test that replaying a run that was never captured fails clearly."""
+        config = listing_config()
+
+        with pytest.raises(FileNotFoundError):
+            SnapshotReplay(config, []).run("20000101_000000")
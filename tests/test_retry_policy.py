@@ -0,0 +1,165 @@
+"""
+Unit tests for the retry policy, retry budget and source deadlines.
+"""
+
+import time
+
+import pytest
+import requests
+import responses
+
+from src.core.retry_policy import DeadlineExceeded, RetryBudget, RetryBudgetExhausted, RetryPolicy
+from src.core.scraper import CompetitorScraper, ContentFetcher, RateLimiter, SessionManager
+
+
+def _http_error(status):
+    response = requests.Response()
+    response.status_code = status
+    return requests.exceptions.HTTPError(response=response)
+
+
+class TestRetryBudget:
+    """Test RetryBudget functionality."""
+
+    def test_budget_scales_with_requests(self):
+        """Test that retries are capped at a fraction of requests."""
+        budget = RetryBudget(ratio=0.1, min_retries=0)
+        for _ in range(20):
+            budget.record_request()
+
+        assert budget.try_spend()
+        assert budget.try_spend()
+        assert not budget.try_spend()
+        assert budget.summary() == {"requests": 20, "retries": 2, "denied": 1}
+
+    def test_minimum_retries_on_small_runs(self):
+        """Test that tiny runs still get a few retries."""
+        budget = RetryBudget(ratio=0.1, min_retries=2)
+        budget.record_request()
+
+        assert budget.try_spend()
+        assert budget.try_spend()
+        assert not budget.try_spend()
+
+
+class TestRetryPolicy:
+    """Test RetryPolicy functionality."""
+
+    def test_from_config(self):
+        """Test that max_retries and retry_backoff_factor come from config."""
+        policy = RetryPolicy.from_config({"max_retries": 5, "retry_backoff_factor": 3, "retry_max_backoff": 10})
+
+        assert policy.max_attempts == 5
+        assert [policy.backoff(n) for n in (1, 2, 3)] == [3, 6, 10]
+
+    def test_is_retryable(self):
+        """Test that only transient failures are retried."""
+        assert RetryPolicy.is_retryable(_http_error(503))
+        assert RetryPolicy.is_retryable(_http_error(429))
+        assert RetryPolicy.is_retryable(requests.exceptions.ConnectionError())
+        assert not RetryPolicy.is_retryable(_http_error(404))
+
+    def test_authorize_retry_respects_deadline(self):
+        """Test that a retry that would overrun the deadline is refused."""
+        policy = RetryPolicy()
+        with pytest.raises(DeadlineExceeded):
+            policy.authorize_retry(wait=5, deadline=time.time() + 1)
+
+    def test_authorize_retry_respects_budget(self):
+        """Test that retries stop once the budget is spent."""
+        policy = RetryPolicy(budget=RetryBudget(ratio=0, min_retries=0))
+        with pytest.raises(RetryBudgetExhausted):
+            policy.authorize_retry(wait=0)
+
+
+class TestFetchRetries:
+    """Test retry behaviour of the fetch layer."""
+
+    @responses.activate
+    def test_fetch_retries_transient_errors(self):
+        """Test that a 500 is retried according to the configured policy."""
+        url = "https://example.com/blog"
+        responses.add(responses.GET, url, status=500)
+        responses.add(responses.GET, url, body="ok")
+
+        fetcher = ContentFetcher(
+            SessionManager(["Test Agent"]),
+            RateLimiter(0, 0),
+            retry_policy=RetryPolicy(max_retries=2, backoff_factor=0),
+        )
+
+        assert fetcher.fetch(url) == "ok"
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_retry_does_not_pin_worker(self):
+        """Test that a single worker serves healthy sources while a retry backs off."""
+        flaky, healthy = "https://flaky.example.com/blog", "https://healthy.example.com/blog"
+        responses.add(responses.GET, flaky, status=500)
+        responses.add(responses.GET, flaky, body="<html></html>")
+        responses.add(responses.GET, healthy, body="<html></html>")
+
+        config = {
+            "scraping": {
+                "min_delay": 0,
+                "max_delay": 0,
+                "max_workers": 1,
+                "retry_backoff_factor": 0.3,
+                "user_agents": ["Test"],
+            },
+            "storage": {"http_cache": False, "snapshots": False},
+            "sources": {"tier1": [{"name": "Flaky", "url": flaky}, {"name": "Healthy", "url": healthy}]},
+        }
+        results = CompetitorScraper(config).scrape_all()
+
+        assert [r["source"] for r in results] == ["Healthy", "Flaky"]
+        assert results[0]["attempts"] == 1
+        assert results[1]["status"] == "success"
+        assert results[1]["attempts"] == 2
+        assert results[1]["backoff_seconds"] >= 0.3
+
+    @responses.activate
+    def test_source_fails_fast_when_budget_exhausted(self):
+        """Test that an exhausted budget produces a clear result status."""
+        url = "https://example.com/blog"
+        responses.add(responses.GET, url, status=503)
+
+        config = {
+            "scraping": {
+                "min_delay": 0,
+                "max_delay": 0,
+                "retry_backoff_factor": 0,
+                "retry_budget_ratio": 0,
+                "retry_budget_min": 0,
+                "user_agents": ["Test"],
+            },
+            "storage": {"http_cache": False, "snapshots": False},
+            "sources": {"tier1": [{"name": "Flaky", "url": url}]},
+        }
+        results = CompetitorScraper(config).scrape_all()
+
+        assert results[0]["status"] == "retry_budget_exhausted"
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_source_fails_fast_past_deadline(self):
+        """Test that a source stops retrying once its deadline would be overrun."""
+        url = "https://example.com/blog"
+        responses.add(responses.GET, url, status=503)
+
+        config = {
+            "scraping": {
+                "min_delay": 0,
+                "max_delay": 0,
+                "retry_backoff_factor": 5,
+                "source_deadline": 1,
+                "user_agents": ["Test"],
+            },
+            "storage": {"http_cache": False, "snapshots": False},
+            "sources": {"tier1": [{"name": "Slow", "url": url}]},
+        }
+        start = time.time()
+        results = CompetitorScraper(config).scrape_all()
+
+        assert results[0]["status"] == "deadline_exceeded"
+        assert time.time() - start < 1
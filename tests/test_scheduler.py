@@ -0,0 +1,247 @@
+"""
+Unit tests for the per-domain scheduler.
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.core.scheduler import DomainScheduler, RunBudget, order_sources
+from src.core.scraper import CompetitorScraper, RateLimiter
+from src.processors.content_processor import ContentProcessor
+from src.reporters.report_generator import MarkdownReportGenerator
+
+
+class _SlowHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        time.sleep(0.4)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.end_headers()
+        self.wfile.write(b"<html><body><article><h2>Post</h2></article></body></html>")
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def slow_servers():
+    servers = [ThreadingHTTPServer(("127.0.0.1", 0), _SlowHandler) for _ in range(4)]
+    for server in servers:
+        threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+    yield [f"http://127.0.0.1:{server.server_address[1]}" for server in servers]
+    for server in servers:
+        server.shutdown()
+
+
+class TestDomainScheduler:
+    """Test DomainScheduler functionality."""
+
+    def test_ready_domain_served_while_other_cools_down(self):
+        """Test that a cooling domain does not block work for a ready one."""
+        limiter = RateLimiter(min_delay=0.5, max_delay=0.5)
+        scheduler = DomainScheduler(limiter)
+        scheduler.submit("a.com", "a1")
+        scheduler.submit("a.com", "a2")
+        scheduler.submit("b.com", "b1")
+
+        domain, item = scheduler.next_item()
+        assert (domain, item) == ("a.com", "a1")
+        limiter.wait(domain)
+        scheduler.task_done(domain)
+
+        start = time.time()
+        assert scheduler.next_item() == ("b.com", "b1")
+        assert time.time() - start < 0.1
+
+    def test_sleeps_only_until_next_domain_ready(self):
+        """Test that min_delay is respected between requests to one domain."""
+        limiter = RateLimiter(min_delay=0.2, max_delay=0.2)
+        scheduler = DomainScheduler(limiter)
+        scheduler.submit("a.com", "a1")
+        scheduler.submit("a.com", "a2")
+
+        domain, _ = scheduler.next_item()
+        limiter.wait(domain)
+        first_request = limiter.last_request_time[domain]
+        scheduler.task_done(domain)
+
+        domain, item = scheduler.next_item()
+        limiter.wait(domain)
+        assert item == "a2"
+        assert limiter.last_request_time[domain] - first_request >= 0.2
+
+    def test_one_item_in_flight_per_domain(self):
+        """Test that a busy domain is not handed to a second worker."""
+        scheduler = DomainScheduler(RateLimiter(min_delay=0, max_delay=0))
+        scheduler.submit("a.com", "a1")
+        scheduler.submit("a.com", "a2")
+
+        scheduler.next_item()
+        second = []
+        waiter = threading.Thread(target=lambda: second.append(scheduler.next_item()))
+        waiter.start()
+        waiter.join(timeout=0.2)
+        assert waiter.is_alive()
+
+        scheduler.task_done("a.com")
+        waiter.join(timeout=1)
+        assert second == [("a.com", "a2")]
+
+    def test_delayed_item_released_after_backoff(self):
+        """Test that retries wait on the delay queue without blocking other work."""
+        scheduler = DomainScheduler(RateLimiter(min_delay=0, max_delay=0))
+        scheduler.submit("a.com", "a1")
+        scheduler.submit("b.com", "b1")
+
+        domain, item = scheduler.next_item()
+        scheduler.submit_later(domain, item, 0.3)
+        scheduler.task_done(domain)
+
+        start = time.time()
+        assert scheduler.next_item() == ("b.com", "b1")
+        assert time.time() - start < 0.1
+        scheduler.task_done("b.com")
+
+        assert scheduler.next_item() == ("a.com", "a1")
+        assert time.time() - start >= 0.3
+
+    def test_returns_none_when_drained(self):
+        """Test that workers are released once all work is done."""
+        scheduler = DomainScheduler(RateLimiter(min_delay=0, max_delay=0))
+        scheduler.submit("a.com", "a1")
+
+        domain, _ = scheduler.next_item()
+        scheduler.task_done(domain)
+
+        assert scheduler.next_item() is None
+
+    def test_higher_priority_domain_served_first(self):
+        """Test that among ready domains the best priority key wins, not submission order."""
+        scheduler = DomainScheduler(RateLimiter(min_delay=0, max_delay=0), priority=lambda item: item[1])
+        scheduler.submit("low.com", ("low", 3))
+        scheduler.submit("high.com", ("high", 0))
+        scheduler.submit("mid.com", ("mid", 1))
+
+        served = []
+        for _ in range(3):
+            domain, item = scheduler.next_item()
+            served.append(item[0])
+            scheduler.task_done(domain)
+
+        assert served == ["high", "mid", "low"]
+
+    def test_cancel_removes_queued_and_delayed_items(self):
+        """Test that cancelled items are returned and no longer keep workers waiting."""
+        scheduler = DomainScheduler(RateLimiter(min_delay=0, max_delay=0))
+        scheduler.submit("a.com", "a1")
+        scheduler.submit("a.com", "a2")
+        scheduler.submit("b.com", "b1")
+
+        domain, item = scheduler.next_item()
+        scheduler.submit_later(domain, item, 60)
+        scheduler.task_done(domain)
+
+        assert sorted(scheduler.cancel(lambda item: item.startswith("a"))) == ["a1", "a2"]
+        domain, item = scheduler.next_item()
+        assert item == "b1"
+        scheduler.task_done(domain)
+        assert scheduler.next_item() is None
+
+
+class TestSourceOrdering:
+    """Test priority and latency ordering of sources."""
+
+    def test_priority_then_deferred_then_latency(self):
+        """Test that priority dominates, last run's deferrals go first and fast sources lead."""
+        sources = [
+            {"name": "slow-medium", "priority": "medium"},
+            {"name": "fast-medium", "priority": "medium"},
+            {"name": "deferred-medium", "priority": "medium"},
+            {"name": "slow-critical", "priority": "critical"},
+        ]
+        latency = {"slow-medium": 5.0, "fast-medium": 0.2, "deferred-medium": 9.0, "slow-critical": 9.0}
+
+        ordered = order_sources(sources, lambda source: latency[source["name"]], deferred=["deferred-medium"])
+
+        assert [s["name"] for s in ordered] == ["slow-critical", "deferred-medium", "fast-medium", "slow-medium"]
+
+
+class TestRunBudget:
+    """Test RunBudget functionality."""
+
+    def test_exempt_priorities_never_deferred(self):
+        """Test that critical sources are exempt and others defer once the budget is spent."""
+        budget = RunBudget(seconds=0.01)
+        budget.start()
+        time.sleep(0.02)
+
+        assert not budget.should_defer({"priority": "critical"})
+        assert budget.should_defer({"priority": "medium"})
+        assert budget.deferred_result({"name": "x", "priority": "medium"})["status"] == "deferred"
+
+    def test_cap_deadline(self):
+        """Test that deadlines of budgeted sources are cut to the run deadline."""
+        budget = RunBudget(seconds=10)
+        budget.start()
+
+        assert budget.cap_deadline({"priority": "low"}, None) == budget.deadline
+        assert budget.cap_deadline({"priority": "low"}, budget.deadline + 60) == budget.deadline
+        assert budget.cap_deadline({"priority": "critical"}, None) is None
+
+    def test_no_budget_by_default(self):
+        """Test that without run_budget nothing is deferred."""
+        budget = RunBudget()
+        budget.start()
+
+        assert budget.deadline is None
+        assert not budget.should_defer({"priority": "low"})
+
+    def test_markdown_report_lists_deferred_sources(self, tmp_path):
+        """Test that deferred sources are counted and named in the markdown report."""
+        budget = RunBudget(seconds=0)
+        results = [
+            {"source": "Done", "status": "success", "articles": []},
+            budget.deferred_result({"name": "Later", "priority": "low"}),
+            budget.deferred_result({"name": "Also later", "priority": "medium"}),
+        ]
+        data = ContentProcessor({}).process_scrape_results(results)
+        MarkdownReportGenerator().generate(data, str(tmp_path / "report.md"))
+        report = (tmp_path / "report.md").read_text()
+
+        assert data["deferred"] == ["Later", "Also later"]
+        assert "| Deferred Sources | 2 |" in report
+        assert "### Deferred Sources\n" in report
+        assert "- Later\n- Also later\n" in report
+
+    @pytest.mark.parametrize("engine", ["threaded", "async"])
+    def test_scrape_all_defers_low_priority_sources(self, slow_servers, tmp_path, engine):
+        """Test that a spent budget defers remaining low-priority sources while critical ones run."""
+        config = {
+            "scraping": {
+                "engine": engine,
+                "min_delay": 0,
+                "max_delay": 0,
+                "max_workers": 1,
+                "max_concurrency": 1,
+                "user_agents": ["Test"],
+                "run_budget": 1.0,
+            },
+            "storage": {"http_cache": False, "snapshots": False, "cache_dir": str(tmp_path)},
+            "sources": {
+                "tier1": [{"name": "critical", "url": f"{slow_servers[0]}/a", "priority": "critical"}],
+                "tier3": [
+                    {"name": f"low{i}", "url": f"{url}/b", "priority": "low"} for i, url in enumerate(slow_servers[1:])
+                ],
+            },
+        }
+        scraper = CompetitorScraper(config)
+        start = time.time()
+        results = {r["source"]: r for r in scraper.scrape_all()}
+
+        assert time.time() - start < 2.5
+        assert results["critical"]["status"] == "success"
+        assert results["low2"]["status"] == "deferred"
+        assert set(scraper._load_deferred()) == {r for r, v in results.items() if v["status"] == "deferred"}
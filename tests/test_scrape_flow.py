@@ -0,0 +1,53 @@
+"""
+Unit tests for the engine-agnostic scrape flow.
+"""
+
+import asyncio
+
+import pytest
+
+from src.core.cache import NotModified
+from src.core.scrape_flow import Fetch, Parse, run, run_async
+
+
+def flow():
+    """A flow that falls back to a second URL when the first is unchanged."""
+    try:
+        content = yield Fetch("https://a.example/", Fetch.FIRST)
+    except NotModified:
+        content = yield Fetch("https://b.example/", Fetch.RETRY)
+    articles = yield Parse({"name": "A"}, content, "https://b.example/")
+    return [article.upper() for article in articles]
+
+
+def perform(step):
+    if isinstance(step, Fetch):
+        if step.url == "https://a.example/":
+            raise NotModified(step.url)
+        return "body"
+    return [step.content, step.source["name"]]
+
+
+class TestDrivers:
+    """Test run and run_async."""
+
+    def test_outcomes_and_errors_reach_the_flow(self):
+        """Test that results are sent back, failures raised at the yield, and the return value returned."""
+        assert run(flow(), perform) == ["BODY", "A"]
+
+    def test_async_driver_matches_blocking_driver(self):
+        """Test that awaiting each step gives the same result."""
+
+        async def perform_async(step):
+            return perform(step)
+
+        assert asyncio.run(run_async(flow(), perform_async)) == run(flow(), perform)
+
+    def test_unhandled_failure_propagates(self):
+        """Test that a failure the flow does not handle is raised by the driver."""
+
+        def failing(step):
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            run(flow(), failing)
@@ -2,9 +2,66 @@
 Unit tests for the scraper module.
 """
 
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import pytest
 from unittest.mock import Mock, patch
-from src.core.scraper import SessionManager, RateLimiter, ContentFetcher
+from src.core.scraper import SessionManager, RateLimiter, ContentFetcher, HTMLParser
+
+LISTING_PAGE = (
+    '<html><body><main>'
+    '<article class="post"><h2>First <!-- draft --><b>post</b></h2><time datetime="2024-01-02">Jan 2</time>'
+    '<p>Intro &amp; more.</p><script>track()</script><p>Second</p><a href="/posts/1">Read</a></article>'
+    '<article class="post"><h2 class="title">  Second post </h2><time>Jan 3</time>'
+    '<div class="summary"><p>Nested <em>text</em></p></div></article>'
+    '<article class="post"><p>No title here</p></article>'
+    '</main></body></html>'
+)
+
+
+class _ListingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = LISTING_PAGE.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def keepalive_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+
+
+@pytest.fixture
+def listing_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ListingHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/blog"
+    server.shutdown()
 
 
 class TestSessionManager:
@@ -44,6 +101,40 @@ class TestSessionManager:
         # Just verify it's one of our agents
         assert new_agent in user_agents
 
+    def test_idle_sessions_evicted_lru(self):
+        """Test that least recently used sessions are closed beyond max_sessions."""
+        manager = SessionManager(["Test Agent"], max_sessions=2)
+
+        manager.get_session("a.com")
+        manager.get_session("b.com")
+        manager.get_session("a.com")
+        manager.get_session("c.com")
+
+        assert list(manager.sessions) == ["a.com", "c.com"]
+
+    def test_adapter_pool_sized_to_workers(self):
+        """Test that the connection pool size follows the configured worker count."""
+        manager = SessionManager(["Test Agent"], pool_size=8)
+        session = manager.get_session("example.com")
+
+        assert session.get_adapter("https://example.com")._pool_maxsize == 8
+
+    def test_connection_reuse_counted(self, keepalive_server):
+        """Test that keep-alive reuse is reflected in the connection stats."""
+        manager = SessionManager(["Test Agent"])
+        session = manager.get_session("127.0.0.1")
+        for _ in range(3):
+            session.get(keepalive_server, timeout=5)
+
+        stats = manager.connection_stats()
+        assert stats["requests"] == 3
+        assert stats["connections"] == 1
+        assert stats["reused"] == 2
+
+        # Counters survive closing the sessions
+        manager.close_all()
+        assert manager.connection_stats()["requests"] == 3
+
 
 class TestRateLimiter:
     """Test RateLimiter functionality."""
@@ -100,6 +191,50 @@ class TestContentFetcher:
         assert result == "<html><body>Test content</body></html>"
         mock_get.assert_called_once()
 
+    def test_stream_fetch_returns_document(self, listing_server):
+        """Test that streaming mode returns a parsed document."""
+        fetcher = ContentFetcher(SessionManager(["Test Agent"]), RateLimiter(min_delay=0, max_delay=0), stream=True)
+
+        root = fetcher.fetch(listing_server)
+
+        assert len(root.xpath("//article")) == 3
+
+    def test_stream_fetch_stops_at_byte_cap(self, listing_server):
+        """Test that streaming mode stops reading past max_response_bytes."""
+        fetcher = ContentFetcher(
+            SessionManager(["Test Agent"]),
+            RateLimiter(min_delay=0, max_delay=0),
+            stream=True,
+            max_response_bytes=200,
+        )
+
+        root = fetcher.fetch(listing_server)
+
+        assert len(root.xpath("//article")) == 1
+
+
+class TestHTMLParser:
+    """Test HTMLParser functionality."""
+
+    SELECTORS = {"article": "article.post", "title": "h2", "date": "time", "content": "p"}
+
+    def test_parse_extracts_articles(self):
+        """Test that articles without a title are skipped and links made absolute."""
+        articles = HTMLParser(self.SELECTORS).parse(LISTING_PAGE, "https://example.com/blog")
+
+        assert [a["title"] for a in articles] == ["Firstpost", "Second post"]
+        assert articles[0]["link"] == "https://example.com/posts/1"
+        assert articles[1]["date"] == "Jan 3"
+
+    def test_streamed_tree_matches_soup(self):
+        """Test that parsing a streamed lxml document matches the BeautifulSoup path."""
+        import lxml.html
+
+        parser = HTMLParser(self.SELECTORS)
+        url = "https://example.com/blog"
+
+        assert parser.parse(lxml.html.fromstring(LISTING_PAGE), url) == parser.parse(LISTING_PAGE, url)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
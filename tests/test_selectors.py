@@ -0,0 +1,72 @@
+"""
+Unit tests for precompiled selector plans.
+"""
+
+import lxml.html
+from bs4 import BeautifulSoup
+
+from src.core.scraper import CompetitorScraper, HTMLParser
+from src.core.selectors import DEFAULT_SELECTORS, ArticleRegion, compile_plan
+
+PAGE = (
+    "<html><body>"
+    '<article class="post"><h2>One</h2><time datetime="2024-01-02">Jan 2</time>'
+    "<p>a</p><p>b</p><p>c</p><p>d</p></article>"
+    '<article class="post"><h2>Two</h2><p>e</p></article>'
+    "</body></html>"
+)
+
+
+class TestSelectorPlan:
+    """Test SelectorPlan functionality."""
+
+    def test_plans_are_shared_per_selector_set(self):
+        """Test that equal selector sets compile to one shared plan."""
+        first = compile_plan({"article": "article.post", "title": "h2"})
+        second = compile_plan({"title": "h2", "article": "article.post"})
+
+        assert first is second
+        assert first is not compile_plan({"article": "article.post", "title": "h3"})
+        assert HTMLParser({"title": "h2", "article": "article.post"}).plan is first
+
+    def test_missing_selectors_use_defaults(self):
+        """Test that fields a source leaves out fall back to the parser defaults."""
+        plan = compile_plan({"title": "h3"})
+
+        assert plan.selectors == {**DEFAULT_SELECTORS, "title": "h3"}
+
+    def test_soup_and_tree_selection_agree(self):
+        """Test that compiled CSS and XPath select the same elements."""
+        plan = compile_plan({"article": "article.post", "content": "p"})
+        soup_articles = plan.select("article", BeautifulSoup(PAGE, "lxml"))
+        tree_articles = plan.select_tree("article", lxml.html.fromstring(PAGE))
+
+        assert len(soup_articles) == len(tree_articles) == 2
+        assert [p.get_text() for p in plan.select("content", soup_articles[0], limit=3)] == ["a", "b", "c"]
+        assert [p.text for p in plan.select_tree("content", tree_articles[0])] == ["a", "b", "c", "d"]
+
+    def test_article_region_matches_start_tags(self):
+        """Test that simple article selectors compile to a start-tag test."""
+        region = ArticleRegion.compile("article.post, div#feed[data-kind=news], [role~=listitem]")
+
+        assert region.matches("article", {"class": "card post"})
+        assert not region.matches("article", {"class": "card"})
+        assert region.matches("div", {"id": "feed", "data-kind": "news"})
+        assert not region.matches("section", {"id": "feed", "data-kind": "news"})
+        assert region.matches("li", {"role": "main listitem"})
+        assert ArticleRegion.compile("main > article") is None
+        assert ArticleRegion.compile("*") is None
+
+    def test_invalid_selectors_fail_only_their_source(self):
+        """Test that a malformed selector is reported at load and fails just that source."""
+        config = {
+            "scraping": {"min_delay": 0, "max_delay": 0, "user_agents": ["Test"]},
+            "storage": {"http_cache": False, "snapshots": False},
+            "sources": {"tier1": [{"name": "Broken", "url": "https://example.com", "selectors": {"title": "h2[["}}]},
+        }
+        scraper = CompetitorScraper(config)
+        scraper.content_fetcher.fetch = lambda *args, **kwargs: PAGE
+
+        result = scraper.scrape_source(scraper.sources[0])
+
+        assert result["status"] == "failed"
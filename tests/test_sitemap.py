@@ -0,0 +1,145 @@
+"""
+Unit tests for sitemap-driven change discovery.
+"""
+
+import gzip
+
+from src.core.sitemap import SitemapWatermarks, iter_sitemap
+
+NS = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+
+
+def urlset(entries):
+    """A sitemap listing (loc, lastmod) pairs."""
+    body = "".join(f"<url><loc>{loc}</loc><lastmod>{lastmod}</lastmod></url>" for loc, lastmod in entries)
+    return f'<?xml version="1.0" encoding="UTF-8"?><urlset {NS}>{body}</urlset>'.encode()
+
+
+def sitemap_index(entries):
+    """A sitemap index listing (loc, lastmod) pairs."""
+    body = "".join(f"<sitemap><loc>{loc}</loc><lastmod>{lastmod}</lastmod></sitemap>" for loc, lastmod in entries)
+    return f'<?xml version="1.0" encoding="UTF-8"?><sitemapindex {NS}>{body}</sitemapindex>'.encode()
+
+
+def post(title):
+    return f"<html><body><article><h1>{title}</h1><p>About {title}</p></article></body></html>".encode()
+
+
+def serve(site, pages):
+    """Add routes to the site, serving sitemap documents as XML."""
+    site.routes.update({path: (body, "application/xml") if "sitemap" in path else body for path, body in pages.items()})
+
+
+def sitemap_source(site, **sitemap):
+    """A source discovering the site's posts through /sitemap.xml, with `sitemap` options."""
+    return {
+        "url": f"{site.url}/blog",
+        "selectors": {"article": "article", "title": "h1", "content": "p"},
+        "sitemap": {"url": f"{site.url}/sitemap.xml", **sitemap},
+    }
+
+
+class TestIterSitemap:
+    """Test sitemap stream parsing."""
+
+    def test_reads_urlsets_indexes_and_gzip(self):
+        """Test that entries are read with or without a namespace, and from gzipped documents."""
+        entries = [("https://a.com/1", "2024-05-01"), ("https://a.com/2", "2024-05-02T10:00:00+02:00")]
+
+        assert list(iter_sitemap(urlset(entries))) == [("url", loc, lastmod) for loc, lastmod in entries]
+        assert list(iter_sitemap(gzip.compress(sitemap_index(entries[:1])))) == [("sitemap", *entries[0])]
+        assert list(iter_sitemap(b"<urlset><url><loc> https://a.com/3 </loc></url></urlset>")) == [
+            ("url", "https://a.com/3", None)
+        ]
+
+    def test_watermarks_compare_lastmod_in_utc(self, tmp_path):
+        """Test that a URL only counts as changed when its lastmod moves later."""
+        marks = SitemapWatermarks(cache_dir=str(tmp_path))
+        marks.advance("https://a.com/1", "2024-05-02T10:00:00+02:00")
+        marks.save()
+        marks = SitemapWatermarks(cache_dir=str(tmp_path))
+
+        assert not marks.is_changed("https://a.com/1", "2024-05-02T08:00:00Z")
+        assert marks.is_changed("https://a.com/1", "2024-05-02T08:00:01Z")
+        assert marks.is_changed("https://a.com/2", None)
+
+
+class TestSitemapDiscovery:
+    """Test sitemap discovery in the scraper."""
+
+    def test_only_new_or_changed_pages_are_fetched(self, tmp_path, site, make_scraper):
+        """Test that a second run fetches just the pages whose lastmod moved or that are new."""
+        entries = [(f"{site.url}/post/{i}", f"2024-05-0{i}") for i in range(1, 4)]
+        serve(site, {"/sitemap.xml": urlset(entries), **{f"/post/{i}": post(f"Post {i}") for i in range(1, 5)}})
+
+        first = make_scraper(sitemap_source(site)).scrape_all()[0]
+        assert sorted(a["title"] for a in first["articles"]) == ["Post 1", "Post 2", "Post 3"]
+        assert "/blog" not in site.requests
+
+        changed = [entries[0], (entries[1][0], "2024-06-01"), entries[2], (f"{site.url}/post/4", "")]
+        serve(site, {"/sitemap.xml": urlset(changed)})
+        site.reset()
+        second = make_scraper(sitemap_source(site)).scrape_all()[0]
+
+        assert [a["title"] for a in second["articles"]] == ["Post 2", "Post 4"]
+        assert second["articles"][0]["link"] == f"{site.url}/post/2"
+        assert second["articles"][0]["date"] == "2024-06-01"
+        assert site.requests == ["/sitemap.xml", "/post/2", "/post/4"]
+
+    def test_first_run_records_older_pages_without_fetching(self, tmp_path, site, make_scraper):
+        """Test that the first run fetches only the newest max_urls pages and remembers the rest."""
+        entries = [(f"{site.url}/post/{i}", f"2024-05-0{i}") for i in range(1, 6)]
+        serve(site, {"/sitemap.xml": urlset(entries), **{f"/post/{i}": post(f"Post {i}") for i in range(1, 6)}})
+
+        first = make_scraper(sitemap_source(site, max_urls=2)).scrape_all()[0]
+        site.reset()
+        second = make_scraper(sitemap_source(site, max_urls=2)).scrape_all()[0]
+
+        assert [a["title"] for a in first["articles"]] == ["Post 5", "Post 4"]
+        assert second["articles"] == []
+        assert site.requests == ["/sitemap.xml"]
+
+    def test_unchanged_child_sitemaps_are_skipped(self, tmp_path, site, make_scraper):
+        """Test that an index only leads to children whose lastmod moved, filtered by include."""
+        children = [(f"{site.url}/sitemap-blog.xml", "2024-05-01"), (f"{site.url}/sitemap-docs.xml", "2024-05-01")]
+        serve(site, {
+            "/sitemap.xml": sitemap_index(children),
+            "/sitemap-blog.xml": urlset([(f"{site.url}/blog/1", "2024-05-01")]),
+            "/sitemap-docs.xml": urlset([(f"{site.url}/docs/1", "2024-05-01")]),
+            "/blog/1": post("Blog 1"),
+            "/blog/2": post("Blog 2"),
+        })
+        first = make_scraper(sitemap_source(site, include="/blog/")).scrape_all()[0]
+        assert [a["title"] for a in first["articles"]] == ["Blog 1"]
+
+        serve(site, {
+            "/sitemap.xml": sitemap_index([(children[0][0], "2024-05-02"), children[1]]),
+            "/sitemap-blog.xml": urlset([(f"{site.url}/blog/1", "2024-05-01"), (f"{site.url}/blog/2", "2024-05-02")]),
+        })
+        site.reset()
+        second = make_scraper(sitemap_source(site, include="/blog/")).scrape_all()[0]
+
+        assert [a["title"] for a in second["articles"]] == ["Blog 2"]
+        assert site.requests == ["/sitemap.xml", "/sitemap-blog.xml", "/blog/2"]
+
+    def test_failed_pages_are_retried_next_run(self, tmp_path, site, make_scraper):
+        """Test that a page that fails to fetch keeps its sitemap pending for the next run."""
+        entries = [(f"{site.url}/post/1", "2024-05-01"), (f"{site.url}/post/2", "2024-05-02")]
+        serve(site, {"/sitemap.xml": urlset(entries), "/post/1": post("Post 1")})
+
+        first = make_scraper(sitemap_source(site)).scrape_all()[0]
+        serve(site, {"/post/2": post("Post 2")})
+        second = make_scraper(sitemap_source(site)).scrape_all()[0]
+
+        assert [a["title"] for a in first["articles"]] == ["Post 1"]
+        assert [a["title"] for a in second["articles"]] == ["Post 2"]
+
+    def test_async_engine_matches_threaded(self, tmp_path, site, make_scraper):
+        """Test that both engines discover the same articles from a sitemap."""
+        serve(site, {"/sitemap.xml": urlset([(f"{site.url}/post/1", "2024-05-01")]), "/post/1": post("Post 1")})
+
+        source = sitemap_source(site)
+        threaded = make_scraper(source, storage={"cache_dir": str(tmp_path / "threaded")}).scrape_all()[0]
+        async_result = make_scraper(source, "async", storage={"cache_dir": str(tmp_path / "async")}).scrape_all()[0]
+
+        assert async_result["articles"] == threaded["articles"]
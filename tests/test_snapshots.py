@@ -0,0 +1,99 @@
+"""
+Unit tests for the raw snapshot store.
+"""
+
+import responses
+
+from src.core.scraper import CompetitorScraper
+from src.core.snapshots import SnapshotStore
+
+LISTING_PAGE = "<html><body><article><h2>Launch</h2><p>New model released</p></article></body></html>"
+
+
+class TestSnapshotStore:
+    """Test SnapshotStore functionality."""
+
+    def test_identical_bodies_stored_once(self, tmp_path):
+        """Test that the same body across runs costs one blob."""
+        store = SnapshotStore(str(tmp_path))
+        store.start_run("run1")
+        first = store.save("https://example.com/blog", b"<html>same</html>")
+        store.index("Example", "https://example.com/blog")
+
+        store.start_run("run2")
+        second = store.save("https://example.com/blog", b"<html>same</html>")
+        store.index("Example", "https://example.com/blog")
+
+        assert first == second
+        assert store.summary()["deduplicated"] == 1
+        assert len(list(store.blobs_dir.glob("*/*.gz"))) == 1
+        assert store.read(first) == b"<html>same</html>"
+
+    def test_index_maps_source_url_and_time_to_blob(self, tmp_path):
+        """Test that each run's index records source, url, fetch time and digest."""
+        store = SnapshotStore(str(tmp_path))
+        store.start_run("run1")
+        digest = store.save("https://example.com/blog", b"<html>a</html>", "text/html")
+        store.index("Example", "https://example.com/blog")
+
+        entries = store.load_index("run1")
+        assert len(entries) == 1
+        assert entries[0]["source"] == "Example"
+        assert entries[0]["url"] == "https://example.com/blog"
+        assert entries[0]["sha256"] == digest
+        assert entries[0]["fetched_at"]
+        assert store.load_index(str(store.index_dir / "run1.jsonl")) == entries
+
+    def test_chunked_writer_matches_whole_body(self, tmp_path):
+        """Test that a body written in chunks gets the same digest as a complete one."""
+        store = SnapshotStore(str(tmp_path))
+        body = b"<html>" + b"x" * 100000 + b"</html>"
+
+        writer = store.writer("https://example.com/a")
+        for i in range(0, len(body), 4096):
+            writer.write(body[i:i + 4096])
+
+        assert writer.commit() == store.save("https://example.com/b", body)
+
+    def test_not_modified_reuses_latest_blob(self, tmp_path):
+        """Test that a 304 indexes the body stored by an earlier run."""
+        store = SnapshotStore(str(tmp_path))
+        store.start_run("run1")
+        digest = store.save("https://example.com/blog", b"<html>a</html>")
+        store.index("Example", "https://example.com/blog")
+        store.save_latest()
+
+        store = SnapshotStore(str(tmp_path))
+        store.start_run("run2")
+        entry = store.index_not_modified("Example", "https://example.com/blog")
+
+        assert entry["sha256"] == digest
+        assert entry["not_modified"]
+
+    def test_run_ids_do_not_collide(self, tmp_path):
+        """Test that two runs started in the same second get separate indexes."""
+        store = SnapshotStore(str(tmp_path))
+        store.start_run("20240101_000000")
+        store.save("https://example.com/blog", b"a")
+        store.index("Example", "https://example.com/blog")
+
+        assert store.start_run("20240101_000000") == "20240101_000000_2"
+
+    @responses.activate
+    def test_scraper_snapshots_fetched_pages(self, tmp_path):
+        """Test that a scrape run writes and indexes the listing body."""
+        url = "https://example.com/blog"
+        responses.add(responses.GET, url, body=LISTING_PAGE)
+
+        config = {
+            "scraping": {"min_delay": 0, "max_delay": 0, "user_agents": ["Test"]},
+            "storage": {"http_cache": False, "raw_data_dir": str(tmp_path)},
+            "sources": {"tier1": [{"name": "Example", "url": url, "selectors": {"title": "h2"}}]},
+        }
+        scraper = CompetitorScraper(config)
+        scraper.scrape_all()
+
+        run_id = scraper.get_run_stats()["snapshots"]["run_id"]
+        entries = scraper.snapshots.load_index(run_id)
+        assert [entry["source"] for entry in entries] == ["Example"]
+        assert scraper.snapshots.read(entries[0]["sha256"]) == LISTING_PAGE.encode()
@@ -0,0 +1,64 @@
+"""
+Unit tests for the streaming module.
+"""
+
+from src.core.streaming import IncrementalHTMLParser, charset_from_content_type
+
+
+class TestCharsetFromContentType:
+    """Test Content-Type charset extraction."""
+
+    def test_charset_parameter(self):
+        """Test that the charset parameter is returned."""
+        assert charset_from_content_type('text/html; charset="ISO-8859-1"') == "ISO-8859-1"
+
+    def test_missing_charset(self):
+        """Test that a Content-Type without charset yields None."""
+        assert charset_from_content_type("text/html") is None
+        assert charset_from_content_type(None) is None
+
+
+class TestIncrementalHTMLParser:
+    """Test IncrementalHTMLParser functionality."""
+
+    def test_parses_chunks(self):
+        """Test that a document split across chunks parses into one tree."""
+        body = b"<html><body><article><h2>Hello</h2></article></body></html>"
+        parser = IncrementalHTMLParser("http://example.com")
+        for i in range(0, len(body), 5):
+            assert parser.feed(body[i:i + 5])
+
+        root = parser.close()
+        assert root.xpath("//h2")[0].text == "Hello"
+        assert parser.size == len(body)
+        assert not parser.truncated
+
+    def test_stops_at_byte_cap(self):
+        """Test that bytes past the cap are dropped and feeding stops."""
+        parser = IncrementalHTMLParser("http://example.com", max_bytes=25)
+
+        assert parser.feed(b"<html><body><p>one</p>")
+        assert not parser.feed(b"<p>two</p></body></html>")
+
+        root = parser.close()
+        assert parser.size == 25
+        assert parser.truncated
+        assert root.xpath("//p")[0].text == "one"
+
+    def test_header_charset_used(self):
+        """Test that the header charset decodes documents without a meta declaration."""
+        parser = IncrementalHTMLParser("http://example.com", charset="iso-8859-1")
+        parser.feed("<p>caf\xe9</p>".encode("iso-8859-1"))
+
+        assert parser.close().xpath("//p")[0].text == "caf\xe9"
+
+    def test_unknown_charset_ignored(self):
+        """Test that an unknown header charset falls back to sniffing."""
+        parser = IncrementalHTMLParser("http://example.com", charset="not-a-charset")
+        parser.feed(b"<p>ok</p>")
+
+        assert parser.close().xpath("//p")[0].text == "ok"
+
+    def test_empty_body(self):
+        """Test that an empty body yields no document."""
+        assert IncrementalHTMLParser("http://example.com").close() is None
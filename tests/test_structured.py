@@ -0,0 +1,143 @@
+"""
+Unit tests for structured-data (embedded JSON) extraction.
+"""
+
+import json
+
+import lxml.html
+import pytest
+
+from src.core.scraper import HTMLParser
+from src.core.structured import StructuredExtractor, iter_scripts, resolve
+
+URL = "https://example.com/news"
+SELECTORS = {"article": "article", "title": "h2", "content": "p"}
+
+JSON_LD = {
+    "@context": "https://schema.org",
+    "@graph": [
+        {"@type": "WebSite", "name": "Example"},
+        {
+            "@type": "ItemList",
+            "itemListElement": [
+                {"@type": "ListItem", "item": {
+                    "@type": "BlogPosting", "headline": "Launch", "datePublished": "2024-05-01",
+                    "description": "We launched.", "url": "/news/launch",
+                }},
+                {"@type": "ListItem", "item": {
+                    "@type": ["NewsArticle"], "name": "Update", "mainEntityOfPage": {"@id": "https://example.com/u"},
+                }},
+            ],
+        },
+    ],
+}
+
+NEXT_DATA = {
+    "props": {"pageProps": {"posts": [
+        {"title": "First", "publishedOn": "2024-04-01", "summary": ["Part one.", "Part two."], "slug": "first"},
+        {"title": "", "slug": "untitled"},
+        {"title": "Second", "publishedOn": "2024-04-02", "summary": "More.", "slug": "second"},
+    ]}},
+}
+NEXT_MAPPING = {
+    "type": "next_data",
+    "items": "props.pageProps.posts",
+    "fields": {"title": "title", "date": "publishedOn", "content": "summary", "link": "slug"},
+    "link_base": "https://example.com/news/",
+}
+
+
+def page(head="", body='<article><h2>From selectors</h2><p>DOM text</p></article>'):
+    return f"<html><head>{head}</head><body>{body}</body></html>"
+
+
+def script(payload, attrs='type="application/ld+json"', prefix=""):
+    return f"<script {attrs}>{prefix}{json.dumps(payload)}</script>"
+
+
+class TestStructuredExtractor:
+    """Test StructuredExtractor functionality."""
+
+    def test_json_ld_articles_through_graph_and_item_lists(self):
+        """Test that article-typed JSON-LD nodes are found and mapped with the default fields."""
+        html = page(script({"@type": "Organization", "name": "Example"}) + script(JSON_LD))
+
+        articles = StructuredExtractor({"type": "json_ld"}).extract(html, URL)
+
+        assert [(a["title"], a["date"], a["content"], a["link"]) for a in articles] == [
+            ("Launch", "2024-05-01", "We launched.", "https://example.com/news/launch"),
+            ("Update", None, "", "https://example.com/u"),
+        ]
+
+    def test_next_data_mapping(self):
+        """Test that __NEXT_DATA__ items are mapped field by field and untitled items skipped."""
+        html = page(script(NEXT_DATA, 'id="__NEXT_DATA__" type="application/json"'))
+
+        articles = StructuredExtractor(NEXT_MAPPING).extract(html.encode(), URL)
+
+        assert [(a["title"], a["content"], a["link"]) for a in articles] == [
+            ("First", "Part one. Part two.", "https://example.com/news/first"),
+            ("Second", "More.", "https://example.com/news/second"),
+        ]
+
+    def test_state_assigned_in_inline_script(self):
+        """Test that a marker locates JSON assigned in script code, ignoring what follows it."""
+        payload = {"feed": {"entries": [{"name": "Entry", "href": "/e/1"}]}}
+        html = page(script(payload, attrs="", prefix="window.__STATE__ = ").replace("</script>", ";init();</script>"))
+        config = {
+            "type": "script",
+            "marker": "window.__STATE__ =",
+            "items": "feed.entries",
+            "fields": {"title": "name", "link": "href"},
+        }
+
+        assert [a["link"] for a in StructuredExtractor(config).extract(html, URL)] == ["https://example.com/e/1"]
+
+    def test_invalid_mappings_are_rejected(self):
+        """Test that an unknown type or a missing items path is a configuration error."""
+        with pytest.raises(ValueError):
+            StructuredExtractor({"type": "microdata"})
+        with pytest.raises(ValueError):
+            StructuredExtractor({"type": "next_data"})
+
+    def test_helpers(self):
+        """Test script scanning and path resolution."""
+        scripts = list(iter_scripts(b"<p><SCRIPT id='a' async>x()</script ><script>y</script>"))
+
+        assert [(s["attrs"], s["body"]) for s in scripts] == [({"id": "a"}, b"x()"), ({}, b"y")]
+        assert list(resolve({"a": [{"b": 1}, {"b": 2}]}, "a.*.b")) == [1, 2]
+        assert list(resolve({"a": [{"b": 1}, {"b": 2}]}, "a.-1.b")) == [2]
+        assert list(resolve({"a": 1}, "a.b")) == []
+
+
+class TestStructuredParsing:
+    """Test the structured fast path in HTMLParser."""
+
+    @pytest.mark.parametrize("engine", ["soup", "lxml"])
+    def test_structured_data_takes_precedence(self, engine):
+        """Test that embedded JSON is used when present, for text, bytes and streamed documents."""
+        html = page(script(NEXT_DATA, 'id="__NEXT_DATA__"'))
+        parser = HTMLParser.for_source({"selectors": SELECTORS, "parser": engine, "structured": NEXT_MAPPING})
+
+        expected = parser.parse(html, URL)
+
+        assert [a["title"] for a in expected] == ["First", "Second"]
+        assert parser.parse(html.encode(), URL) == expected
+        assert parser.parse(lxml.html.fromstring(html), URL) == expected
+
+    def test_falls_back_to_selectors(self):
+        """Test that a page without the expected JSON is parsed with the source's selectors."""
+        parser = HTMLParser(SELECTORS, structured=NEXT_MAPPING)
+        broken = page('<script id="__NEXT_DATA__">{"props": </script>')
+
+        assert [a["title"] for a in parser.parse(page(), URL)] == ["From selectors"]
+        assert [a["title"] for a in parser.parse(broken, URL)] == ["From selectors"]
+
+    def test_embedded_bodies_are_capped_at_max_content_length(self):
+        """Test that structured-data bodies are cut to max_content_length like feed entries."""
+        html = page(script(NEXT_DATA, 'id="__NEXT_DATA__"'))
+        source = {"selectors": SELECTORS, "structured": NEXT_MAPPING}
+
+        articles = HTMLParser.for_source(source, max_content_length=8).parse(html, URL)
+
+        assert [a["content"] for a in articles] == ["Part one", "More."]
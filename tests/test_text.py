@@ -0,0 +1,51 @@
+"""
+Unit tests for streaming HTML-to-text conversion.
+"""
+
+from src.core import text
+from src.core.text import html_to_text
+
+
+class TestHtmlToText:
+    """Test html_to_text functionality."""
+
+    def test_entities_blocks_and_whitespace(self):
+        """Test that entities are decoded, block tags separate words and whitespace collapses."""
+        markup = "<p>Caf&eacute; &amp; bar</p><p>Second\n\t  line&#8217;s</p>Tail<br>end <b>bo</b>ld"
+
+        assert html_to_text(markup) == "Café & bar Second line’s Tail end bold"
+
+    def test_non_content_elements_are_dropped(self):
+        """Test that script, style and embedded media text never reaches the output."""
+        markup = (
+            "<style>p { color: red }</style><p>Kept</p><script>var x = '<p>no</p>';</script>"
+            "<noscript><img src=x>Enable JS</noscript><svg><text>chart</text></svg><p>also kept</p>"
+        )
+
+        assert html_to_text(markup) == "Kept also kept"
+
+    def test_plain_text_and_empty_input(self):
+        """Test that markup-free text is only normalised, and empty input gives an empty string."""
+        assert html_to_text("  just   text \n here ") == "just text here"
+        assert html_to_text("a < b and c > d") == "a < b and c > d"
+        assert html_to_text(None) == ""
+        assert html_to_text("<p> </p>") == ""
+
+    def test_words_split_across_chunks(self, monkeypatch):
+        """Test that a word cut by a chunk boundary is joined back together."""
+        monkeypatch.setattr(text, "CHUNK_SIZE", 5)
+
+        assert html_to_text("<p>wonderful words</p><p>x&amp;y</p>") == "wonderful words x&y"
+
+    def test_output_is_capped_without_reading_the_rest(self, monkeypatch):
+        """Test that conversion stops at max_length without tokenizing the rest of the body."""
+        events = []
+        data = text._TextCollector.data
+        monkeypatch.setattr(text._TextCollector, "data", lambda self, chunk: events.append(chunk) or data(self, chunk))
+        markup = "<p>word word</p>" * 50_000
+
+        result = html_to_text(markup, max_length=100)
+
+        assert 95 < len(result) <= 100
+        assert result.startswith("word word word")
+        assert len(events) < 1000